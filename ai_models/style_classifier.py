@@ -54,6 +54,9 @@ class StyleClassifier(nn.Module):
         
         # Initialize weights
         self._initialize_weights()
+        
+        # Inference only: fixed BatchNorm/Dropout so batched and single predictions agree
+        self.eval()
     
     def forward(self, x):
         x = self.features(x)
@@ -91,6 +94,15 @@ class StyleClassifier(nn.Module):
         
         return style_scores
     
+    async def classify_style_batch(self, features_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Classify a batch of feature sets in one forward pass, one row of probabilities each"""
+        batch = torch.cat([self._extract_feature_vector(features) for features in features_list])
+        
+        with torch.no_grad():
+            probabilities = torch.softmax(self.forward(batch), dim=1)
+        
+        return probabilities.numpy()
+    
     def _extract_feature_vector(self, features: Dict[str, Any]) -> torch.Tensor:
         """Extract feature vector from architectural features"""
         # Convert features to numerical values
@@ -8,6 +8,7 @@ import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import asyncio
+import aiofiles
 from utils.cost_calculator import CostCalculator
 from utils.excel_generator import ExcelGenerator
 
@@ -552,18 +553,16 @@ class CostService:
         cost_dir = os.path.join(self.cost_storage, project_id)
         os.makedirs(cost_dir, exist_ok=True)
         
-        # Generate Excel content
-        excel_content = await self.excel_generator.generate_cost_excel(
-            cost_breakdown, project_id, region, currency
-        )
-        
-        # Save Excel file
+        # Stream the Excel content straight to disk
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"cost_estimate_{timestamp}.xlsx"
         file_path = os.path.join(cost_dir, filename)
         
-        with open(file_path, "wb") as f:
-            f.write(excel_content)
+        async with aiofiles.open(file_path, "wb") as f:
+            async for chunk in self.excel_generator.generate_cost_excel_stream(
+                cost_breakdown, project_id, region, currency
+            ):
+                await f.write(chunk)
         
         # Return file URL
         return f"/cost_estimates/{project_id}/{filename}"
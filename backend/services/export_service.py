@@ -3,7 +3,6 @@ Export Service - Handles export to various architecture software formats
 """
 
 import os
-import json
 import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -2,52 +2,295 @@
 Location Service - Handles architectural style detection and 3D surroundings
 """
 
-import requests
+import aiofiles
+import httpx
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
+import functools
+import h3
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import json
+import logging
+import math
+import multiprocessing
 import os
+import tempfile
+import urllib.parse
+import numpy as np
 from dotenv import load_dotenv
-from utils.geocoding import get_coordinates
+from utils.geocoding import geocoding_service, get_coordinates
 
 # Load environment variables
 load_dotenv()
-from utils.architectural_style_detector import ArchitecturalStyleDetector
-from utils.surroundings_3d import Surroundings3DGenerator
+from utils.architectural_style_detector import (
+    analyze_architectural_style_in_worker, init_style_worker
+)
+from utils.surroundings_3d import GEOMETRY_POOL_WORKERS, Surroundings3DGenerator
+
+logger = logging.getLogger(__name__)
+
+# Location lookups are cached on ~50 m tiles for a day
+TILE_RESOLUTION = 2000
+GEO_CACHE_SIZE = 1024
+GEO_CACHE_TTL = 86400
+
+# Neighborhood-level context is shared by every address in an H3 cell
+CONTEXT_H3_RESOLUTION = 8
+CONTEXT_CACHE_SIZE = 4096
+
+# "street" samples both sides of the nearest road; "compass" keeps the
+# legacy fixed N/E/S/W headings
+STREET_VIEW_SAMPLING = os.getenv("STREET_VIEW_SAMPLING", "street")
+COMPASS_HEADINGS = (0, 90, 180, 270)  # North, East, South, West
+
+MAPBOX_BATCH_SIZE = 50
+
+STREET_VIEW_URL = "https://maps.googleapis.com/maps/api/streetview"
+
+# Street View images are streamed to a per-service directory under here rather
+# than held in memory; the directory is removed when the service closes
+STREET_VIEW_DIR = os.getenv(
+    "STREET_VIEW_DIR", os.path.join(tempfile.gettempdir(), "archiai_street_view")
+)
+STREET_VIEW_CHUNK_SIZE = 32768
+
+# Outbound Google Maps throughput, tuned to the account's quota
+GOOGLE_MAPS_MAX_CONCURRENCY = int(os.getenv("GOOGLE_MAPS_MAX_CONCURRENCY", "8"))
+GOOGLE_MAPS_MAX_QPS = float(os.getenv("GOOGLE_MAPS_MAX_QPS", "50"))
+GOOGLE_MAPS_MAX_RETRIES = 3
+
+# Worker processes for style analysis; each holds a classifier
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", "2"))
+
+SIMULATED_BUILDING_COUNT = 10
+
+DIRECTIONS = ("North", "Northeast", "East", "Southeast",
+              "South", "Southwest", "West", "Northwest")
+
+VIEW_ANGLES = (
+    {"angle": 0, "direction": "North", "description": "Street view"},
+    {"angle": 45, "direction": "Northeast", "description": "Corner view"},
+    {"angle": 90, "direction": "East", "description": "Side view"},
+    {"angle": 135, "direction": "Southeast", "description": "Diagonal view"},
+    {"angle": 180, "direction": "South", "description": "Rear view"},
+    {"angle": 225, "direction": "Southwest", "description": "Corner view"},
+    {"angle": 270, "direction": "West", "description": "Side view"},
+    {"angle": 315, "direction": "Northwest", "description": "Diagonal view"}
+)
+
+
+def _tile_key(lat: float, lon: float) -> Tuple[float, float]:
+    """Quantize coordinates to the cache tile they fall in"""
+    return (round(lat * TILE_RESOLUTION) / TILE_RESOLUTION,
+            round(lon * TILE_RESOLUTION) / TILE_RESOLUTION)
+
+
+class UncachedResult(Exception):
+    """Raised by a cached helper to hand back a degraded result without caching it"""
+    
+    def __init__(self, value: Any):
+        super().__init__()
+        self.value = value
+
+
+def _cache_wrapper(method, cache_name: str, make_key, is_valid=None):
+    """Wrap a location helper with a cache that serves only successful, still-valid results"""
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await self._cached_call(
+                    getattr(self, cache_name), make_key(method, *args, **kwargs),
+                    lambda: method(self, *args, **kwargs), is_valid
+                )
+            except UncachedResult as e:
+                return e.value
+        return async_wrapper
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, cache_name)
+        key = make_key(method, *args, **kwargs)
+        if key in cache and (is_valid is None or is_valid(cache[key])):
+            return cache[key]
+        try:
+            result = method(self, *args, **kwargs)
+        except UncachedResult as e:
+            return e.value
+        cache[key] = result
+        return result
+    return wrapper
+
+
+def _context_key(method, lat: float, lon: float, *args, postal_code: str = None, **kwargs):
+    # Historical districts follow postal geography better than H3 cells
+    if postal_code:
+        return (method.__name__, "postal", postal_code)
+    return (method.__name__, "h3", h3.latlng_to_cell(lat, lon, CONTEXT_H3_RESOLUTION))
+
+
+def _tile_cache_key(method, lat: float, lon: float, *args, **kwargs):
+    return (*_tile_key(lat, lon), method.__name__, *args, *sorted(kwargs.items()))
+
+
+def _street_view_files_exist(images: List[Dict[str, Any]]) -> bool:
+    """Whether every downloaded image in a cached result is still on disk"""
+    return all(os.path.exists(image["image_path"]) for image in images if "image_path" in image)
+
+
+def context_cached(method):
+    """Cache a neighborhood context helper per postal code or H3 cell"""
+    return _cache_wrapper(method, "_context_cache", _context_key)
+
+
+def tile_cached(method):
+    """Cache a location helper's result per (lat, lon) tile"""
+    return _cache_wrapper(method, "_geo_cache", _tile_cache_key)
+
+
+def street_view_cached(method):
+    """Cache Street View results per tile, refetching when downloaded files have gone"""
+    return _cache_wrapper(method, "_geo_cache", _tile_cache_key, is_valid=_street_view_files_exist)
+
+
+def _buildings_to_dicts(
+    lats: np.ndarray, lons: np.ndarray, heights: np.ndarray,
+    types: np.ndarray, styles: np.ndarray, roof_types: np.ndarray
+) -> List[Dict[str, Any]]:
+    """Materialize column arrays of building data into API records"""
+    return [
+        {
+            "id": f"building_{i}",
+            "coordinates": {"lat": b_lat, "lon": b_lon},
+            "height": height,
+            "type": b_type,
+            "style": style,
+            "materials": ["concrete", "glass", "steel"],
+            "roof_type": roof_type
+        }
+        for i, (b_lat, b_lon, height, b_type, style, roof_type) in enumerate(zip(
+            lats.tolist(), lons.tolist(), heights.tolist(),
+            types.tolist(), styles.tolist(), roof_types.tolist()
+        ))
+    ]
+
+
+def street_view_urls(lat: float, lon: float, headings: Sequence[int], api_key: str) -> List[str]:
+    """Build one Street View URL per heading for a single location"""
+    # Query string encoded the same way as the equivalent params dict
+    key = urllib.parse.quote_plus(api_key)
+    return [
+        f"{STREET_VIEW_URL}?location={lat}%2C{lon}&size=640x640&heading={heading}&pitch=0&key={key}"
+        for heading in headings
+    ]
+
+
+def direction_indices(headings: np.ndarray) -> np.ndarray:
+    """Map an array of headings to indices into DIRECTIONS"""
+    return ((np.asarray(headings) + 22.5) // 45).astype(np.int64) & 7
+
+
+# Integration recommendations per primary style; shared, so kept immutable
+STYLE_RECOMMENDATIONS = {
+    "Traditional": {
+        "suggested_elements": ("Pitched roofs", "Traditional windows", "Classical proportions"),
+        "material_recommendations": ("Brick", "Stone", "Wood", "Traditional masonry"),
+        "color_palette": ("Earth tones", "Natural materials", "Traditional colors"),
+        "proportion_guidelines": ()
+    },
+    "Modern": {
+        "suggested_elements": ("Clean lines", "Large windows", "Open spaces"),
+        "material_recommendations": ("Concrete", "Glass", "Steel", "Modern composites"),
+        "color_palette": ("Neutral colors", "White", "Gray", "Accent colors"),
+        "proportion_guidelines": ()
+    },
+    "Contemporary": {
+        "suggested_elements": ("Innovative forms", "Sustainable materials", "Technology integration"),
+        "material_recommendations": ("Recycled materials", "Smart materials", "Sustainable options"),
+        "color_palette": ("Bold colors", "Natural materials", "High contrast"),
+        "proportion_guidelines": ()
+    }
+}
+
+DEFAULT_STYLE_RECOMMENDATIONS = {
+    "suggested_elements": (),
+    "material_recommendations": (),
+    "color_palette": (),
+    "proportion_guidelines": ()
+}
+
 
 class LocationService:
     def __init__(self):
         self.google_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
         self.mapbox_api_key = os.getenv("MAPBOX_API_KEY")
-        self.style_detector = ArchitecturalStyleDetector()
         self.surroundings_3d = Surroundings3DGenerator()
         
+        # HTTP/2 client so Google Maps calls multiplex over one TLS connection
+        # (pool limits belong on the transport; the client ignores them once one is given)
+        self._http = httpx.AsyncClient(
+            timeout=5.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                retries=3
+            )
+        )
+        # Style classification and large 3D scenes are CPU-bound, keep them off the event loop.
+        # Each style worker loads its own classifier, and torch is not fork-safe, so workers are
+        # few and spawned fresh
+        self._cpu_pool = ProcessPoolExecutor(
+            max_workers=CPU_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_style_worker
+        )
+        # Building geometry gets its own classifier-free pool so it never queues behind inference
+        self._geometry_pool = ProcessPoolExecutor(
+            max_workers=GEOMETRY_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._geo_cache = TTLCache(maxsize=GEO_CACHE_SIZE, ttl=GEO_CACHE_TTL)
+        self._context_cache = TTLCache(maxsize=CONTEXT_CACHE_SIZE, ttl=GEO_CACHE_TTL)
+        self._gm_sem = asyncio.Semaphore(GOOGLE_MAPS_MAX_CONCURRENCY)
+        self._gm_limiter = AsyncLimiter(GOOGLE_MAPS_MAX_QPS, time_period=1.0)
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        os.makedirs(STREET_VIEW_DIR, exist_ok=True)
+        self._street_view_dir = tempfile.TemporaryDirectory(prefix="sv_", dir=STREET_VIEW_DIR)
+        
     async def detect_architectural_style(
-        self, address: str, postal_code: str = None
+        self, address: str, postal_code: str = None,
+        coordinates: Optional[Tuple[float, float]] = None
     ) -> Dict[str, Any]:
         """Detect architectural style of the location"""
         try:
-            # Get coordinates
-            coordinates = await get_coordinates(address)
+            # Get coordinates unless the caller already geocoded the address
+            if coordinates is None:
+                coordinates = await get_coordinates(address)
             if not coordinates:
                 raise ValueError("Could not geocode address")
             
             lat, lon = coordinates
             
-            # Get street view images for analysis
-            street_view_images = await self._get_street_view_images(lat, lon)
-            
-            # Get nearby buildings data
-            nearby_buildings = await self._get_nearby_buildings(lat, lon)
+            # Street view images and nearby buildings are independent lookups,
+            # so fetch them concurrently
+            street_view_images, nearby_buildings = await asyncio.gather(
+                self._get_street_view_images(lat, lon, fetch_bytes=True),
+                self._get_nearby_buildings(lat, lon)
+            )
+            historical_context = self._get_historical_context(
+                lat, lon, address, postal_code=postal_code
+            )
             
-            # Analyze architectural style
-            style_analysis = await self.style_detector.analyze_architectural_style(
+            # Analyze architectural style in a worker process
+            loop = asyncio.get_running_loop()
+            style_analysis = await loop.run_in_executor(
+                self._cpu_pool, analyze_architectural_style_in_worker,
                 street_view_images, nearby_buildings, coordinates
             )
             
-            # Get historical context
-            historical_context = await self._get_historical_context(address, postal_code)
-            
             return {
                 "primary_style": style_analysis["primary_style"],
                 "secondary_styles": style_analysis["secondary_styles"],
@@ -61,26 +304,27 @@ class LocationService:
             raise Exception(f"Error detecting architectural style: {str(e)}")
     
     async def get_3d_surroundings(
-        self, address: str, postal_code: str = None
+        self, address: str, postal_code: str = None,
+        coordinates: Optional[Tuple[float, float]] = None
     ) -> Dict[str, Any]:
         """Get 3D visualization of surrounding area"""
         try:
-            # Get coordinates
-            coordinates = await get_coordinates(address)
+            # Get coordinates unless the caller already geocoded the address
+            if coordinates is None:
+                coordinates = await get_coordinates(address)
             if not coordinates:
                 raise ValueError("Could not geocode address")
             
             lat, lon = coordinates
             
-            # Get building data for 3D visualization
-            building_data = await self._get_building_data(lat, lon)
-            
-            # Get terrain data
-            terrain_data = await self._get_terrain_data(lat, lon)
+            # Get building data, terrain data and context for 3D visualization
+            building_data = self._get_building_data(lat, lon)
+            terrain_data = self._get_terrain_data(lat, lon)
+            context_analysis = self._analyze_surrounding_context(lat, lon)
             
             # Generate 3D surroundings
             surroundings_3d = await self.surroundings_3d.generate_3d_surroundings(
-                coordinates, building_data, terrain_data
+                coordinates, building_data, terrain_data, pool=self._geometry_pool
             )
             
             return {
@@ -89,22 +333,131 @@ class LocationService:
                 "terrain": terrain_data,
                 "3d_model": surroundings_3d,
                 "view_angles": self._calculate_view_angles(lat, lon),
-                "context_analysis": await self._analyze_surrounding_context(lat, lon)
+                "context_analysis": context_analysis
             }
             
         except Exception as e:
             raise Exception(f"Error getting 3D surroundings: {str(e)}")
     
-    async def _get_street_view_images(self, lat: float, lon: float) -> List[Dict[str, Any]]:
-        """Get street view images from multiple angles"""
+    async def analyze_many(self, addresses: List[str], postal_codes: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Run style detection and 3D surroundings for many addresses"""
+        postal_codes = postal_codes or {}
+        coordinates = await self.batch_geocode(addresses)
+        
+        async def analyze(address: str) -> Dict[str, Any]:
+            coords = coordinates.get(address)
+            postal_code = postal_codes.get(address)
+            architectural_style, surroundings_3d = await asyncio.gather(
+                self.detect_architectural_style(address, postal_code, coords),
+                self.get_3d_surroundings(address, postal_code, coords)
+            )
+            return {"architectural_style": architectural_style, "surroundings_3d": surroundings_3d}
+        
+        unique = list(dict.fromkeys(addresses))
+        results = await asyncio.gather(*(analyze(address) for address in unique))
+        return dict(zip(unique, results))
+    
+    async def batch_geocode(self, addresses: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Geocode many addresses, using the Mapbox batch endpoint when configured"""
+        coordinates: Dict[str, Tuple[float, float]] = {}
+        pending = []
+        unique = list(dict.fromkeys(addresses))
+        cached = await asyncio.gather(*(geocoding_service.cached_coordinates(address) for address in unique))
+        for address, coords in zip(unique, cached):
+            if coords:
+                coordinates[address] = coords
+            else:
+                pending.append(address)
+        
+        if pending and self.mapbox_api_key:
+            chunks = [
+                pending[i:i + MAPBOX_BATCH_SIZE]
+                for i in range(0, len(pending), MAPBOX_BATCH_SIZE)
+            ]
+            for chunk_result in await asyncio.gather(
+                *(self._mapbox_batch_geocode(chunk) for chunk in chunks)
+            ):
+                coordinates.update(chunk_result)
+            pending = [address for address in pending if address not in coordinates]
+        
+        # Anything the batch provider could not resolve goes through the
+        # regular single-address geocoder
+        results = await asyncio.gather(*(get_coordinates(address) for address in pending))
+        for address, coords in zip(pending, results):
+            if coords:
+                coordinates[address] = coords
+        
+        return coordinates
+    
+    async def _mapbox_batch_geocode(self, addresses: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Geocode one chunk of addresses with a single Mapbox batch request"""
+        url = "https://api.mapbox.com/search/geocode/v6/batch"
+        try:
+            response = await self._http.post(
+                url,
+                params={"access_token": self.mapbox_api_key},
+                json=[{"q": address, "limit": 1} for address in addresses],
+                timeout=10
+            )
+            response.raise_for_status()
+            batch = response.json().get("batch", [])
+        except Exception:
+            logger.exception("Mapbox batch geocode failed for %d addresses", len(addresses))
+            return {}
+        
+        coordinates = {}
+        for address, result in zip(addresses, batch):
+            features = result.get("features", [])
+            if features:
+                lon, lat = features[0]["geometry"]["coordinates"][:2]
+                coordinates[address] = (lat, lon)
+        await asyncio.gather(*(geocoding_service.remember_coordinates(address, coords) for address, coords in coordinates.items()))
+        return coordinates
+    
+    async def _cached_call(self, cache: TTLCache, key: Any, factory, is_valid=None) -> Any:
+        """Return a cached result, sharing one in-flight call between concurrent callers"""
+        if key in cache and (is_valid is None or is_valid(cache[key])):
+            return cache[key]
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+        
+        future = asyncio.ensure_future(factory())
+        self._inflight[key] = future
+        try:
+            result = await asyncio.shield(future)
+            cache[key] = result
+            return result
+        finally:
+            self._inflight.pop(key, None)
+    
+    @street_view_cached
+    async def _get_street_view_images(
+        self, lat: float, lon: float, fetch_bytes: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get street view images from multiple angles, downloading them only if fetch_bytes is set"""
         if not self.google_api_key:
             return []
         
-        images = []
-        headings = [0, 90, 180, 270]  # North, East, South, West
+        headings = COMPASS_HEADINGS
+        degraded = False
+        if STREET_VIEW_SAMPLING == "street":
+            try:
+                bearing = await self._get_street_bearing(lat, lon)
+            except Exception as e:
+                logger.exception("Nearest road lookup failed lat=%f lon=%f", lat, lon)
+                bearing, degraded = None, True
+            if bearing is not None:
+                # Two opposing views perpendicular to the street cover both facades
+                headings = [round(bearing + 90) % 360, round(bearing - 90) % 360]
         
-        for heading in headings:
-            url = "https://maps.googleapis.com/maps/api/streetview"
+        if not fetch_bytes:
+            urls = street_view_urls(lat, lon, headings, self.google_api_key)
+            records = self._street_view_records(headings, urls)
+            if degraded:
+                raise UncachedResult(records)
+            return records
+        
+        async def fetch(heading: int) -> Optional[Dict[str, Any]]:
             params = {
                 "location": f"{lat},{lon}",
                 "size": "640x640",
@@ -114,19 +467,125 @@ class LocationService:
             }
             
             try:
-                response = requests.get(url, params=params)
-                if response.status_code == 200:
-                    images.append({
-                        "heading": heading,
-                        "direction": self._get_direction_name(heading),
-                        "image_url": response.url,
-                        "image_data": response.content
-                    })
+                response = await self._google_get(STREET_VIEW_URL, params, stream=True)
+                try:
+                    if response.status_code == 200:
+                        return {
+                            "heading": heading,
+                            "direction": self._get_direction_name(heading),
+                            "image_url": str(response.url),
+                            "image_path": await self._save_street_view_image(
+                                response, lat, lon, heading
+                            )
+                        }
+                finally:
+                    await response.aclose()
             except Exception as e:
-                print(f"Error getting street view for heading {heading}: {str(e)}")
+                logger.exception("Street view fetch failed heading=%d", heading)
+            return None
+        
+        # Fetch all headings concurrently over the shared connection pool
+        results = await asyncio.gather(*(fetch(heading) for heading in headings))
+        images = [image for image in results if image]
         
+        # Hand back what was fetched, but retry next time instead of caching a partial set
+        if degraded or len(images) < len(results):
+            raise UncachedResult(images)
         return images
     
+    async def aclose(self) -> None:
+        """Release the HTTP client, worker pools and downloaded Street View images"""
+        await self._http.aclose()
+        self._cpu_pool.shutdown(wait=False)
+        self._geometry_pool.shutdown(wait=False)
+        self._street_view_dir.cleanup()
+    
+    def _street_view_records(self, headings: Sequence[int], urls: List[str]) -> List[Dict[str, Any]]:
+        """Pair Street View URLs with their heading metadata"""
+        return [
+            {
+                "heading": heading,
+                "direction": self._get_direction_name(heading),
+                "image_url": url
+            }
+            for heading, url in zip(headings, urls)
+        ]
+    
+    async def _google_get(
+        self, url: str, params: Dict[str, Any], stream: bool = False
+    ) -> httpx.Response:
+        """GET a Google Maps endpoint within the concurrency and QPS limits"""
+        for attempt in range(GOOGLE_MAPS_MAX_RETRIES + 1):
+            async with self._gm_sem, self._gm_limiter:
+                request = self._http.build_request("GET", url, params=params)
+                response = await self._http.send(request, stream=stream)
+            if response.status_code != 429 or attempt == GOOGLE_MAPS_MAX_RETRIES:
+                return response
+            # Over quota: back off with jitter outside the semaphore
+            await response.aclose()
+            await asyncio.sleep(2 ** attempt + random.random())
+        
+        return response
+    
+    async def _save_street_view_image(
+        self, response: httpx.Response, lat: float, lon: float, heading: int
+    ) -> str:
+        """Stream a Street View response body to disk and return its path"""
+        directory = self._street_view_dir.name
+        tile_lat, tile_lon = _tile_key(lat, lon)
+        path = os.path.join(directory, f"sv_{tile_lat}_{tile_lon}_{heading}.jpg")
+        
+        # Write to a temporary file first so readers never see a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        os.close(fd)
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in response.aiter_bytes(STREET_VIEW_CHUNK_SIZE):
+                    await f.write(chunk)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return path
+    
+    async def _get_street_bearing(self, lat: float, lon: float) -> Optional[float]:
+        """Get the bearing of the nearest road in degrees, or None if there is none; raises if the lookup fails"""
+        url = "https://roads.googleapis.com/v1/nearestRoads"
+        offset = 0.0002  # ~20 m probe on either side of the location
+        points = [
+            (lat, lon), (lat + offset, lon), (lat - offset, lon),
+            (lat, lon + offset), (lat, lon - offset)
+        ]
+        params = {
+            "points": "|".join(f"{p_lat},{p_lon}" for p_lat, p_lon in points),
+            "key": self.google_api_key
+        }
+        
+        response = await self._google_get(url, params)
+        response.raise_for_status()
+        snapped = response.json().get("snappedPoints", [])
+        
+        # Use two distinct snapped points on the same road segment
+        by_place: Dict[str, List[Tuple[float, float]]] = {}
+        for point in snapped:
+            location = point["location"]
+            coords = (location["latitude"], location["longitude"])
+            road = by_place.setdefault(point.get("placeId", ""), [])
+            if coords not in road:
+                road.append(coords)
+        
+        for road in by_place.values():
+            if len(road) >= 2:
+                (lat1, lon1), (lat2, lon2) = road[0], road[-1]
+                phi1, phi2 = math.radians(lat1), math.radians(lat2)
+                d_lon = math.radians(lon2 - lon1)
+                x = math.sin(d_lon) * math.cos(phi2)
+                y = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(d_lon)
+                return math.degrees(math.atan2(x, y)) % 360
+        
+        return None
+    
+    @tile_cached
     async def _get_nearby_buildings(self, lat: float, lon: float) -> List[Dict[str, Any]]:
         """Get nearby buildings data"""
         if not self.google_api_key:
@@ -141,7 +600,7 @@ class LocationService:
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = await self._google_get(url, params)
             response.raise_for_status()
             
             data = response.json()
@@ -160,10 +619,13 @@ class LocationService:
             return buildings
             
         except Exception as e:
-            print(f"Error getting nearby buildings: {str(e)}")
-            return []
+            logger.exception("Nearby buildings lookup failed lat=%f lon=%f", lat, lon)
+            raise UncachedResult([])
     
-    async def _get_historical_context(self, address: str, postal_code: str = None) -> Dict[str, Any]:
+    @context_cached
+    def _get_historical_context(
+        self, lat: float, lon: float, address: str, postal_code: str = None
+    ) -> Dict[str, Any]:
         """Get historical context for the location"""
         # This would typically involve querying historical databases
         # For now, we'll return a simulated response
@@ -175,30 +637,29 @@ class LocationService:
             "cultural_significance": "Residential/commercial area"
         }
     
-    async def _get_building_data(self, lat: float, lon: float) -> List[Dict[str, Any]]:
+    @tile_cached
+    def _get_building_data(self, lat: float, lon: float) -> List[Dict[str, Any]]:
         """Get building data for 3D visualization"""
         # This would typically involve querying building databases or APIs
         # For now, we'll return simulated building data
-        buildings = []
+        # Simulate nearby buildings as column arrays
+        index = np.arange(SIMULATED_BUILDING_COUNT)
+        offsets = (index - SIMULATED_BUILDING_COUNT // 2) * 0.001
+        even = index % 2 == 0
         
-        # Simulate nearby buildings
-        for i in range(10):
-            buildings.append({
-                "id": f"building_{i}",
-                "coordinates": {
-                    "lat": lat + (i - 5) * 0.001,
-                    "lon": lon + (i - 5) * 0.001
-                },
-                "height": 10 + (i * 3),
-                "type": "residential" if i % 2 == 0 else "commercial",
-                "style": "modern" if i % 3 == 0 else "traditional",
-                "materials": ["concrete", "glass", "steel"],
-                "roof_type": "flat" if i % 2 == 0 else "pitched"
-            })
+        buildings = _buildings_to_dicts(
+            lats=lat + offsets,
+            lons=lon + offsets,
+            heights=10 + index * 3,
+            types=np.where(even, "residential", "commercial"),
+            styles=np.where(index % 3 == 0, "modern", "traditional"),
+            roof_types=np.where(even, "flat", "pitched")
+        )
         
         return buildings
     
-    async def _get_terrain_data(self, lat: float, lon: float) -> Dict[str, Any]:
+    @tile_cached
+    def _get_terrain_data(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get terrain data for 3D visualization"""
         # This would typically involve querying elevation APIs
         # For now, we'll return simulated terrain data
@@ -211,20 +672,14 @@ class LocationService:
             "water_features": []
         }
     
-    def _calculate_view_angles(self, lat: float, lon: float) -> List[Dict[str, Any]]:
+    def _calculate_view_angles(self, lat: float, lon: float) -> Tuple[Dict[str, Any], ...]:
         """Calculate optimal view angles for 3D visualization"""
-        return [
-            {"angle": 0, "direction": "North", "description": "Street view"},
-            {"angle": 45, "direction": "Northeast", "description": "Corner view"},
-            {"angle": 90, "direction": "East", "description": "Side view"},
-            {"angle": 135, "direction": "Southeast", "description": "Diagonal view"},
-            {"angle": 180, "direction": "South", "description": "Rear view"},
-            {"angle": 225, "direction": "Southwest", "description": "Corner view"},
-            {"angle": 270, "direction": "West", "description": "Side view"},
-            {"angle": 315, "direction": "Northwest", "description": "Diagonal view"}
-        ]
+        return VIEW_ANGLES
     
-    async def _analyze_surrounding_context(self, lat: float, lon: float) -> Dict[str, Any]:
+    @context_cached
+    def _analyze_surrounding_context(
+        self, lat: float, lon: float, postal_code: str = None
+    ) -> Dict[str, Any]:
         """Analyze surrounding context for design considerations"""
         return {
             "urban_density": "medium",
@@ -239,53 +694,14 @@ class LocationService:
     
     def _get_direction_name(self, heading: float) -> str:
         """Convert heading to direction name"""
-        directions = ["North", "Northeast", "East", "Southeast", 
-                     "South", "Southwest", "West", "Northwest"]
-        index = int((heading + 22.5) / 45) % 8
-        return directions[index]
+        return DIRECTIONS[int((heading + 22.5) // 45) & 7]
     
     def _generate_integration_recommendations(self, style_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate recommendations for integrating with local architectural style"""
         primary_style = style_analysis.get("primary_style", "Modern")
         confidence = style_analysis.get("confidence", 0.5)
         
-        recommendations = {
+        return {
             "style_integration": "high" if confidence > 0.7 else "medium",
-            "suggested_elements": [],
-            "material_recommendations": [],
-            "color_palette": [],
-            "proportion_guidelines": []
+            **STYLE_RECOMMENDATIONS.get(primary_style, DEFAULT_STYLE_RECOMMENDATIONS)
         }
-        
-        if primary_style == "Traditional":
-            recommendations["suggested_elements"] = [
-                "Pitched roofs", "Traditional windows", "Classical proportions"
-            ]
-            recommendations["material_recommendations"] = [
-                "Brick", "Stone", "Wood", "Traditional masonry"
-            ]
-            recommendations["color_palette"] = [
-                "Earth tones", "Natural materials", "Traditional colors"
-            ]
-        elif primary_style == "Modern":
-            recommendations["suggested_elements"] = [
-                "Clean lines", "Large windows", "Open spaces"
-            ]
-            recommendations["material_recommendations"] = [
-                "Concrete", "Glass", "Steel", "Modern composites"
-            ]
-            recommendations["color_palette"] = [
-                "Neutral colors", "White", "Gray", "Accent colors"
-            ]
-        elif primary_style == "Contemporary":
-            recommendations["suggested_elements"] = [
-                "Innovative forms", "Sustainable materials", "Technology integration"
-            ]
-            recommendations["material_recommendations"] = [
-                "Recycled materials", "Smart materials", "Sustainable options"
-            ]
-            recommendations["color_palette"] = [
-                "Bold colors", "Natural materials", "High contrast"
-            ]
-        
-        return recommendations
@@ -2,89 +2,370 @@
 MEP Service - Handles Mechanical, Electrical, and Plumbing design
 """
 
+import asyncio
+import hashlib
+import re
+import threading
 import numpy as np
+import orjson
+from cachetools import LRUCache
+from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple
-import math
+from types import MappingProxyType
+
+from utils.occupancy import detect_occupancy
+
+# Design codes, shared read-only by every service instance
+ELECTRICAL_CODES = MappingProxyType({
+    "load_calculations": MappingProxyType({
+        "residential": 3.0,  # VA/ft²
+        "office": 5.0,       # VA/ft²
+        "retail": 8.0,       # VA/ft²
+        "hospital": 10.0,    # VA/ft²
+        "school": 6.0        # VA/ft²
+    }),
+    "circuit_ratings": MappingProxyType({
+        "lighting": 15,      # A
+        "receptacles": 20,   # A
+        "appliances": 30,    # A
+        "hvac": 40           # A
+    }),
+    "voltage_levels": MappingProxyType({
+        "lighting": 120,     # V
+        "receptacles": 120,  # V
+        "appliances": 240,   # V
+        "hvac": 240          # V
+    })
+})
+
+PLUMBING_CODES = MappingProxyType({
+    "fixture_units": MappingProxyType({
+        "toilet": 3,
+        "lavatory": 1,
+        "shower": 2,
+        "bathtub": 2,
+        "kitchen_sink": 2,
+        "dishwasher": 1,
+        "washing_machine": 2
+    }),
+    "pipe_sizes": MappingProxyType({
+        "main": 4,           # inches
+        "branch": 2,         # inches
+        "fixture": 0.5       # inches
+    }),
+    "water_pressure": MappingProxyType({
+        "minimum": 20,       # psi
+        "maximum": 80,       # psi
+        "recommended": 40    # psi
+    })
+})
+
+HVAC_CODES = MappingProxyType({
+    "cooling_loads": MappingProxyType({
+        "residential": 1.0,  # ton/1000 ft²
+        "office": 1.5,       # ton/1000 ft²
+        "retail": 2.0,       # ton/1000 ft²
+        "hospital": 2.5,     # ton/1000 ft²
+        "school": 1.8        # ton/1000 ft²
+    }),
+    "heating_loads": MappingProxyType({
+        "residential": 0.8,  # ton/1000 ft²
+        "office": 1.2,       # ton/1000 ft²
+        "retail": 1.5,       # ton/1000 ft²
+        "hospital": 2.0,     # ton/1000 ft²
+        "school": 1.3        # ton/1000 ft²
+    }),
+    "ventilation_rates": MappingProxyType({
+        "residential": 0.35, # cfm/ft²
+        "office": 0.5,       # cfm/ft²
+        "retail": 0.3,       # cfm/ft²
+        "hospital": 0.6,     # cfm/ft²
+        "school": 0.4       # cfm/ft²
+    })
+})
+
+# Plumbing room categories, in classification priority order
+ROOM_CATEGORIES = ("bathroom", "kitchen", "laundry")
+ROOM_CATEGORY_PATTERN = re.compile("|".join(ROOM_CATEGORIES))
+
+# (fixture count, fixture units) contributed by each room category
+FIXTURE_TABLE = MappingProxyType({
+    "bathroom": (3, 6),  # Toilet, lavatory, shower (3 + 1 + 2)
+    "kitchen": (2, 3)    # Sink, dishwasher (2 + 1)
+})
+
+# Fixtures installed in each room of a plumbing category
+PLUMBING_FIXTURES = MappingProxyType({
+    "bathroom": (
+        {"type": "toilet", "model": "standard", "water_sense": True},
+        {"type": "lavatory", "model": "wall_mount", "water_sense": True},
+        {"type": "shower", "model": "standard", "water_sense": True}
+    ),
+    "kitchen": (
+        {"type": "sink", "model": "double_bowl", "water_sense": True},
+        {"type": "dishwasher", "model": "energy_star", "water_sense": True}
+    ),
+    "laundry": (
+        {"type": "washing_machine", "model": "high_efficiency", "water_sense": True},
+        {"type": "dryer", "model": "energy_star", "gas": True}
+    )
+})
+
+def _classify_room(name: str) -> str:
+    """Map a room name to its plumbing category, or an empty string"""
+    found = set(ROOM_CATEGORY_PATTERN.findall(name.lower()))
+    return next((category for category in ROOM_CATEGORIES if category in found), "")
+
+def _hvac_load_factor(temperature: float) -> float:
+    """HVAC electrical load factor for the outdoor temperature"""
+    if temperature > 25:
+        return 2.0  # Cooling required
+    if temperature < 10:
+        return 1.5  # Heating required
+    return 1.0  # Minimal HVAC
+
+def _climate_adjusted_loads(
+    cooling_load: float, heating_load: float, temperature: float, humidity: float
+) -> Tuple[float, float]:
+    """Apply hot, cold and humid climate adjustments to the HVAC loads"""
+    # +20% cooling when hot, compounded with +10% when humid; +20% heating when cold
+    cooling_factor = (1.0 + 0.2 * (temperature > 25)) * (1.0 + 0.1 * (humidity > 70))
+    heating_factor = 1.0 + 0.2 * (temperature < 10)
+    return cooling_load * cooling_factor, heating_load * heating_factor
+
+# Size selection tables: (ascending thresholds, values); a value above a threshold
+# takes the next entry, matching the original "x > threshold" rules
+WATER_MAIN_SIZES = (np.array([50.0]), (2, 4))                 # inches, by water demand
+WATER_BRANCH_SIZES = (np.array([25.0]), (1, 2))               # inches, by water demand
+MAIN_DRAIN_SIZES = (np.array([20.0]), (3, 4))                 # inches, by fixture units
+BRANCH_DRAIN_SIZES = (np.array([10.0]), (1.5, 2))             # inches, by fixture units
+WATER_HEATER_SIZES = (np.array([50.0]), (50, 80))             # gallons, by water demand
+HEATING_SYSTEMS = (np.array([5.0]), (("heat_pump", "electric"), ("boiler", "natural_gas")))  # by tons
+COOLING_SYSTEMS = (np.array([5.0]), ("split_system", "chiller"))  # by tons
+
+def _lookup(table: Tuple[np.ndarray, tuple], value: float) -> Any:
+    """Pick the table entry for value"""
+    thresholds, values = table
+    return values[int(np.searchsorted(thresholds, value))]
+
+DRAWINGS_CACHE_SIZE = 128
+FINGERPRINT_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _fingerprint(*parts: Any) -> bytes:
+    """Stable digest of JSON-serializable design sections"""
+    return hashlib.blake2b(orjson.dumps(parts, option=FINGERPRINT_OPTIONS), digest_size=16).digest()
+
+LED_FIXTURE_WATTS = 32  # Standard LED fixture
+LED_FIXTURE_SPACING = 4  # Simplified positioning
+
+def _iceil(n: float, d: float) -> int:
+    """Ceiling division without the float divide and math.ceil round trip"""
+    return int(-(-n // d))
+
+@dataclass(slots=True)
+class RoomArrays:
+    """Column view of the design's rooms, shared by every MEP subsystem"""
+    rooms: Dict[str, Any]
+    names: List[str]
+    areas: np.ndarray
+    is_bathroom: np.ndarray
+    is_kitchen: np.ndarray
+    is_laundry: np.ndarray
+    
+    @classmethod
+    def from_design(cls, design_2d: Dict[str, Any]) -> "RoomArrays":
+        rooms = design_2d.get("rooms", {})
+        names = list(rooms)
+        areas = np.fromiter(
+            (room.get("area", 0) for room in rooms.values()), dtype=np.float64, count=len(rooms)
+        )
+        labels = np.array([_classify_room(name) for name in names], dtype=object)
+        return cls(
+            rooms, names, areas,
+            labels == "bathroom", labels == "kitchen", labels == "laundry"
+        )
+
+@dataclass(slots=True)
+class DesignContext:
+    """Per-design values derived once and shared by every MEP subsystem"""
+    rooms: RoomArrays
+    total_area: float
+    occupancy: str
+    climate_data: Dict[str, Any]
+    temperature: float
+    humidity: float
+    avg_solar: float
+    
+    @classmethod
+    def from_design(cls, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> "DesignContext":
+        rooms = RoomArrays.from_design(design_2d)
+        current_weather = climate_data.get("current_weather") or {}
+        solar = np.asarray(
+            [month["solar_irradiance"] for month in climate_data.get("solar_irradiance") or []],
+            dtype=np.float64
+        )
+        return cls(
+            rooms, float(rooms.areas.sum()), detect_occupancy(design_2d), climate_data,
+            current_weather.get("temperature", 20), current_weather.get("humidity", 50),
+            float(solar.mean()) if solar.size else 1000.0
+        )
+
+@dataclass(slots=True)
+class Circuit:
+    """Branch circuit serving a room"""
+    type: str
+    load: float
+    rating: int   # A
+    voltage: int  # V
+
+@dataclass(slots=True)
+class LightingFixture:
+    """Ceiling-mounted lighting fixture"""
+    type: str
+    watts: int
+    position: List[float]
+    height: float  # ft
+
+@dataclass(slots=True)
+class SubPanel:
+    """Electrical sub-panel"""
+    type: str
+    size: int     # A
+    voltage: int  # V
+    circuits: int
+
+@dataclass(slots=True)
+class Feeder:
+    """Electrical feeder"""
+    type: str
+    size: int     # AWG
+    voltage: int  # V
+    current: int  # A
+
+# Fixed system selections that do not depend on the design. These objects are shared
+# between responses and must not be mutated.
+SUB_PANELS = (
+    SubPanel("lighting", 20, 120, 12),
+    SubPanel("receptacles", 30, 120, 16),
+    SubPanel("hvac", 40, 240, 8)
+)
+
+BRANCH_FEEDER = Feeder("branch", 12, 120, 20)
+
+EMERGENCY_LIGHTING = {
+    "exit_lighting": {
+        "type": "LED_exit_sign",
+        "watts": 5,
+        "battery_backup": "90_minutes"
+    },
+    "emergency_fixtures": {
+        "type": "LED_emergency",
+        "watts": 10,
+        "battery_backup": "90_minutes"
+    }
+}
+
+EXTERIOR_LIGHTING = {
+    "security_lighting": {
+        "type": "LED_security",
+        "watts": 50,
+        "motion_sensor": True
+    },
+    "landscape_lighting": {
+        "type": "LED_landscape",
+        "watts": 20,
+        "solar_powered": True
+    }
+}
+
+POWER_SYSTEMS = {
+    "main_service": {
+        "size": 200,  # A
+        "voltage": 240,
+        "phases": 3
+    },
+    "generator": {
+        "size": 50,  # kW
+        "fuel": "natural_gas",
+        "automatic_transfer": True
+    },
+    "ups": {
+        "size": 10,  # kVA
+        "battery_backup": "30_minutes"
+    }
+}
+
+EMERGENCY_SYSTEMS = {
+    "fire_alarm": {
+        "type": "addressable",
+        "zones": 4,
+        "battery_backup": "24_hours"
+    },
+    "emergency_power": {
+        "type": "generator",
+        "size": 25,  # kW
+        "fuel": "natural_gas"
+    },
+    "exit_lighting": {
+        "type": "LED",
+        "battery_backup": "90_minutes"
+    }
+}
+
+HVAC_CONTROLS = {
+    "type": "smart_thermostat",
+    "zones": 4,
+    "programming": "7_day",
+    "remote_access": True,
+    "energy_monitoring": True
+}
+
+FIRE_SUPPRESSION = {
+    "type": "sprinkler",
+    "coverage": "total",
+    "activation": "automatic",
+    "monitoring": "central_station"
+}
+
+# Specification templates; per-design fields are merged in by the spec helpers
+ELECTRICAL_SPECIFICATIONS = {
+    "codes": ("NEC", "IBC"),
+    "standards": ("IEEE", "UL"),
+    "materials": ("copper", "aluminum", "steel")
+}
+
+PLUMBING_SPECIFICATIONS = {
+    "codes": ("IPC", "IBC"),
+    "standards": ("ASTM", "ANSI"),
+    "materials": ("copper", "PVC", "cast_iron")
+}
+
+HVAC_SPECIFICATIONS = {
+    "codes": ("IMC", "IBC"),
+    "standards": ("ASHRAE", "ARI"),
+    "materials": ("steel", "aluminum", "copper")
+}
+
+FIRE_PROTECTION_SPECIFICATIONS = {
+    "codes": ("NFPA", "IBC"),
+    "standards": ("UL", "FM"),
+    "materials": ("steel", "copper", "PVC")
+}
+
+MEP_SPECIFICATIONS = {
+    "electrical": ELECTRICAL_SPECIFICATIONS,
+    "plumbing": PLUMBING_SPECIFICATIONS,
+    "hvac": HVAC_SPECIFICATIONS,
+    "fire_protection": FIRE_PROTECTION_SPECIFICATIONS
+}
 
 class MEPService:
-    def __init__(self):
-        self.electrical_codes = self._load_electrical_codes()
-        self.plumbing_codes = self._load_plumbing_codes()
-        self.hvac_codes = self._load_hvac_codes()
-        
-    def _load_electrical_codes(self) -> Dict[str, Any]:
-        """Load electrical design codes"""
-        return {
-            "load_calculations": {
-                "residential": 3.0,  # VA/ft²
-                "office": 5.0,       # VA/ft²
-                "retail": 8.0,       # VA/ft²
-                "hospital": 10.0,    # VA/ft²
-                "school": 6.0        # VA/ft²
-            },
-            "circuit_ratings": {
-                "lighting": 15,      # A
-                "receptacles": 20,   # A
-                "appliances": 30,    # A
-                "hvac": 40           # A
-            },
-            "voltage_levels": {
-                "lighting": 120,     # V
-                "receptacles": 120,  # V
-                "appliances": 240,   # V
-                "hvac": 240          # V
-            }
-        }
+    # Design codes are module constants; the only per-instance state is the drawings cache
+    __slots__ = ("_drawings_cache", "_drawings_lock")
     
-    def _load_plumbing_codes(self) -> Dict[str, Any]:
-        """Load plumbing design codes"""
-        return {
-            "fixture_units": {
-                "toilet": 3,
-                "lavatory": 1,
-                "shower": 2,
-                "bathtub": 2,
-                "kitchen_sink": 2,
-                "dishwasher": 1,
-                "washing_machine": 2
-            },
-            "pipe_sizes": {
-                "main": 4,           # inches
-                "branch": 2,         # inches
-                "fixture": 0.5       # inches
-            },
-            "water_pressure": {
-                "minimum": 20,       # psi
-                "maximum": 80,       # psi
-                "recommended": 40    # psi
-            }
-        }
-    
-    def _load_hvac_codes(self) -> Dict[str, Any]:
-        """Load HVAC design codes"""
-        return {
-            "cooling_loads": {
-                "residential": 1.0,  # ton/1000 ft²
-                "office": 1.5,       # ton/1000 ft²
-                "retail": 2.0,       # ton/1000 ft²
-                "hospital": 2.5,     # ton/1000 ft²
-                "school": 1.8        # ton/1000 ft²
-            },
-            "heating_loads": {
-                "residential": 0.8,  # ton/1000 ft²
-                "office": 1.2,       # ton/1000 ft²
-                "retail": 1.5,       # ton/1000 ft²
-                "hospital": 2.0,     # ton/1000 ft²
-                "school": 1.3        # ton/1000 ft²
-            },
-            "ventilation_rates": {
-                "residential": 0.35, # cfm/ft²
-                "office": 0.5,       # cfm/ft²
-                "retail": 0.3,       # cfm/ft²
-                "hospital": 0.6,     # cfm/ft²
-                "school": 0.4       # cfm/ft²
-            }
-        }
+    def __init__(self):
+        self._drawings_cache = LRUCache(maxsize=DRAWINGS_CACHE_SIZE)
+        self._drawings_lock = threading.Lock()
     
     async def generate_mep_design(
         self, 
@@ -93,22 +374,23 @@ class MEPService:
     ) -> Dict[str, Any]:
         """Generate MEP design based on 2D design and climate data"""
         
-        # Generate electrical design
-        electrical_design = await self._generate_electrical_design(design_2d, climate_data)
-        
-        # Generate plumbing design
-        plumbing_design = await self._generate_plumbing_design(design_2d, climate_data)
-        
-        # Generate HVAC design
-        hvac_design = await self._generate_hvac_design(design_2d, climate_data)
+        loop = asyncio.get_running_loop()
+        ctx = DesignContext.from_design(design_2d, climate_data)
         
-        # Generate fire protection design
-        fire_protection = await self._generate_fire_protection_design(design_2d, climate_data)
+        # The four subsystems share no state, so design them concurrently
+        electrical_design, plumbing_design, hvac_design, fire_protection = await asyncio.gather(
+            loop.run_in_executor(None, self._generate_electrical_design, ctx),
+            loop.run_in_executor(None, self._generate_plumbing_design, ctx),
+            loop.run_in_executor(None, self._generate_hvac_design, ctx),
+            loop.run_in_executor(None, self._generate_fire_protection_design, ctx)
+        )
         
-        # Generate MEP drawings
-        mep_drawings = await self._generate_mep_drawings(
+        # Generate MEP drawings; the specifications are a fixed template
+        mep_drawings = await loop.run_in_executor(
+            None, self._generate_mep_drawings,
             electrical_design, plumbing_design, hvac_design, fire_protection
         )
+        mep_specifications = self._generate_mep_specifications(design_2d, climate_data)
         
         return {
             "electrical": electrical_design,
@@ -116,30 +398,26 @@ class MEPService:
             "hvac": hvac_design,
             "fire_protection": fire_protection,
             "drawings": mep_drawings,
-            "specifications": await self._generate_mep_specifications(design_2d, climate_data)
+            "specifications": mep_specifications
         }
     
-    async def _generate_electrical_design(
-        self, 
-        design_2d: Dict[str, Any], 
-        climate_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _generate_electrical_design(self, ctx: DesignContext) -> Dict[str, Any]:
         """Generate electrical design"""
         
         # Calculate electrical loads
-        electrical_loads = await self._calculate_electrical_loads(design_2d, climate_data)
+        electrical_loads = self._calculate_electrical_loads(ctx)
         
         # Design electrical distribution
-        distribution = await self._design_electrical_distribution(electrical_loads)
+        distribution = self._design_electrical_distribution(electrical_loads)
         
         # Design lighting
-        lighting = await self._design_lighting(design_2d, climate_data)
+        lighting = self._design_lighting(ctx)
         
         # Design power systems
-        power_systems = await self._design_power_systems(electrical_loads)
+        power_systems = self._design_power_systems(electrical_loads)
         
         # Design emergency systems
-        emergency_systems = await self._design_emergency_systems(electrical_loads)
+        emergency_systems = self._design_emergency_systems(electrical_loads)
         
         return {
             "loads": electrical_loads,
@@ -147,42 +425,31 @@ class MEPService:
             "lighting": lighting,
             "power_systems": power_systems,
             "emergency_systems": emergency_systems,
-            "specifications": await self._generate_electrical_specifications(electrical_loads)
+            "specifications": self._generate_electrical_specifications(electrical_loads)
         }
     
-    async def _calculate_electrical_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_electrical_loads(self, ctx: DesignContext) -> Dict[str, Any]:
         """Calculate electrical loads"""
-        rooms = design_2d.get("rooms", {})
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
-        
-        # Determine occupancy type
-        occupancy_type = "residential"  # Default
-        if "office" in str(design_2d).lower():
-            occupancy_type = "office"
-        elif "retail" in str(design_2d).lower():
-            occupancy_type = "retail"
-        elif "hospital" in str(design_2d).lower():
-            occupancy_type = "hospital"
-        elif "school" in str(design_2d).lower():
-            occupancy_type = "school"
+        total_area = ctx.total_area
         
         # Calculate base electrical load
-        base_load = self.electrical_codes["load_calculations"][occupancy_type]
+        base_load = ELECTRICAL_CODES["load_calculations"][ctx.occupancy]
         total_electrical_load = base_load * total_area  # VA
         
         # Calculate room-specific loads
+        loads = ctx.rooms.areas * base_load
         room_loads = {}
-        for room_name, room_data in rooms.items():
-            room_area = room_data.get("area", 0)
-            room_load = base_load * room_area
+        for (room_name, room_data), room_load, lighting_load, receptacle_load in zip(
+            ctx.rooms.rooms.items(), loads.tolist(), (loads * 0.3).tolist(), (loads * 0.7).tolist()
+        ):
             room_loads[room_name] = {
-                "area": room_area,
+                "area": room_data.get("area", 0),
                 "load": room_load,
-                "circuits": await self._calculate_room_circuits(room_load)
+                "circuits": self._calculate_room_circuits(lighting_load, receptacle_load)
             }
         
         # Calculate HVAC loads
-        hvac_load = await self._calculate_hvac_electrical_load(design_2d, climate_data)
+        hvac_load = self._calculate_hvac_electrical_load(ctx)
         
         # Calculate total load
         total_load = total_electrical_load + hvac_load
@@ -192,61 +459,29 @@ class MEPService:
             "base_load": total_electrical_load,
             "hvac_load": hvac_load,
             "room_loads": room_loads,
-            "occupancy_type": occupancy_type
+            "occupancy_type": ctx.occupancy
         }
     
-    async def _calculate_room_circuits(self, room_load: float) -> List[Dict[str, Any]]:
-        """Calculate electrical circuits for a room"""
-        circuits = []
-        
-        # Lighting circuit
-        lighting_load = room_load * 0.3  # 30% for lighting
-        circuits.append({
-            "type": "lighting",
-            "load": lighting_load,
-            "rating": 15,  # A
-            "voltage": 120  # V
-        })
-        
-        # Receptacle circuit
-        receptacle_load = room_load * 0.7  # 70% for receptacles
-        circuits.append({
-            "type": "receptacles",
-            "load": receptacle_load,
-            "rating": 20,  # A
-            "voltage": 120  # V
-        })
-        
-        return circuits
-    
-    async def _calculate_hvac_electrical_load(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> float:
+    def _calculate_room_circuits(self, lighting_load: float, receptacle_load: float) -> List[Circuit]:
+        """Calculate electrical circuits for a room from its 30% lighting / 70% receptacle split"""
+        return [
+            Circuit("lighting", lighting_load, 15, 120),
+            Circuit("receptacles", receptacle_load, 20, 120)
+        ]
+    
+    def _calculate_hvac_electrical_load(self, ctx: DesignContext) -> float:
         """Calculate HVAC electrical load"""
-        rooms = design_2d.get("rooms", {})
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
-        
-        # Get climate data
-        current_weather = climate_data.get("current_weather", {})
-        temperature = current_weather.get("temperature", 20)
-        
-        # Calculate HVAC load based on temperature
-        if temperature > 25:
-            hvac_load_factor = 2.0  # Cooling required
-        elif temperature < 10:
-            hvac_load_factor = 1.5  # Heating required
-        else:
-            hvac_load_factor = 1.0  # Minimal HVAC
-        
         # Calculate HVAC electrical load
-        hvac_electrical_load = total_area * hvac_load_factor * 0.5  # VA/ft²
+        hvac_electrical_load = ctx.total_area * _hvac_load_factor(ctx.temperature) * 0.5  # VA/ft²
         
         return hvac_electrical_load
     
-    async def _design_electrical_distribution(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_electrical_distribution(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Design electrical distribution system"""
         total_load = electrical_loads.get("total_load", 0)
         
         # Calculate main panel size
-        main_panel_size = math.ceil(total_load / 1000)  # kVA
+        main_panel_size = _iceil(total_load, 1000)  # kVA
         
         # Design main distribution
         main_distribution = {
@@ -255,206 +490,93 @@ class MEPService:
                 "voltage": 240,
                 "phases": 3
             },
-            "sub_panels": await self._design_sub_panels(electrical_loads),
-            "feeders": await self._design_feeders(total_load)
+            "sub_panels": self._design_sub_panels(electrical_loads),
+            "feeders": self._design_feeders(total_load)
         }
         
         return main_distribution
     
-    async def _design_sub_panels(self, electrical_loads: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _design_sub_panels(self, electrical_loads: Dict[str, Any]) -> Tuple[SubPanel, ...]:
         """Design sub-panels"""
-        sub_panels = []
-        
-        # Design lighting panel
-        sub_panels.append({
-            "type": "lighting",
-            "size": 20,  # A
-            "voltage": 120,
-            "circuits": 12
-        })
-        
-        # Design receptacle panel
-        sub_panels.append({
-            "type": "receptacles",
-            "size": 30,  # A
-            "voltage": 120,
-            "circuits": 16
-        })
-        
-        # Design HVAC panel
-        sub_panels.append({
-            "type": "hvac",
-            "size": 40,  # A
-            "voltage": 240,
-            "circuits": 8
-        })
-        
-        return sub_panels
-    
-    async def _design_feeders(self, total_load: float) -> List[Dict[str, Any]]:
+        return SUB_PANELS
+    
+    def _design_feeders(self, total_load: float) -> List[Feeder]:
         """Design electrical feeders"""
-        feeders = []
-        
-        # Main feeder
-        feeders.append({
-            "type": "main",
-            "size": 4,  # AWG
-            "voltage": 240,
-            "current": math.ceil(total_load / 240)
-        })
-        
-        # Branch feeders
-        feeders.append({
-            "type": "branch",
-            "size": 12,  # AWG
-            "voltage": 120,
-            "current": 20
-        })
-        
-        return feeders
-    
-    async def _design_lighting(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+        return [
+            Feeder("main", 4, 240, _iceil(total_load, 240)),
+            BRANCH_FEEDER
+        ]
+    
+    def _design_lighting(self, ctx: DesignContext) -> Dict[str, Any]:
         """Design lighting system"""
-        rooms = design_2d.get("rooms", {})
         
-        # Get solar data
-        solar_data = climate_data.get("solar_irradiance", [])
-        avg_solar = sum([month["solar_irradiance"] for month in solar_data]) / 12 if solar_data else 1000
+        # Calculate lighting requirements
+        if ctx.avg_solar > 1000:
+            # High solar gain - reduce artificial lighting
+            lighting_density = 0.5  # W/ft²
+        else:
+            # Low solar gain - increase artificial lighting
+            lighting_density = 1.0  # W/ft²
         
         # Design lighting for each room
+        total_watts = ctx.rooms.areas * lighting_density
+        fixture_counts = np.ceil(total_watts / LED_FIXTURE_WATTS).astype(np.int32)
+        # Every room lays fixtures out along the same grid, so share one row of offsets
+        offsets = (np.arange(fixture_counts.max(initial=0)) * LED_FIXTURE_SPACING).tolist()
         room_lighting = {}
-        for room_name, room_data in rooms.items():
-            room_area = room_data.get("area", 0)
-            
-            # Calculate lighting requirements
-            if avg_solar > 1000:
-                # High solar gain - reduce artificial lighting
-                lighting_density = 0.5  # W/ft²
-            else:
-                # Low solar gain - increase artificial lighting
-                lighting_density = 1.0  # W/ft²
-            
+        for (room_name, room_data), room_watts, num_fixtures in zip(
+            ctx.rooms.rooms.items(), total_watts.tolist(), fixture_counts.tolist()
+        ):
             room_lighting[room_name] = {
-                "area": room_area,
+                "area": room_data.get("area", 0),
                 "lighting_density": lighting_density,
-                "total_watts": room_area * lighting_density,
-                "fixtures": await self._design_lighting_fixtures(room_area, lighting_density)
+                "total_watts": room_watts,
+                "fixtures": self._design_lighting_fixtures(offsets[:num_fixtures])
             }
         
         return {
             "room_lighting": room_lighting,
-            "emergency_lighting": await self._design_emergency_lighting(rooms),
-            "exterior_lighting": await self._design_exterior_lighting()
+            "emergency_lighting": self._design_emergency_lighting(ctx.rooms),
+            "exterior_lighting": self._design_exterior_lighting()
         }
     
-    async def _design_lighting_fixtures(self, room_area: float, lighting_density: float) -> List[Dict[str, Any]]:
-        """Design lighting fixtures for a room"""
-        fixtures = []
-        
-        # Calculate number of fixtures needed
-        total_watts = room_area * lighting_density
-        fixture_watts = 32  # Standard LED fixture
-        num_fixtures = math.ceil(total_watts / fixture_watts)
-        
-        for i in range(num_fixtures):
-            fixtures.append({
-                "type": "LED_fixture",
-                "watts": fixture_watts,
-                "position": [i * 4, 0],  # Simplified positioning
-                "height": 9  # ft
-            })
-        
-        return fixtures
+    def _design_lighting_fixtures(self, offsets: List[int]) -> List[LightingFixture]:
+        """Design lighting fixtures for a room at the given offsets along one wall"""
+        return [LightingFixture("LED_fixture", LED_FIXTURE_WATTS, [x, 0], 9) for x in offsets]
     
-    async def _design_emergency_lighting(self, rooms: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_emergency_lighting(self, rooms: RoomArrays) -> Dict[str, Any]:
         """Design emergency lighting system"""
-        return {
-            "exit_lighting": {
-                "type": "LED_exit_sign",
-                "watts": 5,
-                "battery_backup": "90_minutes"
-            },
-            "emergency_fixtures": {
-                "type": "LED_emergency",
-                "watts": 10,
-                "battery_backup": "90_minutes"
-            }
-        }
+        return EMERGENCY_LIGHTING
     
-    async def _design_exterior_lighting(self) -> Dict[str, Any]:
+    def _design_exterior_lighting(self) -> Dict[str, Any]:
         """Design exterior lighting"""
-        return {
-            "security_lighting": {
-                "type": "LED_security",
-                "watts": 50,
-                "motion_sensor": True
-            },
-            "landscape_lighting": {
-                "type": "LED_landscape",
-                "watts": 20,
-                "solar_powered": True
-            }
-        }
+        return EXTERIOR_LIGHTING
     
-    async def _design_power_systems(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_power_systems(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Design power systems"""
-        return {
-            "main_service": {
-                "size": 200,  # A
-                "voltage": 240,
-                "phases": 3
-            },
-            "generator": {
-                "size": 50,  # kW
-                "fuel": "natural_gas",
-                "automatic_transfer": True
-            },
-            "ups": {
-                "size": 10,  # kVA
-                "battery_backup": "30_minutes"
-            }
-        }
+        return POWER_SYSTEMS
     
-    async def _design_emergency_systems(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_emergency_systems(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Design emergency systems"""
-        return {
-            "fire_alarm": {
-                "type": "addressable",
-                "zones": 4,
-                "battery_backup": "24_hours"
-            },
-            "emergency_power": {
-                "type": "generator",
-                "size": 25,  # kW
-                "fuel": "natural_gas"
-            },
-            "exit_lighting": {
-                "type": "LED",
-                "battery_backup": "90_minutes"
-            }
-        }
+        return EMERGENCY_SYSTEMS
     
-    async def _generate_plumbing_design(
-        self, 
-        design_2d: Dict[str, Any], 
-        climate_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _generate_plumbing_design(self, ctx: DesignContext) -> Dict[str, Any]:
         """Generate plumbing design"""
         
         # Calculate plumbing loads
-        plumbing_loads = await self._calculate_plumbing_loads(design_2d, climate_data)
+        plumbing_loads = self._calculate_plumbing_loads(ctx)
         
         # Design water supply
-        water_supply = await self._design_water_supply(plumbing_loads)
+        water_supply = self._design_water_supply(plumbing_loads)
         
         # Design drainage
-        drainage = await self._design_drainage(plumbing_loads)
+        drainage = self._design_drainage(plumbing_loads)
         
         # Design fixtures
-        fixtures = await self._design_plumbing_fixtures(design_2d, climate_data)
+        fixtures = self._design_plumbing_fixtures(ctx)
         
         # Design water heating
-        water_heating = await self._design_water_heating(plumbing_loads, climate_data)
+        water_heating = self._design_water_heating(plumbing_loads, ctx.temperature)
         
         return {
             "loads": plumbing_loads,
@@ -462,24 +584,15 @@ class MEPService:
             "drainage": drainage,
             "fixtures": fixtures,
             "water_heating": water_heating,
-            "specifications": await self._generate_plumbing_specifications(plumbing_loads)
+            "specifications": self._generate_plumbing_specifications(plumbing_loads)
         }
     
-    async def _calculate_plumbing_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_plumbing_loads(self, ctx: DesignContext) -> Dict[str, Any]:
         """Calculate plumbing loads"""
-        rooms = design_2d.get("rooms", {})
-        
         # Count fixtures
-        fixture_count = 0
-        fixture_units = 0
-        
-        for room_name, room_data in rooms.items():
-            if "bathroom" in room_name.lower():
-                fixture_count += 3  # Toilet, lavatory, shower
-                fixture_units += 6  # 3 + 1 + 2
-            elif "kitchen" in room_name.lower():
-                fixture_count += 2  # Sink, dishwasher
-                fixture_units += 3  # 2 + 1
+        room_counts = np.array([ctx.rooms.is_bathroom.sum(), ctx.rooms.is_kitchen.sum()], dtype=np.int64)
+        per_room = np.array([FIXTURE_TABLE["bathroom"], FIXTURE_TABLE["kitchen"]], dtype=np.int64)
+        fixture_count, fixture_units = (int(total) for total in room_counts @ per_room)
         
         # Calculate water demand
         water_demand = fixture_units * 10  # gpm per fixture unit
@@ -491,15 +604,15 @@ class MEPService:
             "peak_demand": water_demand * 1.5
         }
     
-    async def _design_water_supply(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_water_supply(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Design water supply system"""
         water_demand = plumbing_loads.get("water_demand", 0)
         
         # Design main water line
-        main_line_size = 4 if water_demand > 50 else 2  # inches
+        main_line_size = _lookup(WATER_MAIN_SIZES, water_demand)  # inches
         
         # Design branch lines
-        branch_line_size = 2 if water_demand > 25 else 1  # inches
+        branch_line_size = _lookup(WATER_BRANCH_SIZES, water_demand)  # inches
         
         return {
             "main_line": {
@@ -518,15 +631,15 @@ class MEPService:
             }
         }
     
-    async def _design_drainage(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_drainage(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Design drainage system"""
         fixture_units = plumbing_loads.get("fixture_units", 0)
         
         # Design main drain
-        main_drain_size = 4 if fixture_units > 20 else 3  # inches
+        main_drain_size = _lookup(MAIN_DRAIN_SIZES, fixture_units)  # inches
         
         # Design branch drains
-        branch_drain_size = 2 if fixture_units > 10 else 1.5  # inches
+        branch_drain_size = _lookup(BRANCH_DRAIN_SIZES, fixture_units)  # inches
         
         return {
             "main_drain": {
@@ -545,52 +658,27 @@ class MEPService:
             }
         }
     
-    async def _design_plumbing_fixtures(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_plumbing_fixtures(self, ctx: DesignContext) -> Dict[str, Any]:
         """Design plumbing fixtures"""
-        rooms = design_2d.get("rooms", {})
-        
-        fixtures = {
-            "bathroom": [],
-            "kitchen": [],
-            "laundry": []
+        room_counts = {
+            "bathroom": ctx.rooms.is_bathroom.sum(),
+            "kitchen": ctx.rooms.is_kitchen.sum(),
+            "laundry": ctx.rooms.is_laundry.sum()
         }
-        
-        for room_name, room_data in rooms.items():
-            if "bathroom" in room_name.lower():
-                fixtures["bathroom"].extend([
-                    {"type": "toilet", "model": "standard", "water_sense": True},
-                    {"type": "lavatory", "model": "wall_mount", "water_sense": True},
-                    {"type": "shower", "model": "standard", "water_sense": True}
-                ])
-            elif "kitchen" in room_name.lower():
-                fixtures["kitchen"].extend([
-                    {"type": "sink", "model": "double_bowl", "water_sense": True},
-                    {"type": "dishwasher", "model": "energy_star", "water_sense": True}
-                ])
-            elif "laundry" in room_name.lower():
-                fixtures["laundry"].extend([
-                    {"type": "washing_machine", "model": "high_efficiency", "water_sense": True},
-                    {"type": "dryer", "model": "energy_star", "gas": True}
-                ])
-        
-        return fixtures
-    
-    async def _design_water_heating(self, plumbing_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            category: [dict(fixture) for _ in range(int(count)) for fixture in PLUMBING_FIXTURES[category]]
+            for category, count in room_counts.items()
+        }
+    
+    def _design_water_heating(self, plumbing_loads: Dict[str, Any], temperature: float) -> Dict[str, Any]:
         """Design water heating system"""
         water_demand = plumbing_loads.get("water_demand", 0)
         
         # Calculate water heater size
-        if water_demand > 50:
-            heater_size = 80  # gallons
-            heater_type = "tank"
-        else:
-            heater_size = 50  # gallons
-            heater_type = "tank"
+        heater_size = _lookup(WATER_HEATER_SIZES, water_demand)  # gallons
+        heater_type = "tank"
         
         # Determine fuel type based on climate
-        current_weather = climate_data.get("current_weather", {})
-        temperature = current_weather.get("temperature", 20)
-        
         if temperature < 0:
             fuel_type = "electric"  # Electric for cold climates
         else:
@@ -604,27 +692,23 @@ class MEPService:
             "location": "basement"
         }
     
-    async def _generate_hvac_design(
-        self, 
-        design_2d: Dict[str, Any], 
-        climate_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _generate_hvac_design(self, ctx: DesignContext) -> Dict[str, Any]:
         """Generate HVAC design"""
         
         # Calculate HVAC loads
-        hvac_loads = await self._calculate_hvac_loads(design_2d, climate_data)
+        hvac_loads = self._calculate_hvac_loads(ctx)
         
         # Design heating system
-        heating_system = await self._design_heating_system(hvac_loads, climate_data)
+        heating_system = self._design_heating_system(hvac_loads, ctx.climate_data)
         
         # Design cooling system
-        cooling_system = await self._design_cooling_system(hvac_loads, climate_data)
+        cooling_system = self._design_cooling_system(hvac_loads, ctx.climate_data)
         
         # Design ventilation
-        ventilation = await self._design_ventilation(design_2d, climate_data)
+        ventilation = self._design_ventilation(ctx)
         
         # Design controls
-        controls = await self._design_hvac_controls(hvac_loads, climate_data)
+        controls = self._design_hvac_controls(hvac_loads, ctx.climate_data)
         
         return {
             "loads": hvac_loads,
@@ -632,70 +716,44 @@ class MEPService:
             "cooling": cooling_system,
             "ventilation": ventilation,
             "controls": controls,
-            "specifications": await self._generate_hvac_specifications(hvac_loads, climate_data)
+            "specifications": self._generate_hvac_specifications(hvac_loads, ctx.climate_data)
         }
     
-    async def _calculate_hvac_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_hvac_loads(self, ctx: DesignContext) -> Dict[str, Any]:
         """Calculate HVAC loads"""
-        rooms = design_2d.get("rooms", {})
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
-        
-        # Get climate data
-        current_weather = climate_data.get("current_weather", {})
-        temperature = current_weather.get("temperature", 20)
-        humidity = current_weather.get("humidity", 50)
-        
-        # Determine occupancy type
-        occupancy_type = "residential"  # Default
-        if "office" in str(design_2d).lower():
-            occupancy_type = "office"
-        elif "retail" in str(design_2d).lower():
-            occupancy_type = "retail"
-        elif "hospital" in str(design_2d).lower():
-            occupancy_type = "hospital"
-        elif "school" in str(design_2d).lower():
-            occupancy_type = "school"
+        total_area = ctx.total_area
         
         # Calculate cooling load
-        cooling_load_factor = self.hvac_codes["cooling_loads"][occupancy_type]
+        cooling_load_factor = HVAC_CODES["cooling_loads"][ctx.occupancy]
         cooling_load = total_area * cooling_load_factor  # tons
         
         # Calculate heating load
-        heating_load_factor = self.hvac_codes["heating_loads"][occupancy_type]
+        heating_load_factor = HVAC_CODES["heating_loads"][ctx.occupancy]
         heating_load = total_area * heating_load_factor  # tons
         
         # Calculate ventilation load
-        ventilation_rate = self.hvac_codes["ventilation_rates"][occupancy_type]
+        ventilation_rate = HVAC_CODES["ventilation_rates"][ctx.occupancy]
         ventilation_load = total_area * ventilation_rate  # cfm
         
         # Apply climate adjustments
-        if temperature > 25:
-            cooling_load *= 1.2  # Increase cooling for hot climates
-        elif temperature < 10:
-            heating_load *= 1.2  # Increase heating for cold climates
-        
-        if humidity > 70:
-            cooling_load *= 1.1  # Increase cooling for humid climates
+        cooling_load, heating_load = _climate_adjusted_loads(
+            cooling_load, heating_load, ctx.temperature, ctx.humidity
+        )
         
         return {
             "cooling_load": cooling_load,
             "heating_load": heating_load,
             "ventilation_load": ventilation_load,
             "total_load": cooling_load + heating_load,
-            "occupancy_type": occupancy_type
+            "occupancy_type": ctx.occupancy
         }
     
-    async def _design_heating_system(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_heating_system(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Design heating system"""
         heating_load = hvac_loads.get("heating_load", 0)
         
         # Determine heating system type
-        if heating_load > 5:  # tons
-            system_type = "boiler"
-            fuel_type = "natural_gas"
-        else:
-            system_type = "heat_pump"
-            fuel_type = "electric"
+        system_type, fuel_type = _lookup(HEATING_SYSTEMS, heating_load)
         
         return {
             "type": system_type,
@@ -705,15 +763,12 @@ class MEPService:
             "distribution": "forced_air"
         }
     
-    async def _design_cooling_system(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_cooling_system(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Design cooling system"""
         cooling_load = hvac_loads.get("cooling_load", 0)
         
         # Determine cooling system type
-        if cooling_load > 5:  # tons
-            system_type = "chiller"
-        else:
-            system_type = "split_system"
+        system_type = _lookup(COOLING_SYSTEMS, cooling_load)
         
         return {
             "type": system_type,
@@ -723,12 +778,10 @@ class MEPService:
             "distribution": "forced_air"
         }
     
-    async def _design_ventilation(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_ventilation(self, ctx: DesignContext) -> Dict[str, Any]:
         """Design ventilation system"""
-        rooms = design_2d.get("rooms", {})
-        
         # Calculate ventilation requirements
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
+        total_area = ctx.total_area
         ventilation_rate = 0.35  # cfm/ft² for residential
         
         total_ventilation = total_area * ventilation_rate
@@ -741,46 +794,35 @@ class MEPService:
             "heat_recovery": True
         }
     
-    async def _design_hvac_controls(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_hvac_controls(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Design HVAC controls"""
-        return {
-            "type": "smart_thermostat",
-            "zones": 4,
-            "programming": "7_day",
-            "remote_access": True,
-            "energy_monitoring": True
-        }
+        return HVAC_CONTROLS
     
-    async def _generate_fire_protection_design(
-        self, 
-        design_2d: Dict[str, Any], 
-        climate_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _generate_fire_protection_design(self, ctx: DesignContext) -> Dict[str, Any]:
         """Generate fire protection design"""
-        rooms = design_2d.get("rooms", {})
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
+        total_area = ctx.total_area
         
         # Design sprinkler system
-        sprinkler_system = await self._design_sprinkler_system(total_area)
+        sprinkler_system = self._design_sprinkler_system(total_area)
         
         # Design fire alarm system
-        fire_alarm = await self._design_fire_alarm_system(rooms)
+        fire_alarm = self._design_fire_alarm_system(ctx.rooms)
         
         # Design fire suppression
-        fire_suppression = await self._design_fire_suppression(rooms)
+        fire_suppression = self._design_fire_suppression(ctx.rooms)
         
         return {
             "sprinkler_system": sprinkler_system,
             "fire_alarm": fire_alarm,
             "fire_suppression": fire_suppression,
-            "specifications": await self._generate_fire_protection_specifications(total_area)
+            "specifications": self._generate_fire_protection_specifications(total_area)
         }
     
-    async def _design_sprinkler_system(self, total_area: float) -> Dict[str, Any]:
+    def _design_sprinkler_system(self, total_area: float) -> Dict[str, Any]:
         """Design sprinkler system"""
         # Calculate number of sprinklers needed
         coverage_per_sprinkler = 100  # ft²
-        num_sprinklers = math.ceil(total_area / coverage_per_sprinkler)
+        num_sprinklers = _iceil(total_area, coverage_per_sprinkler)
         
         return {
             "type": "wet_pipe",
@@ -790,9 +832,9 @@ class MEPService:
             "pressure": 50  # psi
         }
     
-    async def _design_fire_alarm_system(self, rooms: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_fire_alarm_system(self, rooms: RoomArrays) -> Dict[str, Any]:
         """Design fire alarm system"""
-        num_rooms = len(rooms)
+        num_rooms = len(rooms.names)
         
         return {
             "type": "addressable",
@@ -803,16 +845,11 @@ class MEPService:
             "battery_backup": "24_hours"
         }
     
-    async def _design_fire_suppression(self, rooms: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_fire_suppression(self, rooms: RoomArrays) -> Dict[str, Any]:
         """Design fire suppression system"""
-        return {
-            "type": "sprinkler",
-            "coverage": "total",
-            "activation": "automatic",
-            "monitoring": "central_station"
-        }
+        return FIRE_SUPPRESSION
     
-    async def _generate_mep_drawings(
+    def _generate_mep_drawings(
         self, 
         electrical_design: Dict[str, Any], 
         plumbing_design: Dict[str, Any], 
@@ -820,87 +857,63 @@ class MEPService:
         fire_protection: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate MEP drawings"""
-        return {
+        elements = (
+            electrical_design.get("distribution", {}),
+            plumbing_design.get("water_supply", {}),
+            hvac_design.get("heating", {}),
+            fire_protection.get("sprinkler_system", {})
+        )
+        
+        # Design iterations often leave most subsystems unchanged; reuse the plans for those
+        key = _fingerprint(*elements)
+        with self._drawings_lock:
+            drawings = self._drawings_cache.get(key)
+        if drawings is not None:
+            return drawings
+        
+        electrical_elements, plumbing_elements, hvac_elements, fire_elements = elements
+        drawings = {
             "electrical_plan": {
                 "type": "plan",
                 "scale": "1:100",
-                "elements": electrical_design.get("distribution", {})
+                "elements": electrical_elements
             },
             "plumbing_plan": {
                 "type": "plan",
                 "scale": "1:100",
-                "elements": plumbing_design.get("water_supply", {})
+                "elements": plumbing_elements
             },
             "hvac_plan": {
                 "type": "plan",
                 "scale": "1:100",
-                "elements": hvac_design.get("heating", {})
+                "elements": hvac_elements
             },
             "fire_protection_plan": {
                 "type": "plan",
                 "scale": "1:100",
-                "elements": fire_protection.get("sprinkler_system", {})
+                "elements": fire_elements
             }
         }
+        with self._drawings_lock:
+            self._drawings_cache[key] = drawings
+        return drawings
     
-    async def _generate_mep_specifications(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_mep_specifications(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate MEP specifications"""
-        return {
-            "electrical": {
-                "codes": ["NEC", "IBC"],
-                "standards": ["IEEE", "UL"],
-                "materials": ["copper", "aluminum", "steel"]
-            },
-            "plumbing": {
-                "codes": ["IPC", "IBC"],
-                "standards": ["ASTM", "ANSI"],
-                "materials": ["copper", "PVC", "cast_iron"]
-            },
-            "hvac": {
-                "codes": ["IMC", "IBC"],
-                "standards": ["ASHRAE", "ARI"],
-                "materials": ["steel", "aluminum", "copper"]
-            },
-            "fire_protection": {
-                "codes": ["NFPA", "IBC"],
-                "standards": ["UL", "FM"],
-                "materials": ["steel", "copper", "PVC"]
-            }
-        }
+        return MEP_SPECIFICATIONS
     
-    async def _generate_electrical_specifications(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_electrical_specifications(self, electrical_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Generate electrical specifications"""
-        return {
-            "codes": ["NEC", "IBC"],
-            "standards": ["IEEE", "UL"],
-            "materials": ["copper", "aluminum", "steel"],
-            "loads": electrical_loads
-        }
+        return {**ELECTRICAL_SPECIFICATIONS, "loads": electrical_loads}
     
-    async def _generate_plumbing_specifications(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_plumbing_specifications(self, plumbing_loads: Dict[str, Any]) -> Dict[str, Any]:
         """Generate plumbing specifications"""
-        return {
-            "codes": ["IPC", "IBC"],
-            "standards": ["ASTM", "ANSI"],
-            "materials": ["copper", "PVC", "cast_iron"],
-            "loads": plumbing_loads
-        }
+        return {**PLUMBING_SPECIFICATIONS, "loads": plumbing_loads}
     
-    async def _generate_hvac_specifications(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_hvac_specifications(self, hvac_loads: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate HVAC specifications"""
-        return {
-            "codes": ["IMC", "IBC"],
-            "standards": ["ASHRAE", "ARI"],
-            "materials": ["steel", "aluminum", "copper"],
-            "loads": hvac_loads,
-            "climate": climate_data
-        }
+        return {**HVAC_SPECIFICATIONS, "loads": hvac_loads, "climate": climate_data}
     
-    async def _generate_fire_protection_specifications(self, total_area: float) -> Dict[str, Any]:
+    def _generate_fire_protection_specifications(self, total_area: float) -> Dict[str, Any]:
         """Generate fire protection specifications"""
-        return {
-            "codes": ["NFPA", "IBC"],
-            "standards": ["UL", "FM"],
-            "materials": ["steel", "copper", "PVC"],
-            "area": total_area
-        }
+        return {**FIRE_PROTECTION_SPECIFICATIONS, "area": total_area}
@@ -3,93 +3,249 @@ Structural Service - Handles structural engineering design
 """
 
 import numpy as np
-from typing import Dict, Any, List, Tuple
-import math
+from typing import Dict, Any, FrozenSet, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from utils.occupancy import detect_occupancy
+
+# Climate concerns the structure responds to
+RECOMMENDATION_FLAGS = ("humidity", "temperature", "wind", "seismic")
+
+def _recommendation_flags(recommendations: Dict[str, Any]) -> FrozenSet[str]:
+    """Climate concerns raised by the architectural recommendations"""
+    if "flags" in recommendations:
+        return frozenset(recommendations["flags"])
+    text = str(recommendations).lower()
+    return frozenset(flag for flag in RECOMMENDATION_FLAGS if flag in text)
+
+SEISMIC_COEFFICIENT = 0.1  # Simplified base seismic coefficient
+SNOW_LOAD_FACTOR = 0.1     # kN/m² per mm of average precipitation (simplified conversion)
+
+# Dynamic pressure coefficient 0.5 * rho_air (1.225 kg/m³), converted from Pa to kN/m²
+WIND_PRESSURE_COEF = 0.5 * 1.225 / 1000
+
+def _wind_load(total_area: float, wind_speed: float) -> float:
+    """Wind load in kN from dynamic pressure over the floor area"""
+    return WIND_PRESSURE_COEF * wind_speed * wind_speed * total_area  # kN
+
+def _seismic_load(total_area: float) -> float:
+    """Seismic load in kN"""
+    return SEISMIC_COEFFICIENT * total_area  # kN
+
+def _snow_load(total_area: float, avg_precipitation: float) -> float:
+    """Snow load in kN from average monthly precipitation"""
+    return avg_precipitation * SNOW_LOAD_FACTOR * total_area  # kN
+
+def _average_precipitation(precipitation: np.ndarray) -> float:
+    """Average monthly precipitation, or 0 when there is no data"""
+    return float(precipitation.mean()) if precipitation.size else 0.0
+
+@dataclass(slots=True)
+class ClimateView:
+    """Climate values the structural design reads, extracted once per design"""
+    wind_speed: float          # m/s
+    precipitation: np.ndarray  # mm per month
+    flags: FrozenSet[str]
+    
+    @classmethod
+    def from_climate_data(cls, climate_data: Dict[str, Any]) -> "ClimateView":
+        precipitation_data = climate_data.get("historical_data", {}).get("precipitation_data", [])
+        return cls(
+            climate_data.get("current_weather", {}).get("wind_speed", 10),
+            np.fromiter(
+                (month["precipitation"] for month in precipitation_data),
+                dtype=np.float64, count=len(precipitation_data)
+            ),
+            _recommendation_flags(climate_data.get("architectural_recommendations", {}))
+        )
+
+# Order of the entries in a load vector
+LOAD_TYPES = ("dead", "live", "wind", "seismic", "snow")
+
+def _compute_load_vector(
+    total_area: float, dead_unit: float, live_unit: float, wind_speed: float, avg_precipitation: float
+) -> np.ndarray:
+    """Dead, live, wind, seismic and snow loads in kN, in LOAD_TYPES order"""
+    return np.array([
+        dead_unit * total_area,
+        live_unit * total_area,
+        _wind_load(total_area, wind_speed),
+        _seismic_load(total_area),
+        _snow_load(total_area, avg_precipitation)
+    ], dtype=np.float64)
+
+# Material properties and design codes, shared read-only by every service instance
+MATERIAL_PROPERTIES = MappingProxyType({
+    "concrete": MappingProxyType({
+        "compressive_strength": 25,  # MPa
+        "tensile_strength": 2.5,    # MPa
+        "modulus_of_elasticity": 30000,  # MPa
+        "density": 2400,  # kg/m³
+        "thermal_expansion": 10e-6  # 1/°C
+    }),
+    "steel": MappingProxyType({
+        "yield_strength": 250,  # MPa
+        "tensile_strength": 400,  # MPa
+        "modulus_of_elasticity": 200000,  # MPa
+        "density": 7850,  # kg/m³
+        "thermal_expansion": 12e-6  # 1/°C
+    }),
+    "wood": MappingProxyType({
+        "compressive_strength": 20,  # MPa
+        "tensile_strength": 15,  # MPa
+        "modulus_of_elasticity": 12000,  # MPa
+        "density": 500,  # kg/m³
+        "thermal_expansion": 5e-6  # 1/°C
+    })
+})
+
+LOAD_CODES = MappingProxyType({
+    "dead_loads": MappingProxyType({
+        "concrete_slab": 2.4,  # kN/m²
+        "steel_deck": 0.5,     # kN/m²
+        "insulation": 0.2,     # kN/m²
+        "roofing": 0.3,        # kN/m²
+        "partitions": 1.0      # kN/m²
+    }),
+    "live_loads": MappingProxyType({
+        "residential": 2.0,    # kN/m²
+        "office": 2.5,         # kN/m²
+        "retail": 4.0,         # kN/m²
+        "hospital": 3.0,       # kN/m²
+        "school": 3.0          # kN/m²
+    }),
+    "wind_loads": MappingProxyType({
+        "basic_wind_speed": 50,  # m/s
+        "exposure_category": "B",
+        "importance_factor": 1.0
+    }),
+    "seismic_loads": MappingProxyType({
+        "seismic_zone": "2",
+        "soil_type": "C",
+        "importance_factor": 1.0
+    })
+})
+
+# The dead-load table is fixed, so it folds to a single kN/m² figure at import
+DEAD_LOAD_UNIT = sum(LOAD_CODES["dead_loads"].values())
+
+# Frame member parameters per structural system
+# (span/depth ratio, width, material, grade, type)
+BEAM_PARAMS = MappingProxyType({
+    "steel_frame": (20, 0.2, "steel", "S275", "steel_beam"),
+    "concrete_frame": (12, 0.3, "concrete", "C25", "concrete_beam"),
+    "wood_frame": (15, 0.2, "wood", "C24", "wood_beam")
+})
+
+# (size, material, grade, type)
+COLUMN_PARAMS = MappingProxyType({
+    "steel_frame": (0.2, "steel", "S275", "steel_column"),
+    "concrete_frame": (0.3, "concrete", "C25", "concrete_column"),
+    "wood_frame": (0.2, "wood", "C24", "wood_column")
+})
+
+# (type, method, strength); shared by the frame and the connection schedule
+FRAME_CONNECTION_PARAMS = MappingProxyType({
+    "steel_frame": ("steel_connection", "welded", "full_strength"),
+    "concrete_frame": ("concrete_connection", "monolithic", "full_strength"),
+    "wood_frame": ("wood_connection", "bolted", "partial_strength")
+})
+
+# Connection designs depend only on the structural system, so each is built once and
+# shared. Callers must treat the returned dicts as read-only.
+@lru_cache(maxsize=8)
+def _beam_column_connections(structural_system: str) -> Tuple[Dict[str, Any], ...]:
+    """Beam-column connections for a structural system; anything else is detailed as wood"""
+    connection_type, method, strength = FRAME_CONNECTION_PARAMS.get(
+        structural_system, FRAME_CONNECTION_PARAMS["wood_frame"]
+    )
+    return ({
+        "type": connection_type,
+        "method": method,
+        "strength": strength,
+        "details": "standard"
+    },)
+
+# Fixed design elements and specification templates. Helpers merge in the per-design
+# fields; the shared objects themselves are never mutated.
+ROOF_DECK = {
+    "type": "steel_deck",
+    "thickness": 0.075,
+    "material": "steel",
+    "insulation": "standard"
+}
+
+ROOF_CONNECTIONS = ({
+    "type": "roof_connection",
+    "method": "welded",
+    "strength": "full_strength"
+},)
+
+FOUNDATION_CONNECTIONS = ({
+    "type": "foundation_connection",
+    "method": "embedded",
+    "strength": "full_strength",
+    "details": "standard"
+},)
+
+STRUCTURAL_SPECIFICATIONS = {
+    "codes": ("IBC", "ASCE", "AISC", "ACI"),
+    "standards": ("ASTM", "AISC", "ACI")
+}
+
+FOUNDATION_SPECIFICATIONS = {
+    "materials": ("concrete", "steel", "insulation"),
+    "specifications": ("ACI 318", "IBC")
+}
+
+FRAME_SPECIFICATIONS = {
+    "materials": ("steel", "concrete", "wood"),
+    "specifications": ("AISC", "ACI", "NDS")
+}
+
+ROOF_SPECIFICATIONS = {
+    "materials": ("steel", "insulation", "membrane"),
+    "specifications": ("AISC", "ASTM")
+}
+
+CONNECTION_SPECIFICATIONS = FRAME_SPECIFICATIONS
 
 class StructuralService:
     def __init__(self):
-        self.material_properties = self._load_material_properties()
-        self.load_codes = self._load_load_codes()
+        self.material_properties = MATERIAL_PROPERTIES
+        self.load_codes = LOAD_CODES
         
-    def _load_material_properties(self) -> Dict[str, Any]:
-        """Load material properties for structural design"""
-        return {
-            "concrete": {
-                "compressive_strength": 25,  # MPa
-                "tensile_strength": 2.5,    # MPa
-                "modulus_of_elasticity": 30000,  # MPa
-                "density": 2400,  # kg/m³
-                "thermal_expansion": 10e-6  # 1/°C
-            },
-            "steel": {
-                "yield_strength": 250,  # MPa
-                "tensile_strength": 400,  # MPa
-                "modulus_of_elasticity": 200000,  # MPa
-                "density": 7850,  # kg/m³
-                "thermal_expansion": 12e-6  # 1/°C
-            },
-            "wood": {
-                "compressive_strength": 20,  # MPa
-                "tensile_strength": 15,  # MPa
-                "modulus_of_elasticity": 12000,  # MPa
-                "density": 500,  # kg/m³
-                "thermal_expansion": 5e-6  # 1/°C
-            }
-        }
-    
-    def _load_load_codes(self) -> Dict[str, Any]:
-        """Load structural design codes"""
-        return {
-            "dead_loads": {
-                "concrete_slab": 2.4,  # kN/m²
-                "steel_deck": 0.5,     # kN/m²
-                "insulation": 0.2,     # kN/m²
-                "roofing": 0.3,        # kN/m²
-                "partitions": 1.0      # kN/m²
-            },
-            "live_loads": {
-                "residential": 2.0,    # kN/m²
-                "office": 2.5,         # kN/m²
-                "retail": 4.0,         # kN/m²
-                "hospital": 3.0,       # kN/m²
-                "school": 3.0          # kN/m²
-            },
-            "wind_loads": {
-                "basic_wind_speed": 50,  # m/s
-                "exposure_category": "B",
-                "importance_factor": 1.0
-            },
-            "seismic_loads": {
-                "seismic_zone": "2",
-                "soil_type": "C",
-                "importance_factor": 1.0
-            }
-        }
-    
     async def generate_structural_design(
         self, 
         design_2d: Dict[str, Any], 
         climate_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate structural design based on 2D design and climate data"""
+        climate = ClimateView.from_climate_data(climate_data)
         
         # Analyze structural requirements
-        structural_analysis = await self._analyze_structural_requirements(design_2d, climate_data)
-        
-        # Design foundation
-        foundation_design = await self._design_foundation(structural_analysis, climate_data)
-        
-        # Design structural frame
-        frame_design = await self._design_structural_frame(structural_analysis, climate_data)
-        
-        # Design roof structure
-        roof_design = await self._design_roof_structure(structural_analysis, climate_data)
+        structural_analysis = self._analyze_structural_requirements(design_2d, climate)
+        
+        # Foundation, frame, roof and connections depend only on the analysis; the frame
+        # reuses the beam-column connections rather than designing its own
+        connections = self._design_connections(structural_analysis, climate)
+        foundation_design = self._design_foundation(structural_analysis, climate)
+        frame_design = self._design_structural_frame(
+            structural_analysis, climate, connections["beam_column"]
+        )
+        roof_design = self._design_roof_structure(structural_analysis, climate)
         
-        # Design connections
-        connections = await self._design_connections(structural_analysis, climate_data)
+        # Specifications are filled in together once every design is known
+        specifications = self._build_all_specs(structural_analysis, foundation_design)
+        foundation_design["specifications"] = specifications["foundation"]
+        frame_design["specifications"] = specifications["frame"]
+        roof_design["specifications"] = specifications["roof"]
+        connections["specifications"] = specifications["connections"]
         
         # Generate structural drawings
-        structural_drawings = await self._generate_structural_drawings(
+        structural_drawings = self._generate_structural_drawings(
             foundation_design, frame_design, roof_design, connections
         )
         
@@ -100,142 +256,48 @@ class StructuralService:
             "roof": roof_design,
             "connections": connections,
             "drawings": structural_drawings,
-            "specifications": await self._generate_structural_specifications(structural_analysis)
+            "specifications": specifications["structural"]
         }
     
-    async def _analyze_structural_requirements(
+    def _analyze_structural_requirements(
         self, 
         design_2d: Dict[str, Any], 
-        climate_data: Dict[str, Any]
+        climate: ClimateView
     ) -> Dict[str, Any]:
         """Analyze structural requirements"""
         
-        # Calculate loads
-        loads = await self._calculate_loads(design_2d, climate_data)
-        
-        # Determine structural system
-        structural_system = await self._determine_structural_system(design_2d, loads)
-        
-        # Calculate spans and dimensions
-        spans = await self._calculate_spans(design_2d)
+        # Total floor area is shared by every load calculation
+        rooms = design_2d.get("rooms", {})
+        areas = np.fromiter(
+            (room.get("area", 0) for room in rooms.values()), dtype=np.float64, count=len(rooms)
+        )
+        total_area = float(areas.sum())
         
-        # Determine material requirements
-        materials = await self._determine_materials(design_2d, climate_data)
+        # Calculate loads
+        loads = self._calculate_loads(total_area, design_2d, climate)
         
         return {
             "loads": loads,
-            "structural_system": structural_system,
-            "spans": spans,
-            "materials": materials,
-            "climate_considerations": await self._analyze_climate_considerations(climate_data)
+            "structural_system": self._determine_structural_system(total_area, loads),
+            "spans": self._calculate_spans(design_2d),
+            "materials": self._determine_materials(design_2d, climate.flags),
+            "climate_considerations": self._analyze_climate_considerations(climate.flags)
         }
     
-    async def _calculate_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_loads(
+        self, total_area: float, design_2d: Dict[str, Any], climate: ClimateView
+    ) -> Dict[str, Any]:
         """Calculate structural loads"""
-        
-        # Get room data
-        rooms = design_2d.get("rooms", {})
-        total_area = sum([room.get("area", 0) for room in rooms.values()])
-        
-        # Calculate dead loads
-        dead_loads = await self._calculate_dead_loads(total_area, design_2d)
-        
-        # Calculate live loads
-        live_loads = await self._calculate_live_loads(total_area, design_2d)
-        
-        # Calculate wind loads
-        wind_loads = await self._calculate_wind_loads(design_2d, climate_data)
-        
-        # Calculate seismic loads
-        seismic_loads = await self._calculate_seismic_loads(design_2d, climate_data)
-        
-        # Calculate snow loads
-        snow_loads = await self._calculate_snow_loads(design_2d, climate_data)
-        
-        return {
-            "dead": dead_loads,
-            "live": live_loads,
-            "wind": wind_loads,
-            "seismic": seismic_loads,
-            "snow": snow_loads,
-            "total": dead_loads + live_loads + wind_loads + seismic_loads + snow_loads
-        }
-    
-    async def _calculate_dead_loads(self, total_area: float, design_2d: Dict[str, Any]) -> float:
-        """Calculate dead loads"""
-        dead_loads = self.load_codes["dead_loads"]
-        
-        # Calculate total dead load
-        total_dead_load = 0
-        for load_type, load_value in dead_loads.items():
-            total_dead_load += load_value
-        
-        return total_dead_load * total_area  # kN
-    
-    async def _calculate_live_loads(self, total_area: float, design_2d: Dict[str, Any]) -> float:
-        """Calculate live loads"""
-        # Determine occupancy type from design
-        occupancy_type = "residential"  # Default
-        if "office" in str(design_2d).lower():
-            occupancy_type = "office"
-        elif "retail" in str(design_2d).lower():
-            occupancy_type = "retail"
-        elif "hospital" in str(design_2d).lower():
-            occupancy_type = "hospital"
-        elif "school" in str(design_2d).lower():
-            occupancy_type = "school"
-        
-        live_load = self.load_codes["live_loads"][occupancy_type]
-        return live_load * total_area  # kN
-    
-    async def _calculate_wind_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> float:
-        """Calculate wind loads"""
-        wind_data = climate_data.get("current_weather", {})
-        wind_speed = wind_data.get("wind_speed", 10)  # m/s
-        
-        # Calculate wind pressure
-        wind_pressure = 0.5 * 1.225 * wind_speed**2  # Pa (simplified)
-        
-        # Convert to kN/m²
-        wind_pressure_kn = wind_pressure / 1000
-        
-        # Calculate total wind load
-        total_area = sum([room.get("area", 0) for room in design_2d.get("rooms", {}).values()])
-        return wind_pressure_kn * total_area  # kN
-    
-    async def _calculate_seismic_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> float:
-        """Calculate seismic loads"""
-        # Simplified seismic calculation
-        total_area = sum([room.get("area", 0) for room in design_2d.get("rooms", {}).values()])
-        
-        # Base seismic coefficient
-        seismic_coefficient = 0.1  # Simplified
-        
-        # Calculate seismic load
-        return seismic_coefficient * total_area  # kN
-    
-    async def _calculate_snow_loads(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> float:
-        """Calculate snow loads"""
-        # Get precipitation data
-        precipitation_data = climate_data.get("historical_data", {}).get("precipitation_data", [])
-        
-        if not precipitation_data:
-            return 0
-        
-        # Calculate average annual precipitation
-        avg_precipitation = sum([month["precipitation"] for month in precipitation_data]) / 12
-        
-        # Convert precipitation to snow load (simplified)
-        snow_load = avg_precipitation * 0.1  # kN/m² (simplified conversion)
-        
-        # Calculate total snow load
-        total_area = sum([room.get("area", 0) for room in design_2d.get("rooms", {}).values()])
-        return snow_load * total_area  # kN
+        live_unit = LOAD_CODES["live_loads"][detect_occupancy(design_2d)]
+        loads = _compute_load_vector(
+            total_area, DEAD_LOAD_UNIT, live_unit,
+            climate.wind_speed, _average_precipitation(climate.precipitation)
+        )
+        return {**dict(zip(LOAD_TYPES, loads.tolist())), "total": float(loads.sum())}
     
-    async def _determine_structural_system(self, design_2d: Dict[str, Any], loads: Dict[str, Any]) -> str:
+    def _determine_structural_system(self, total_area: float, loads: Dict[str, Any]) -> str:
         """Determine appropriate structural system"""
         total_load = loads.get("total", 0)
-        total_area = sum([room.get("area", 0) for room in design_2d.get("rooms", {}).values()])
         
         # Calculate load intensity
         load_intensity = total_load / total_area if total_area > 0 else 0
@@ -248,7 +310,7 @@ class StructuralService:
         else:
             return "concrete_frame"
     
-    async def _calculate_spans(self, design_2d: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_spans(self, design_2d: Dict[str, Any]) -> Dict[str, float]:
         """Calculate structural spans"""
         rooms = design_2d.get("rooms", {})
         
@@ -261,62 +323,53 @@ class StructuralService:
         if not rooms:
             return spans
         
-        # Calculate spans for each room
-        room_spans = []
-        for room_name, room_data in rooms.items():
-            if "dimensions" in room_data:
-                width = room_data["dimensions"][0]
-                depth = room_data["dimensions"][1]
-                span = max(width, depth)
-                room_spans.append(span)
-                spans["span_distribution"].append({
-                    "room": room_name,
-                    "span": span
-                })
-        
-        if room_spans:
-            spans["max_span"] = max(room_spans)
-            spans["average_span"] = sum(room_spans) / len(room_spans)
+        # Span of each room is its longer plan dimension
+        names = [name for name, room_data in rooms.items() if "dimensions" in room_data]
+        if not names:
+            return spans
+        
+        dims = np.array([rooms[name]["dimensions"][:2] for name in names], dtype=np.float64)
+        room_spans = dims.max(axis=1)
+        spans["span_distribution"] = [
+            {"room": name, "span": span} for name, span in zip(names, room_spans.tolist())
+        ]
+        spans["max_span"] = float(room_spans.max())
+        spans["average_span"] = float(room_spans.mean())
         
         return spans
     
-    async def _determine_materials(self, design_2d: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_materials(self, design_2d: Dict[str, Any], flags: FrozenSet[str]) -> Dict[str, Any]:
         """Determine structural materials"""
-        # Get climate recommendations
-        recommendations = climate_data.get("architectural_recommendations", {})
+        humid = "humidity" in flags
         
         # Determine materials based on climate
         materials = {
             "concrete": "standard",
             "steel": "standard",
-            "wood": "treated" if "humidity" in str(recommendations).lower() else "standard"
+            "wood": "treated" if humid else "standard"
         }
         
         # Apply climate-specific modifications
-        if "humidity" in str(recommendations).lower():
+        if humid:
             materials["concrete"] = "waterproof"
             materials["steel"] = "galvanized"
         
-        if "temperature" in str(recommendations).lower():
+        if "temperature" in flags:
             materials["concrete"] = "insulated"
             materials["steel"] = "insulated"
         
         return materials
     
-    async def _analyze_climate_considerations(self, climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_climate_considerations(self, flags: FrozenSet[str]) -> Dict[str, Any]:
         """Analyze climate considerations for structural design"""
-        recommendations = climate_data.get("architectural_recommendations", {})
-        
-        considerations = {
-            "thermal_expansion": "high" if "temperature" in str(recommendations).lower() else "standard",
-            "moisture_protection": "enhanced" if "humidity" in str(recommendations).lower() else "standard",
-            "wind_resistance": "high" if "wind" in str(recommendations).lower() else "standard",
-            "seismic_resistance": "high" if "seismic" in str(recommendations).lower() else "standard"
+        return {
+            "thermal_expansion": "high" if "temperature" in flags else "standard",
+            "moisture_protection": "enhanced" if "humidity" in flags else "standard",
+            "wind_resistance": "high" if "wind" in flags else "standard",
+            "seismic_resistance": "high" if "seismic" in flags else "standard"
         }
-        
-        return considerations
     
-    async def _design_foundation(self, structural_analysis: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_foundation(self, structural_analysis: Dict[str, Any], climate: ClimateView) -> Dict[str, Any]:
         """Design foundation system"""
         loads = structural_analysis.get("loads", {})
         total_load = loads.get("total", 0)
@@ -333,16 +386,15 @@ class StructuralService:
         foundation_area = total_load / 200  # Assume 200 kPa bearing capacity
         
         # Design foundation elements
-        foundation_elements = await self._design_foundation_elements(foundation_type, foundation_area)
+        foundation_elements = self._design_foundation_elements(foundation_type, foundation_area)
         
         return {
             "type": foundation_type,
             "area": foundation_area,
-            "elements": foundation_elements,
-            "specifications": await self._generate_foundation_specifications(foundation_type, foundation_area)
+            "elements": foundation_elements
         }
     
-    async def _design_foundation_elements(self, foundation_type: str, foundation_area: float) -> List[Dict[str, Any]]:
+    def _design_foundation_elements(self, foundation_type: str, foundation_area: float) -> List[Dict[str, Any]]:
         """Design foundation elements"""
         elements = []
         
@@ -376,159 +428,81 @@ class StructuralService:
         
         return elements
     
-    async def _design_structural_frame(self, structural_analysis: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_structural_frame(
+        self,
+        structural_analysis: Dict[str, Any],
+        climate: ClimateView,
+        connections: Tuple[Dict[str, Any], ...]
+    ) -> Dict[str, Any]:
         """Design structural frame"""
         structural_system = structural_analysis.get("structural_system", "steel_frame")
         spans = structural_analysis.get("spans", {})
         max_span = spans.get("max_span", 6.0)
         
         # Design beams
-        beams = await self._design_beams(structural_system, max_span)
+        beams = self._design_beams(structural_system, max_span)
         
         # Design columns
-        columns = await self._design_columns(structural_system, max_span)
-        
-        # Design connections
-        connections = await self._design_frame_connections(structural_system)
+        columns = self._design_columns(structural_system, max_span)
         
         return {
             "system": structural_system,
             "beams": beams,
             "columns": columns,
-            "connections": connections,
-            "specifications": await self._generate_frame_specifications(structural_system, max_span)
+            "connections": connections
         }
     
-    async def _design_beams(self, structural_system: str, max_span: float) -> List[Dict[str, Any]]:
+    def _design_beams(self, structural_system: str, max_span: float) -> List[Dict[str, Any]]:
         """Design structural beams"""
-        beams = []
-        
-        if structural_system == "steel_frame":
-            # Design steel beams
-            beam_depth = max_span / 20  # Simplified rule
-            beams.append({
-                "type": "steel_beam",
-                "depth": beam_depth,
-                "width": 0.2,
-                "span": max_span,
-                "material": "steel",
-                "grade": "S275"
-            })
-        
-        elif structural_system == "concrete_frame":
-            # Design concrete beams
-            beam_depth = max_span / 12  # Simplified rule
-            beams.append({
-                "type": "concrete_beam",
-                "depth": beam_depth,
-                "width": 0.3,
-                "span": max_span,
-                "material": "concrete",
-                "grade": "C25"
-            })
+        if structural_system not in BEAM_PARAMS:
+            return []
         
-        elif structural_system == "wood_frame":
-            # Design wood beams
-            beam_depth = max_span / 15  # Simplified rule
-            beams.append({
-                "type": "wood_beam",
-                "depth": beam_depth,
-                "width": 0.2,
-                "span": max_span,
-                "material": "wood",
-                "grade": "C24"
-            })
-        
-        return beams
+        # Beam depth follows a span/depth ratio per material (simplified rule)
+        span_ratio, width, material, grade, beam_type = BEAM_PARAMS[structural_system]
+        return [{
+            "type": beam_type,
+            "depth": max_span / span_ratio,
+            "width": width,
+            "span": max_span,
+            "material": material,
+            "grade": grade
+        }]
     
-    async def _design_columns(self, structural_system: str, max_span: float) -> List[Dict[str, Any]]:
+    def _design_columns(self, structural_system: str, max_span: float) -> List[Dict[str, Any]]:
         """Design structural columns"""
-        columns = []
-        
-        if structural_system == "steel_frame":
-            # Design steel columns
-            column_size = 0.2  # Simplified
-            columns.append({
-                "type": "steel_column",
-                "size": column_size,
-                "height": 3.5,
-                "material": "steel",
-                "grade": "S275"
-            })
-        
-        elif structural_system == "concrete_frame":
-            # Design concrete columns
-            column_size = 0.3  # Simplified
-            columns.append({
-                "type": "concrete_column",
-                "size": column_size,
-                "height": 3.5,
-                "material": "concrete",
-                "grade": "C25"
-            })
-        
-        elif structural_system == "wood_frame":
-            # Design wood columns
-            column_size = 0.2  # Simplified
-            columns.append({
-                "type": "wood_column",
-                "size": column_size,
-                "height": 3.5,
-                "material": "wood",
-                "grade": "C24"
-            })
-        
-        return columns
-    
-    async def _design_frame_connections(self, structural_system: str) -> List[Dict[str, Any]]:
-        """Design frame connections"""
-        connections = []
-        
-        if structural_system == "steel_frame":
-            connections.append({
-                "type": "steel_connection",
-                "method": "welded",
-                "strength": "full_strength"
-            })
-        
-        elif structural_system == "concrete_frame":
-            connections.append({
-                "type": "concrete_connection",
-                "method": "monolithic",
-                "strength": "full_strength"
-            })
-        
-        elif structural_system == "wood_frame":
-            connections.append({
-                "type": "wood_connection",
-                "method": "bolted",
-                "strength": "partial_strength"
-            })
+        if structural_system not in COLUMN_PARAMS:
+            return []
         
-        return connections
+        column_size, material, grade, column_type = COLUMN_PARAMS[structural_system]
+        return [{
+            "type": column_type,
+            "size": column_size,
+            "height": 3.5,
+            "material": material,
+            "grade": grade
+        }]
     
-    async def _design_roof_structure(self, structural_analysis: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_roof_structure(self, structural_analysis: Dict[str, Any], climate: ClimateView) -> Dict[str, Any]:
         """Design roof structure"""
         spans = structural_analysis.get("spans", {})
         max_span = spans.get("max_span", 6.0)
         
         # Design roof beams
-        roof_beams = await self._design_roof_beams(max_span)
+        roof_beams = self._design_roof_beams(max_span)
         
         # Design roof deck
-        roof_deck = await self._design_roof_deck(max_span)
+        roof_deck = self._design_roof_deck(max_span)
         
         # Design roof connections
-        roof_connections = await self._design_roof_connections()
+        roof_connections = self._design_roof_connections()
         
         return {
             "beams": roof_beams,
             "deck": roof_deck,
-            "connections": roof_connections,
-            "specifications": await self._generate_roof_specifications(max_span)
+            "connections": roof_connections
         }
     
-    async def _design_roof_beams(self, max_span: float) -> List[Dict[str, Any]]:
+    def _design_roof_beams(self, max_span: float) -> List[Dict[str, Any]]:
         """Design roof beams"""
         beam_depth = max_span / 20  # Simplified rule
         
@@ -541,78 +515,42 @@ class StructuralService:
             "grade": "S275"
         }]
     
-    async def _design_roof_deck(self, max_span: float) -> Dict[str, Any]:
+    def _design_roof_deck(self, max_span: float) -> Dict[str, Any]:
         """Design roof deck"""
-        return {
-            "type": "steel_deck",
-            "thickness": 0.075,
-            "span": max_span,
-            "material": "steel",
-            "insulation": "standard"
-        }
+        return {**ROOF_DECK, "span": max_span}
     
-    async def _design_roof_connections(self) -> List[Dict[str, Any]]:
+    def _design_roof_connections(self) -> Tuple[Dict[str, Any], ...]:
         """Design roof connections"""
-        return [{
-            "type": "roof_connection",
-            "method": "welded",
-            "strength": "full_strength"
-        }]
+        return ROOF_CONNECTIONS
     
-    async def _design_connections(self, structural_analysis: Dict[str, Any], climate_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_connections(self, structural_analysis: Dict[str, Any], climate: ClimateView) -> Dict[str, Any]:
         """Design structural connections"""
         structural_system = structural_analysis.get("structural_system", "steel_frame")
         
         # Design beam-column connections
-        beam_column_connections = await self._design_beam_column_connections(structural_system)
+        beam_column_connections = self._design_beam_column_connections(structural_system)
         
         # Design foundation connections
-        foundation_connections = await self._design_foundation_connections(structural_system)
+        foundation_connections = self._design_foundation_connections(structural_system)
         
         # Design roof connections
-        roof_connections = await self._design_roof_connections()
+        roof_connections = self._design_roof_connections()
         
         return {
             "beam_column": beam_column_connections,
             "foundation": foundation_connections,
-            "roof": roof_connections,
-            "specifications": await self._generate_connection_specifications(structural_system)
+            "roof": roof_connections
         }
     
-    async def _design_beam_column_connections(self, structural_system: str) -> List[Dict[str, Any]]:
+    def _design_beam_column_connections(self, structural_system: str) -> Tuple[Dict[str, Any], ...]:
         """Design beam-column connections"""
-        if structural_system == "steel_frame":
-            return [{
-                "type": "steel_connection",
-                "method": "welded",
-                "strength": "full_strength",
-                "details": "standard"
-            }]
-        elif structural_system == "concrete_frame":
-            return [{
-                "type": "concrete_connection",
-                "method": "monolithic",
-                "strength": "full_strength",
-                "details": "standard"
-            }]
-        else:
-            return [{
-                "type": "wood_connection",
-                "method": "bolted",
-                "strength": "partial_strength",
-                "details": "standard"
-            }]
+        return _beam_column_connections(structural_system)
     
-    async def _design_foundation_connections(self, structural_system: str) -> List[Dict[str, Any]]:
+    def _design_foundation_connections(self, structural_system: str) -> Tuple[Dict[str, Any], ...]:
         """Design foundation connections"""
-        return [{
-            "type": "foundation_connection",
-            "method": "embedded",
-            "strength": "full_strength",
-            "details": "standard"
-        }]
+        return FOUNDATION_CONNECTIONS
     
-    async def _generate_structural_drawings(
+    def _generate_structural_drawings(
         self, 
         foundation_design: Dict[str, Any], 
         frame_design: Dict[str, Any], 
@@ -634,7 +572,7 @@ class StructuralService:
             "roof_plan": {
                 "type": "plan",
                 "scale": "1:100",
-                "elements": roof_design.get("beams", []) + roof_design.get("deck", {})
+                "elements": roof_design.get("beams", []) + [roof_design.get("deck", {})]
             },
             "sections": {
                 "type": "section",
@@ -643,46 +581,25 @@ class StructuralService:
             }
         }
     
-    async def _generate_structural_specifications(self, structural_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate structural specifications"""
-        return {
-            "materials": structural_analysis.get("materials", {}),
-            "loads": structural_analysis.get("loads", {}),
-            "climate_considerations": structural_analysis.get("climate_considerations", {}),
-            "codes": ["IBC", "ASCE", "AISC", "ACI"],
-            "standards": ["ASTM", "AISC", "ACI"]
-        }
-    
-    async def _generate_foundation_specifications(self, foundation_type: str, foundation_area: float) -> Dict[str, Any]:
-        """Generate foundation specifications"""
-        return {
-            "type": foundation_type,
-            "area": foundation_area,
-            "materials": ["concrete", "steel", "insulation"],
-            "specifications": ["ACI 318", "IBC"]
-        }
-    
-    async def _generate_frame_specifications(self, structural_system: str, max_span: float) -> Dict[str, Any]:
-        """Generate frame specifications"""
-        return {
-            "system": structural_system,
-            "max_span": max_span,
-            "materials": ["steel", "concrete", "wood"],
-            "specifications": ["AISC", "ACI", "NDS"]
-        }
-    
-    async def _generate_roof_specifications(self, max_span: float) -> Dict[str, Any]:
-        """Generate roof specifications"""
-        return {
-            "max_span": max_span,
-            "materials": ["steel", "insulation", "membrane"],
-            "specifications": ["AISC", "ASTM"]
-        }
-    
-    async def _generate_connection_specifications(self, structural_system: str) -> Dict[str, Any]:
-        """Generate connection specifications"""
+    def _build_all_specs(
+        self, structural_analysis: Dict[str, Any], foundation_design: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate the structural, foundation, frame, roof and connection specifications"""
+        structural_system = structural_analysis.get("structural_system", "steel_frame")
+        max_span = structural_analysis.get("spans", {}).get("max_span", 6.0)
         return {
-            "system": structural_system,
-            "materials": ["steel", "concrete", "wood"],
-            "specifications": ["AISC", "ACI", "NDS"]
+            "structural": {
+                "materials": structural_analysis.get("materials", {}),
+                "loads": structural_analysis.get("loads", {}),
+                "climate_considerations": structural_analysis.get("climate_considerations", {}),
+                **STRUCTURAL_SPECIFICATIONS
+            },
+            "foundation": {
+                "type": foundation_design["type"],
+                "area": foundation_design["area"],
+                **FOUNDATION_SPECIFICATIONS
+            },
+            "frame": {"system": structural_system, "max_span": max_span, **FRAME_SPECIFICATIONS},
+            "roof": {"max_span": max_span, **ROOF_SPECIFICATIONS},
+            "connections": {"system": structural_system, **CONNECTION_SPECIFICATIONS}
         }
@@ -2,68 +2,175 @@
 Architectural Style Detector - AI-powered style analysis
 """
 
-import cv2
+import asyncio
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
 import numpy as np
-from typing import Dict, Any, List, Tuple
-import json
-import os
+from cachetools import LRUCache
+from functools import lru_cache, reduce
+from operator import or_
+from typing import Dict, Any, List, Optional, Tuple
 from ai_models.style_classifier import StyleClassifier
 
+# Street-view headings around a site overlap and sites get re-analyzed, so image
+# features are memoized by image content
+FEATURE_CACHE_SIZE = 1024
+
+def _image_fingerprint(image_data: Dict[str, Any]) -> Optional[Any]:
+    """64-bit content hash of an image, its URL when the content is unavailable"""
+    content = image_data.get("bytes")
+    if content is None and image_data.get("image_path"):
+        try:
+            with open(image_data["image_path"], "rb") as f:
+                content = f.read()
+        except OSError:
+            content = None
+    if content is not None:
+        return hashlib.blake2b(content, digest_size=8).digest()
+    return image_data.get("image_url")
+
+# Canonical style order; per-source scores are vectors indexed by it
+STYLES = ("Traditional", "Modern", "Contemporary", "Mediterranean", "Colonial")
+STYLE_INDEX = {style: index for index, style in enumerate(STYLES)}
+
+# Weight of each source in the combined style scores
+IMAGE_WEIGHT = 0.4
+BUILDING_WEIGHT = 0.4
+REGIONAL_WEIGHT = 0.2
+
+def _style_vector(scores: Dict[str, float]) -> np.ndarray:
+    """Style scores as a vector in STYLES order"""
+    vector = np.zeros(len(STYLES))
+    for style, score in scores.items():
+        vector[STYLE_INDEX[style]] = score
+    return vector
+
+@dataclass(frozen=True, slots=True)
+class StyleInfo:
+    """Reference description of an architectural style"""
+    characteristics: Tuple[str, ...]
+    materials: Tuple[str, ...]
+    colors: Tuple[str, ...]
+    regions: Tuple[str, ...]
+
+# Architectural style database, built once at import and shared by every detector
+STYLE_DATABASE = {
+    "Traditional": StyleInfo(
+        characteristics=(
+            "Pitched roofs", "Symmetrical facades", "Classical proportions",
+            "Traditional materials", "Decorative elements"
+        ),
+        materials=("Brick", "Stone", "Wood", "Traditional masonry"),
+        colors=("Earth tones", "Natural materials", "Traditional colors"),
+        regions=("Europe", "North America", "Traditional areas")
+    ),
+    "Modern": StyleInfo(
+        characteristics=(
+            "Clean lines", "Minimal ornamentation", "Large windows",
+            "Open floor plans", "Flat roofs"
+        ),
+        materials=("Concrete", "Glass", "Steel", "Modern composites"),
+        colors=("White", "Gray", "Black", "Neutral colors"),
+        regions=("Urban areas", "Contemporary developments")
+    ),
+    "Contemporary": StyleInfo(
+        characteristics=(
+            "Innovative forms", "Sustainable design", "Technology integration",
+            "Mixed materials", "Dynamic shapes"
+        ),
+        materials=("Recycled materials", "Smart materials", "Sustainable options"),
+        colors=("Bold colors", "Natural materials", "High contrast"),
+        regions=("Modern cities", "Innovation districts")
+    ),
+    "Mediterranean": StyleInfo(
+        characteristics=(
+            "Stucco walls", "Tile roofs", "Arched openings",
+            "Outdoor living", "Warm colors"
+        ),
+        materials=("Stucco", "Tile", "Stone", "Wood"),
+        colors=("Warm earth tones", "Terracotta", "Cream"),
+        regions=("Mediterranean", "California", "Similar climates")
+    ),
+    "Colonial": StyleInfo(
+        characteristics=(
+            "Symmetrical design", "Central entrance", "Classical columns",
+            "Traditional windows", "Formal proportions"
+        ),
+        materials=("Brick", "Wood", "Stone", "Traditional masonry"),
+        colors=("White", "Traditional colors", "Classical palette"),
+        regions=("Historical areas", "Traditional neighborhoods")
+    )
+}
+
+# Each distinct characteristic gets a bit, so a set of styles unions with int OR
+CHARACTERISTICS = tuple(dict.fromkeys(
+    element for info in STYLE_DATABASE.values() for element in info.characteristics
+))
+_CHARACTERISTIC_BITS = {element: 1 << index for index, element in enumerate(CHARACTERISTICS)}
+STYLE_CHARACTERISTIC_MASKS = {
+    style: reduce(or_, (_CHARACTERISTIC_BITS[element] for element in info.characteristics), 0)
+    for style, info in STYLE_DATABASE.items()
+}
+
+# Place types that mark a building's style, checked in order; anything else is Modern
+BUILDING_TYPE_STYLES = (
+    ("Traditional", frozenset({"church", "place_of_worship"})),
+    ("Modern", frozenset({"shopping_mall", "store"})),
+    ("Contemporary", frozenset({"hospital", "school"}))
+)
+DEFAULT_BUILDING_STYLE = "Modern"
+
+# Styles common in each region, most common first
+REGION_COMMON_STYLES = {
+    "North America": ("Traditional", "Modern", "Colonial"),
+    "Europe": ("Traditional", "Mediterranean", "Modern"),
+    "Asia-Pacific": ("Traditional", "Modern", "Contemporary"),
+    "Other": ("Modern", "Contemporary", "Traditional")
+}
+
+# Weighted regional contribution per region: a fixed nudge to each common style
+REGIONAL_NUDGES = {
+    region: _style_vector(dict.fromkeys(styles, 0.1 * REGIONAL_WEIGHT))
+    for region, styles in REGION_COMMON_STYLES.items()
+}
+
+CULTURAL_INFLUENCES = {
+    "North America": ("European", "Indigenous", "Modern American"),
+    "Europe": ("Classical", "Medieval", "Renaissance", "Modern"),
+    "Asia-Pacific": ("Traditional Asian", "Colonial", "Modern"),
+    "Other": ("Global", "Modern", "Contemporary")
+}
+DEFAULT_CULTURAL_INFLUENCES = ("Global", "Modern")
+
+def _region_of(lat: float, lon: float) -> str:
+    """Broad architectural region containing a coordinate"""
+    if 25 <= lat <= 50 and -125 <= lon <= -65:
+        return "North America"
+    if 35 <= lat <= 70 and -10 <= lon <= 40:
+        return "Europe"
+    if -35 <= lat <= 35 and 100 <= lon <= 180:
+        return "Asia-Pacific"
+    return "Other"
+
+# Regional context depends only on the region, so each one is built once and shared.
+# Callers must treat the returned dict as read-only.
+@lru_cache(maxsize=None)
+def _regional_context(region: str) -> Dict[str, Any]:
+    """Regional architectural context for a region"""
+    return {
+        "region": region,
+        "common_styles": REGION_COMMON_STYLES[region],
+        "cultural_influences": CULTURAL_INFLUENCES.get(region, DEFAULT_CULTURAL_INFLUENCES)
+    }
+
 class ArchitecturalStyleDetector:
+    style_database = STYLE_DATABASE
+    
     def __init__(self):
         self.style_classifier = StyleClassifier()
-        self.style_database = self._load_style_database()
+        self._feature_cache = LRUCache(maxsize=FEATURE_CACHE_SIZE)
         
-    def _load_style_database(self) -> Dict[str, Any]:
-        """Load architectural style database"""
-        return {
-            "Traditional": {
-                "characteristics": [
-                    "Pitched roofs", "Symmetrical facades", "Classical proportions",
-                    "Traditional materials", "Decorative elements"
-                ],
-                "materials": ["Brick", "Stone", "Wood", "Traditional masonry"],
-                "colors": ["Earth tones", "Natural materials", "Traditional colors"],
-                "regions": ["Europe", "North America", "Traditional areas"]
-            },
-            "Modern": {
-                "characteristics": [
-                    "Clean lines", "Minimal ornamentation", "Large windows",
-                    "Open floor plans", "Flat roofs"
-                ],
-                "materials": ["Concrete", "Glass", "Steel", "Modern composites"],
-                "colors": ["White", "Gray", "Black", "Neutral colors"],
-                "regions": ["Urban areas", "Contemporary developments"]
-            },
-            "Contemporary": {
-                "characteristics": [
-                    "Innovative forms", "Sustainable design", "Technology integration",
-                    "Mixed materials", "Dynamic shapes"
-                ],
-                "materials": ["Recycled materials", "Smart materials", "Sustainable options"],
-                "colors": ["Bold colors", "Natural materials", "High contrast"],
-                "regions": ["Modern cities", "Innovation districts"]
-            },
-            "Mediterranean": {
-                "characteristics": [
-                    "Stucco walls", "Tile roofs", "Arched openings",
-                    "Outdoor living", "Warm colors"
-                ],
-                "materials": ["Stucco", "Tile", "Stone", "Wood"],
-                "colors": ["Warm earth tones", "Terracotta", "Cream"],
-                "regions": ["Mediterranean", "California", "Similar climates"]
-            },
-            "Colonial": {
-                "characteristics": [
-                    "Symmetrical design", "Central entrance", "Classical columns",
-                    "Traditional windows", "Formal proportions"
-                ],
-                "materials": ["Brick", "Wood", "Stone", "Traditional masonry"],
-                "colors": ["White", "Traditional colors", "Classical palette"],
-                "regions": ["Historical areas", "Traditional neighborhoods"]
-            }
-        }
-    
     async def analyze_architectural_style(
         self, 
         street_view_images: List[Dict[str, Any]], 
@@ -72,14 +179,12 @@ class ArchitecturalStyleDetector:
     ) -> Dict[str, Any]:
         """Analyze architectural style from images and building data"""
         
-        # Analyze street view images
-        image_analysis = await self._analyze_street_view_images(street_view_images)
-        
-        # Analyze nearby buildings
-        building_analysis = await self._analyze_nearby_buildings(nearby_buildings)
-        
-        # Get regional context
-        regional_context = await self._get_regional_context(coordinates)
+        # Images, nearby buildings and regional context are independent analyses
+        image_analysis, building_analysis, regional_context = await asyncio.gather(
+            self._analyze_street_view_images(street_view_images),
+            self._analyze_nearby_buildings(nearby_buildings),
+            self._get_regional_context(coordinates)
+        )
         
         # Combine analyses
         combined_analysis = self._combine_analyses(
@@ -88,40 +193,42 @@ class ArchitecturalStyleDetector:
         
         return combined_analysis
     
+    def analyze_architectural_style_sync(
+        self, 
+        street_view_images: List[Dict[str, Any]], 
+        nearby_buildings: List[Dict[str, Any]], 
+        coordinates: Tuple[float, float]
+    ) -> Dict[str, Any]:
+        """Run the style analysis to completion outside an event loop"""
+        return asyncio.run(self.analyze_architectural_style(
+            street_view_images, nearby_buildings, coordinates
+        ))
+    
     async def _analyze_street_view_images(self, images: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze architectural style from street view images"""
         if not images:
             return {"primary_style": "Unknown", "confidence": 0.0}
         
-        style_scores = {}
-        total_confidence = 0
-        
-        for image_data in images:
-            # Extract features from image
-            features = await self._extract_architectural_features(image_data)
-            
-            # Classify style
-            style_prediction = await self.style_classifier.classify_style(features)
-            
-            # Accumulate scores
-            for style, confidence in style_prediction.items():
-                if style not in style_scores:
-                    style_scores[style] = 0
-                style_scores[style] += confidence
-                total_confidence += confidence
+        # Extract features from every image, then classify them in one batch
+        features = await asyncio.gather(
+            *(self._extract_architectural_features(image_data) for image_data in images)
+        )
+        predictions = await self.style_classifier.classify_style_batch(list(features))
         
-        # Normalize scores
+        # Accumulate and normalize scores
+        scores = predictions.sum(axis=0)
+        total_confidence = scores.sum()
         if total_confidence > 0:
-            for style in style_scores:
-                style_scores[style] /= total_confidence
+            scores /= total_confidence
+        style_scores = dict(zip(self.style_classifier.style_classes, scores.tolist()))
         
         # Find primary style
-        primary_style = max(style_scores.items(), key=lambda x: x[1])
+        primary_style = self.style_classifier.style_classes[int(scores.argmax())]
         
         return {
-            "primary_style": primary_style[0],
+            "primary_style": primary_style,
             "style_scores": style_scores,
-            "confidence": primary_style[1],
+            "confidence": style_scores[primary_style],
             "characteristic_elements": self._identify_characteristic_elements(style_scores)
         }
     
@@ -130,57 +237,24 @@ class ArchitecturalStyleDetector:
         if not buildings:
             return {"primary_style": "Unknown", "confidence": 0.0}
         
-        style_counts = {}
         total_buildings = len(buildings)
+        style_counts = Counter(self._classify_building_style(building) for building in buildings)
         
-        for building in buildings:
-            # Analyze building type and characteristics
-            building_style = await self._classify_building_style(building)
-            
-            if building_style in style_counts:
-                style_counts[building_style] += 1
-            else:
-                style_counts[building_style] = 1
-        
-        # Calculate style percentages
-        style_percentages = {
-            style: count / total_buildings 
-            for style, count in style_counts.items()
-        }
-        
-        # Find dominant style
-        dominant_style = max(style_percentages.items(), key=lambda x: x[1])
+        # Dominant style, ties going to the style seen first
+        dominant_style, dominant_count = style_counts.most_common(1)[0]
         
         return {
-            "primary_style": dominant_style[0],
-            "style_distribution": style_percentages,
-            "confidence": dominant_style[1],
+            "primary_style": dominant_style,
+            "style_distribution": {
+                style: count / total_buildings for style, count in style_counts.items()
+            },
+            "confidence": dominant_count / total_buildings,
             "building_count": total_buildings
         }
     
     async def _get_regional_context(self, coordinates: Tuple[float, float]) -> Dict[str, Any]:
         """Get regional architectural context"""
-        lat, lon = coordinates
-        
-        # Determine region based on coordinates
-        if 25 <= lat <= 50 and -125 <= lon <= -65:  # North America
-            region = "North America"
-            common_styles = ["Traditional", "Modern", "Colonial"]
-        elif 35 <= lat <= 70 and -10 <= lon <= 40:  # Europe
-            region = "Europe"
-            common_styles = ["Traditional", "Mediterranean", "Modern"]
-        elif -35 <= lat <= 35 and 100 <= lon <= 180:  # Asia-Pacific
-            region = "Asia-Pacific"
-            common_styles = ["Traditional", "Modern", "Contemporary"]
-        else:
-            region = "Other"
-            common_styles = ["Modern", "Contemporary", "Traditional"]
-        
-        return {
-            "region": region,
-            "common_styles": common_styles,
-            "cultural_influences": self._get_cultural_influences(region)
-        }
+        return _regional_context(_region_of(*coordinates))
     
     def _combine_analyses(
         self, 
@@ -190,54 +264,57 @@ class ArchitecturalStyleDetector:
     ) -> Dict[str, Any]:
         """Combine different analyses to determine final architectural style"""
         
-        # Weight different analyses
-        image_weight = 0.4
-        building_weight = 0.4
-        regional_weight = 0.2
-        
-        # Combine style scores
-        combined_scores = {}
+        image_styles = image_analysis.get("style_scores", {})
+        building_styles = building_analysis.get("style_distribution", {})
+        common_styles = regional_context["common_styles"]
         
-        # Add image analysis scores
-        if "style_scores" in image_analysis:
-            for style, score in image_analysis["style_scores"].items():
-                combined_scores[style] = score * image_weight
+        image_scores = _style_vector(image_styles)
+        building_scores = _style_vector(building_styles)
         
-        # Add building analysis scores
-        if "style_distribution" in building_analysis:
-            for style, score in building_analysis["style_distribution"].items():
-                if style in combined_scores:
-                    combined_scores[style] += score * building_weight
-                else:
-                    combined_scores[style] = score * building_weight
+        # Ties go to the style reported first: images, then buildings, then the region
+        seen_styles = list(dict.fromkeys([*image_styles, *building_styles, *common_styles]))
+        first_seen = _style_vector({style: rank for rank, style in enumerate(seen_styles)})
         
-        # Add regional context
-        for style in regional_context["common_styles"]:
-            if style in combined_scores:
-                combined_scores[style] += 0.1 * regional_weight
-            else:
-                combined_scores[style] = 0.1 * regional_weight
+        # Weighted sum of the three sources; the region only nudges its common styles
+        combined = (
+            image_scores * IMAGE_WEIGHT
+            + building_scores * BUILDING_WEIGHT
+            + REGIONAL_NUDGES[regional_context["region"]]
+        )
         
         # Find primary and secondary styles
-        sorted_styles = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        primary_style = sorted_styles[0][0] if sorted_styles else "Unknown"
-        secondary_styles = [style for style, _ in sorted_styles[1:3]]
+        ranked = [STYLES[index] for index in np.lexsort((first_seen, -combined))]
+        ranked = [style for style in ranked if style in seen_styles]
+        primary_style = ranked[0] if ranked else "Unknown"
+        secondary_styles = ranked[1:3]
         
         # Calculate confidence
-        total_score = sum(combined_scores.values())
-        confidence = combined_scores.get(primary_style, 0) / total_score if total_score > 0 else 0
+        total_score = combined.sum()
+        confidence = float(combined[STYLE_INDEX[primary_style]] / total_score) if total_score > 0 else 0
         
         return {
             "primary_style": primary_style,
             "secondary_styles": secondary_styles,
             "confidence": confidence,
-            "style_scores": combined_scores,
+            "style_scores": {style: float(combined[STYLE_INDEX[style]]) for style in seen_styles},
             "characteristic_elements": self._get_characteristic_elements(primary_style),
             "regional_context": regional_context
         }
     
     async def _extract_architectural_features(self, image_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract architectural features from image, reusing those of an identical image"""
+        key = _image_fingerprint(image_data)
+        if key is None:
+            return await self._compute_architectural_features(image_data)
+        
+        # Cached feature dicts are shared and must be treated as read-only
+        features = self._feature_cache.get(key)
+        if features is None:
+            features = await self._compute_architectural_features(image_data)
+            self._feature_cache[key] = features
+        return features
+    
+    async def _compute_architectural_features(self, image_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract architectural features from image"""
         # This would typically involve computer vision analysis
         # For now, we'll return simulated features
@@ -250,44 +327,54 @@ class ArchitecturalStyleDetector:
             "proportions": "classical"
         }
     
-    async def _classify_building_style(self, building: Dict[str, Any]) -> str:
+    def _classify_building_style(self, building: Dict[str, Any]) -> str:
         """Classify building style based on building data"""
         # This would typically involve analyzing building characteristics
         # For now, we'll return a simulated classification
-        building_types = building.get("types", [])
+        building_types = building.get("types", ())
         
-        if "church" in building_types or "place_of_worship" in building_types:
-            return "Traditional"
-        elif "shopping_mall" in building_types or "store" in building_types:
-            return "Modern"
-        elif "hospital" in building_types or "school" in building_types:
-            return "Contemporary"
-        else:
-            return "Modern"  # Default
+        for style, type_set in BUILDING_TYPE_STYLES:
+            if not type_set.isdisjoint(building_types):
+                return style
+        return DEFAULT_BUILDING_STYLE
     
     def _identify_characteristic_elements(self, style_scores: Dict[str, float]) -> List[str]:
         """Identify characteristic elements based on style scores"""
-        elements = []
-        
+        mask = 0
         for style, score in style_scores.items():
             if score > 0.3:  # Threshold for significant presence
-                style_info = self.style_database.get(style, {})
-                elements.extend(style_info.get("characteristics", []))
+                mask |= STYLE_CHARACTERISTIC_MASKS.get(style, 0)
         
-        return list(set(elements))  # Remove duplicates
+        # Set bits name each element once, in database order
+        return [element for index, element in enumerate(CHARACTERISTICS) if mask >> index & 1]
     
-    def _get_characteristic_elements(self, primary_style: str) -> List[str]:
+    def _get_characteristic_elements(self, primary_style: str) -> Tuple[str, ...]:
         """Get characteristic elements for a specific style"""
-        style_info = self.style_database.get(primary_style, {})
-        return style_info.get("characteristics", [])
+        style_info = self.style_database.get(primary_style)
+        return style_info.characteristics if style_info else ()
     
-    def _get_cultural_influences(self, region: str) -> List[str]:
+    def _get_cultural_influences(self, region: str) -> Tuple[str, ...]:
         """Get cultural influences for a region"""
-        cultural_map = {
-            "North America": ["European", "Indigenous", "Modern American"],
-            "Europe": ["Classical", "Medieval", "Renaissance", "Modern"],
-            "Asia-Pacific": ["Traditional Asian", "Colonial", "Modern"],
-            "Other": ["Global", "Modern", "Contemporary"]
-        }
-        
-        return cultural_map.get(region, ["Global", "Modern"])
+        return CULTURAL_INFLUENCES.get(region, DEFAULT_CULTURAL_INFLUENCES)
+
+
+# Per-process detector so pool workers load the classifier once
+_worker_detector = None
+
+def init_style_worker() -> None:
+    """Process-pool initializer that loads the classifier before the first task"""
+    global _worker_detector
+    _worker_detector = ArchitecturalStyleDetector()
+
+def analyze_architectural_style_in_worker(
+    street_view_images: List[Dict[str, Any]], 
+    nearby_buildings: List[Dict[str, Any]], 
+    coordinates: Tuple[float, float]
+) -> Dict[str, Any]:
+    """Process-pool entry point for architectural style analysis"""
+    global _worker_detector
+    if _worker_detector is None:
+        _worker_detector = ArchitecturalStyleDetector()
+    return _worker_detector.analyze_architectural_style_sync(
+        street_view_images, nearby_buildings, coordinates
+    )
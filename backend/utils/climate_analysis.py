@@ -2,56 +2,124 @@
 Climate analysis utilities for architectural recommendations
 """
 
-from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
 import math
 
+import numpy as np
+
+# 16-point compass, clockwise from north in 22.5° sectors
+WIND_DIRECTIONS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                   "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+WIND_BEARINGS = {name: index * 22.5 for index, name in enumerate(WIND_DIRECTIONS)}
+WIND_DIRECTION_ARRAY = np.array(WIND_DIRECTIONS)
+
+# Wind speed categories, split at these m/s thresholds
+WIND_SPEED_THRESHOLDS = (2, 5, 10, 15)
+WIND_SPEED_CATEGORIES = ("Light", "Gentle", "Moderate", "Fresh", "Strong")
+WIND_SPEED_CATEGORY_ARRAY = np.array(WIND_SPEED_CATEGORIES)
+
+# Thermal strategy by temperature band (below 18°C, 18-26°C, above 26°C), then humid (>70%)
+THERMAL_STRATEGIES = (
+    ("Passive heating with thermal mass", "Passive heating with humidity control"),
+    ("Natural ventilation and thermal mass", "Natural ventilation and thermal mass"),
+    ("Passive cooling with ventilation", "Passive cooling with dehumidification")
+)
+
+# Ventilation rate: still air, breezy (>5 m/s), humid (>70%, takes precedence)
+VENTILATION_RATES = ("Standard (3-6 ACH)", "Natural (2-4 ACH)", "High (6-12 ACH)")
+
+# Köppen climate zone by temperature band (<=10°C, 10-18°C, >18°C), then
+# precipitation band (<=500, 500-1000, >1000 mm)
+CLIMATE_ZONES = (
+    ("Tundra", "Subarctic", "Subarctic"),
+    ("Temperate Steppe", "Temperate Continental", "Temperate Oceanic"),
+    ("Tropical Savanna", "Tropical Monsoon", "Tropical Rainforest")
+)
+CLIMATE_ZONE_ARRAY = np.array(CLIMATE_ZONES)
+TEMPERATURE_BANDS = (10, 18)       # °C, upper bounds inclusive
+PRECIPITATION_BANDS = (500, 1000)  # mm, upper bounds inclusive
+
+def _monthly_series(months: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """One field of a monthly data list as a float64 array"""
+    return np.fromiter((month[key] for month in months), dtype=np.float64, count=len(months))
+
+def _mean(values: np.ndarray) -> float:
+    """Mean of a monthly series, or 0 when there is no data"""
+    return float(values.mean()) if values.size else 0.0
+
+def aggregate_months(
+    precipitation: np.ndarray, solar: np.ndarray, wind: np.ndarray
+) -> Tuple[float, float, float, float]:
+    """Average and peak precipitation, average solar irradiance and average wind speed"""
+    return (
+        _mean(precipitation), float(precipitation.max()) if precipitation.size else 0.0,
+        _mean(solar), _mean(wind)
+    )
+
+def _circular_mean(bearings: np.ndarray) -> float:
+    """Mean of compass bearings in degrees, averaged as unit vectors"""
+    radians = np.radians(bearings)
+    return float(np.degrees(np.arctan2(np.sin(radians).mean(), np.cos(radians).mean())) % 360)
+
+@dataclass(slots=True)
+class ClimateStats:
+    """Monthly series and their aggregates, extracted once and shared by every analyzer"""
+    precipitation: np.ndarray  # mm
+    solar: np.ndarray          # W/m²
+    wind: np.ndarray           # m/s
+    wind_bearings: np.ndarray  # degrees
+    avg_precipitation: float
+    max_precipitation: float
+    avg_solar: float
+    avg_wind: float
+    
+    @classmethod
+    def from_historical_data(cls, historical_data: Dict[str, Any]) -> "ClimateStats":
+        precipitation = _monthly_series(historical_data.get("precipitation_data", []), "precipitation")
+        solar = _monthly_series(historical_data.get("solar_irradiance", []), "solar_irradiance")
+        wind_data = historical_data.get("wind_data", [])
+        wind = _monthly_series(wind_data, "wind_speed")
+        wind_bearings = np.fromiter(
+            (WIND_BEARINGS[month["wind_direction"]] for month in wind_data
+             if month.get("wind_direction") in WIND_BEARINGS),
+            dtype=np.float64
+        )
+        return cls(
+            precipitation, solar, wind, wind_bearings,
+            *aggregate_months(precipitation, solar, wind)
+        )
+
 def analyze_climate_patterns(
     current_weather: Dict[str, Any],
     historical_data: Dict[str, Any],
     seasonal_patterns: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Analyze climate patterns and generate architectural insights"""
+    stats = ClimateStats.from_historical_data(historical_data)
     
     analysis = {
-        "climate_zone": determine_climate_zone(current_weather, historical_data),
+        "climate_zone": determine_climate_zone(current_weather, stats),
         "thermal_comfort": analyze_thermal_comfort(current_weather, historical_data),
-        "energy_efficiency": analyze_energy_efficiency(current_weather, historical_data),
+        "energy_efficiency": analyze_energy_efficiency(current_weather, stats),
         "ventilation_needs": analyze_ventilation_needs(current_weather, historical_data),
-        "solar_potential": analyze_solar_potential(current_weather, historical_data),
-        "precipitation_impact": analyze_precipitation_impact(historical_data),
-        "wind_patterns": analyze_wind_patterns(current_weather, historical_data)
+        "solar_potential": analyze_solar_potential(current_weather, stats),
+        "precipitation_impact": analyze_precipitation_impact(stats),
+        "wind_patterns": analyze_wind_patterns(current_weather, stats)
     }
     
     return analysis
 
-def determine_climate_zone(current_weather: Dict[str, Any], historical_data: Dict[str, Any]) -> str:
+def determine_climate_zone(current_weather: Dict[str, Any], stats: ClimateStats) -> str:
     """Determine climate zone based on temperature and precipitation patterns"""
     avg_temp = current_weather.get("temperature", 20)
-    precipitation = historical_data.get("precipitation_data", [])
-    
-    # Calculate average annual precipitation
-    avg_precipitation = sum([month["precipitation"] for month in precipitation]) / 12 if precipitation else 0
+    avg_precipitation = stats.avg_precipitation
     
     # Köppen climate classification
-    if avg_temp > 18:
-        if avg_precipitation > 1000:
-            return "Tropical Rainforest"
-        elif avg_precipitation > 500:
-            return "Tropical Monsoon"
-        else:
-            return "Tropical Savanna"
-    elif avg_temp > 10:
-        if avg_precipitation > 1000:
-            return "Temperate Oceanic"
-        elif avg_precipitation > 500:
-            return "Temperate Continental"
-        else:
-            return "Temperate Steppe"
-    else:
-        if avg_precipitation > 500:
-            return "Subarctic"
-        else:
-            return "Tundra"
+    return CLIMATE_ZONES[bisect_left(TEMPERATURE_BANDS, avg_temp)][
+        bisect_left(PRECIPITATION_BANDS, avg_precipitation)
+    ]
 
 def analyze_thermal_comfort(current_weather: Dict[str, Any], historical_data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze thermal comfort requirements"""
@@ -76,26 +144,12 @@ def analyze_thermal_comfort(current_weather: Dict[str, Any], historical_data: Di
 
 def get_thermal_strategy(temperature: float, humidity: float) -> str:
     """Determine thermal strategy based on temperature and humidity"""
-    if temperature > 26:
-        if humidity > 70:
-            return "Passive cooling with dehumidification"
-        else:
-            return "Passive cooling with ventilation"
-    elif temperature < 18:
-        if humidity > 70:
-            return "Passive heating with humidity control"
-        else:
-            return "Passive heating with thermal mass"
-    else:
-        return "Natural ventilation and thermal mass"
+    return THERMAL_STRATEGIES[int(temperature >= 18) + int(temperature > 26)][int(humidity > 70)]
 
-def analyze_energy_efficiency(current_weather: Dict[str, Any], historical_data: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_energy_efficiency(current_weather: Dict[str, Any], stats: ClimateStats) -> Dict[str, Any]:
     """Analyze energy efficiency opportunities"""
     temp = current_weather.get("temperature", 20)
-    solar_irradiance = historical_data.get("solar_irradiance", [])
-    
-    # Calculate average solar irradiance
-    avg_solar = sum([month["solar_irradiance"] for month in solar_irradiance]) / 12 if solar_irradiance else 0
+    avg_solar = stats.avg_solar
     
     return {
         "solar_potential": avg_solar,
@@ -118,34 +172,34 @@ def analyze_ventilation_needs(current_weather: Dict[str, Any], historical_data:
 
 def calculate_ventilation_rate(humidity: float, wind_speed: float) -> str:
     """Calculate required ventilation rate"""
-    if humidity > 70:
-        return "High (6-12 ACH)"
-    elif wind_speed > 5:
-        return "Natural (2-4 ACH)"
-    else:
-        return "Standard (3-6 ACH)"
+    return VENTILATION_RATES[2 if humidity > 70 else int(wind_speed > 5)]
 
-def analyze_solar_potential(current_weather: Dict[str, Any], historical_data: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_solar_potential(current_weather: Dict[str, Any], stats: ClimateStats) -> Dict[str, Any]:
     """Analyze solar energy potential"""
-    solar_data = historical_data.get("solar_irradiance", [])
-    
-    if not solar_data:
+    if not stats.solar.size:
         return {"potential": "Unknown", "orientation": "South", "tilt": 30}
     
-    avg_solar = sum([month["solar_irradiance"] for month in solar_data]) / 12
+    avg_solar = stats.avg_solar
     
     return {
         "potential": "High" if avg_solar > 1000 else "Medium" if avg_solar > 500 else "Low",
         "orientation": "South",
-        "tilt": calculate_optimal_tilt(solar_data),
+        "tilt": calculate_optimal_tilt(stats.solar),
         "shading_considerations": avg_solar < 800
     }
 
-def calculate_optimal_tilt(solar_data: List[Dict[str, Any]]) -> int:
+# Month indices of summer (Jun-Aug) and winter (Dec-Feb), which wraps the year end
+SUMMER_MONTHS = slice(5, 8)
+WINTER_MONTHS = np.array([11, 0, 1])
+
+def calculate_optimal_tilt(solar: np.ndarray) -> int:
     """Calculate optimal solar panel tilt angle"""
+    if solar.size < 12:
+        return 30  # Not a full year of data
+    
     # Simplified calculation based on seasonal variation
-    summer_irradiance = sum([month["solar_irradiance"] for month in solar_data[5:8]]) / 3
-    winter_irradiance = sum([month["solar_irradiance"] for month in solar_data[11:2]]) / 3
+    summer_irradiance = solar[SUMMER_MONTHS].mean()
+    winter_irradiance = solar[WINTER_MONTHS].mean()
     
     if summer_irradiance > winter_irradiance * 1.5:
         return 20  # Favor summer generation
@@ -154,15 +208,13 @@ def calculate_optimal_tilt(solar_data: List[Dict[str, Any]]) -> int:
     else:
         return 30  # Balanced
 
-def analyze_precipitation_impact(historical_data: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_precipitation_impact(stats: ClimateStats) -> Dict[str, Any]:
     """Analyze precipitation impact on design"""
-    precipitation_data = historical_data.get("precipitation_data", [])
-    
-    if not precipitation_data:
+    if not stats.precipitation.size:
         return {"roof_design": "Standard", "drainage": "Basic", "water_management": "None"}
     
-    avg_precipitation = sum([month["precipitation"] for month in precipitation_data]) / 12
-    max_precipitation = max([month["precipitation"] for month in precipitation_data])
+    avg_precipitation = stats.avg_precipitation
+    max_precipitation = stats.max_precipitation
     
     return {
         "roof_design": "Steep" if max_precipitation > 100 else "Standard",
@@ -171,13 +223,16 @@ def analyze_precipitation_impact(historical_data: Dict[str, Any]) -> Dict[str, A
         "flood_risk": "High" if max_precipitation > 150 else "Low"
     }
 
-def analyze_wind_patterns(current_weather: Dict[str, Any], historical_data: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_wind_patterns(current_weather: Dict[str, Any], stats: ClimateStats) -> Dict[str, Any]:
     """Analyze wind patterns for design considerations"""
     wind_speed = current_weather.get("wind_speed", 5)
     wind_direction = current_weather.get("wind_direction", 0)
     
-    wind_data = historical_data.get("wind_data", [])
-    avg_wind_speed = sum([month["wind_speed"] for month in wind_data]) / 12 if wind_data else wind_speed
+    avg_wind_speed = stats.avg_wind if stats.wind.size else wind_speed
+    
+    # Prevailing direction over the year when monthly directions are known
+    if stats.wind_bearings.size:
+        wind_direction = _circular_mean(stats.wind_bearings)
     
     return {
         "prevailing_wind": get_wind_direction_name(wind_direction),
@@ -189,20 +244,46 @@ def analyze_wind_patterns(current_weather: Dict[str, Any], historical_data: Dict
 
 def get_wind_direction_name(degrees: float) -> str:
     """Convert wind direction degrees to compass direction"""
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", 
-                 "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    index = int((degrees + 11.25) / 22.5) % 16
-    return directions[index]
+    return WIND_DIRECTIONS[int((degrees + 11.25) / 22.5) & 15]
+
+def wind_direction_names(degrees: np.ndarray) -> np.ndarray:
+    """Convert an array of wind directions in degrees to compass directions in one pass"""
+    return WIND_DIRECTION_ARRAY[((degrees + 11.25) / 22.5).astype(np.int64) & 15]
 
 def get_wind_speed_category(speed: float) -> str:
     """Categorize wind speed"""
-    if speed < 2:
-        return "Light"
-    elif speed < 5:
-        return "Gentle"
-    elif speed < 10:
-        return "Moderate"
-    elif speed < 15:
-        return "Fresh"
-    else:
-        return "Strong"
+    return WIND_SPEED_CATEGORIES[bisect_right(WIND_SPEED_THRESHOLDS, speed)]
+
+def classify_wind_series(speeds: np.ndarray) -> np.ndarray:
+    """Categorize an array of wind speeds in one pass"""
+    return WIND_SPEED_CATEGORY_ARRAY[np.digitize(speeds, WIND_SPEED_THRESHOLDS)]
+
+def analyze_climate_patterns_batch(
+    temperature: np.ndarray, precipitation: np.ndarray, solar: np.ndarray, wind: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Climate zone, solar tilt and wind category for N sites at once
+    
+    temperature has shape (N,); precipitation, solar and wind hold a full year per site
+    with shape (N, 12).
+    """
+    avg_precipitation = precipitation.mean(axis=1)
+    avg_solar = solar.mean(axis=1)
+    avg_wind = wind.mean(axis=1)
+    summer_irradiance = solar[:, SUMMER_MONTHS].mean(axis=1)
+    winter_irradiance = solar[:, WINTER_MONTHS].mean(axis=1)
+    
+    temperature_band = np.searchsorted(TEMPERATURE_BANDS, temperature, side="left")
+    precipitation_band = np.searchsorted(PRECIPITATION_BANDS, avg_precipitation, side="left")
+    
+    return {
+        "climate_zone": CLIMATE_ZONE_ARRAY[temperature_band, precipitation_band],
+        "avg_precipitation": avg_precipitation,
+        "max_precipitation": precipitation.max(axis=1),
+        "avg_solar": avg_solar,
+        "tilt": np.where(
+            summer_irradiance > winter_irradiance * 1.5, 20,
+            np.where(winter_irradiance > summer_irradiance * 1.2, 45, 30)
+        ),
+        "avg_wind_speed": avg_wind,
+        "wind_speed_category": classify_wind_series(avg_wind)
+    }
@@ -2,11 +2,299 @@
 Export Formats - Handles conversion to various architecture software formats
 """
 
-import json
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence
+from dataclasses import dataclass
+from functools import wraps
 import base64
+import hashlib
+import io
 import struct
+import zlib
+
+import msgpack
+import numpy as np
+import orjson
+from cachetools import LRUCache
+from PIL import Image
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfgen.canvas import Canvas
+
+# Raster export size
+IMAGE_WIDTH = 1920
+IMAGE_HEIGHT = 1080
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Deflate level for PNG image data; 1 is several times faster than the default
+# for a modestly larger file
+PNG_COMPRESSION_LEVEL = 1
+JPEG_QUALITY = 90
+
+# PDF sheet size and margin in points
+PDF_PAGE_SIZE = landscape(A4)
+PDF_MARGIN = 36
+
+# Generated payloads kept per format and design digest
+EXPORT_CACHE_SIZE = 32
+EXPORT_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# DXF layer units code for metres
+DXF_UNITS = {"METERS": 6}
+
+# Static CAD tables shared by every export; returned by reference, never mutated
+DWG_LAYERS = (
+    {"name": "WALLS", "color": 7, "linetype": "CONTINUOUS"},
+    {"name": "DOORS", "color": 1, "linetype": "CONTINUOUS"},
+    {"name": "WINDOWS", "color": 2, "linetype": "CONTINUOUS"},
+    {"name": "DIMENSIONS", "color": 3, "linetype": "CONTINUOUS"},
+    {"name": "TEXT", "color": 4, "linetype": "CONTINUOUS"}
+)
+
+# Binary DWG stand-in: a msgpack metadata section followed by packed entity geometry
+DWG_MAGIC = b"ADWG"
+DWG_FORMAT_VERSION = 1
+DWG_ENTITY_TYPES = {"LINE": 1, "POLYLINE": 2}
+DWG_LAYER_INDEX = {layer["name"]: index for index, layer in enumerate(DWG_LAYERS)}
+DWG_PREAMBLE = struct.Struct("<4sHI")  # magic, version, metadata length
+DWG_ENTITY = np.dtype([("type", "u1"), ("layer", "u1"), ("count", "<u2")])
+DWG_POINT = np.dtype([("x", "<f8"), ("y", "<f8")])
+
+DWG_BLOCKS = (
+    {
+        "name": "DOOR_SYMBOL",
+        "entities": [
+            {"type": "LINE", "start": [0, 0], "end": [0, 2]},
+            {"type": "ARC", "center": [0, 0], "radius": 2, "start_angle": 0, "end_angle": 90}
+        ]
+    },
+    {
+        "name": "WINDOW_SYMBOL",
+        "entities": [
+            {"type": "LINE", "start": [0, 0], "end": [2, 0]},
+            {"type": "LINE", "start": [0, 0.5], "end": [2, 0.5]}
+        ]
+    }
+)
+
+DXF_HEADER = {
+    "version": "AC1009",  # R12, the most widely readable ASCII DXF
+    "creator": "ArchiAI Solution",
+    "created": "2024-01-01T00:00:00Z",
+    "units": "METERS",
+    "precision": 6
+}
+
+DXF_TABLES = {
+    "layers": DWG_LAYERS,
+    "linetypes": (
+        {"name": "CONTINUOUS", "description": "Solid line"},
+        {"name": "DASHED", "description": "Dashed line"},
+        {"name": "DOTTED", "description": "Dotted line"}
+    ),
+    "text_styles": (
+        {"name": "STANDARD", "font": "Arial", "height": 2.5},
+    )
+}
+
+RVT_HEADER = {
+    "version": "2024",
+    "creator": "ArchiAI Solution",
+    "created": "2024-01-01T00:00:00Z",
+    "units": "METERS",
+    "precision": 6
+}
+
+RVT_FAMILIES = (
+    {"name": "Basic Wall", "type": "WALL", "parameters": {"thickness": 0.2, "height": 3.5, "material": "Brick"}},
+    {"name": "Single Door", "type": "DOOR", "parameters": {"width": 0.9, "height": 2.1, "material": "Wood"}},
+    {"name": "Single Window", "type": "WINDOW", "parameters": {"width": 1.5, "height": 1.2, "material": "Glass"}}
+)
+
+RVT_LEVELS = (
+    {"name": "Level 1", "elevation": 0.0, "type": "FLOOR"},
+    {"name": "Level 2", "elevation": 3.5, "type": "FLOOR"}
+)
+
+RVT_VIEWS = (
+    {"name": "Floor Plan", "type": "FLOOR_PLAN", "level": "Level 1", "scale": "1:100"},
+    {"name": "3D View", "type": "3D_VIEW", "camera": {"position": [10, 10, 10], "target": [5, 5, 0]}}
+)
+
+RVT_SCHEDULES = (
+    {"name": "Door Schedule", "type": "DOOR_SCHEDULE", "fields": ["Type", "Width", "Height", "Material"]},
+    {"name": "Window Schedule", "type": "WINDOW_SCHEDULE", "fields": ["Type", "Width", "Height", "Material"]}
+)
+
+SKP_HEADER = {
+    "version": "2024",
+    "creator": "ArchiAI Solution",
+    "created": "2024-01-01T00:00:00Z",
+    "units": "METERS",
+    "precision": 6
+}
+
+SKP_COMPONENTS = (
+    {
+        "name": "Basic Wall",
+        "type": "WALL",
+        "geometry": {
+            "vertices": [[0, 0, 0], [5, 0, 0], [5, 0, 3.5], [0, 0, 3.5]],
+            "faces": [[0, 1, 2, 3]]
+        }
+    },
+    {
+        "name": "Single Door",
+        "type": "DOOR",
+        "geometry": {
+            "vertices": [[0, 0, 0], [0.9, 0, 0], [0.9, 0, 2.1], [0, 0, 2.1]],
+            "faces": [[0, 1, 2, 3]]
+        }
+    }
+)
+
+SKP_MATERIALS = (
+    {"name": "Brick", "color": [0.7, 0.4, 0.3], "texture": "brick_texture.jpg"},
+    {"name": "Glass", "color": [0.9, 0.9, 1.0], "texture": "glass_texture.jpg"},
+    {"name": "Wood", "color": [0.6, 0.4, 0.2], "texture": "wood_texture.jpg"}
+)
+
+SKP_LAYERS = (
+    {"name": "Walls", "visible": True},
+    {"name": "Doors", "visible": True},
+    {"name": "Windows", "visible": True},
+    {"name": "Furniture", "visible": False}
+)
+
+SKP_SCENES = (
+    {"name": "Floor Plan", "camera": {"position": [0, 0, 10], "target": [5, 5, 0]}, "style": "Wireframe"},
+    {"name": "3D View", "camera": {"position": [10, 10, 10], "target": [5, 5, 0]}, "style": "Shaded"}
+)
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk: length, tag, data and CRC"""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+def _export_key(export_format: str, design_data: Dict[str, Any]) -> tuple:
+    """Cache key for an export: its format and a digest of the design data"""
+    digest = hashlib.blake2b(orjson.dumps(design_data, option=EXPORT_KEY_OPTIONS), digest_size=16)
+    return (export_format, digest.hexdigest())
+
+def _cached_export(export_format: str):
+    """Reuse the payload of an unchanged design; force=True rebuilds it"""
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, design_data: Dict[str, Any], force: bool = False):
+            key = _export_key(export_format, design_data)
+            content = None if force else self._export_cache.get(key)
+            if content is None:
+                content = await method(self, design_data)
+                self._export_cache[key] = content
+            return content
+        return wrapper
+    return decorator
+
+def _gradient_pixels(width: int, height: int) -> np.ndarray:
+    """Build an opaque RGBA diagonal gradient of the given size"""
+    # uint8 addition wraps at 256, which is the (x + y) & 0xFF pattern
+    y = (np.arange(height) & 0xFF).astype(np.uint8)
+    x = (np.arange(width) & 0xFF).astype(np.uint8)
+    
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    np.add(y[:, None], x[None, :], out=pixels[..., 0])
+    pixels[..., 1] = pixels[..., 0]
+    pixels[..., 2] = pixels[..., 0]
+    pixels[..., 3] = 255
+    return pixels
+
+def _dxf_text(tags: List[tuple]) -> str:
+    """Render DXF group codes, writing coordinate and real codes as floats"""
+    return "".join(f"{code:>3}\n{float(value) if 10 <= code < 60 else value}\n" for code, value in tags)
+
+def _dxf_template(tags: List[tuple]) -> str:
+    """Compile fixed DXF group codes into a format string; values may be {fields}"""
+    return "".join(f"{code:>3}\n{value}\n" for code, value in tags)
+
+# Entity records have a fixed shape, so each is rendered with one str.format
+DXF_TEMPLATES = {
+    "LINE": _dxf_template([(0, "LINE"), (8, "{layer}"), (10, "{x1}"), (20, "{y1}"), (30, 0.0),
+                           (11, "{x2}"), (21, "{y2}"), (31, 0.0)]),
+    "ARC": _dxf_template([(0, "ARC"), (8, "{layer}"), (10, "{cx}"), (20, "{cy}"), (30, 0.0),
+                          (40, "{radius}"), (50, "{start_angle}"), (51, "{end_angle}")]),
+    "POLYLINE": _dxf_template([(0, "POLYLINE"), (8, "{layer}"), (66, 1), (10, 0.0), (20, 0.0), (30, 0.0), (70, 0)]),
+    "VERTEX": _dxf_template([(0, "VERTEX"), (8, "{layer}"), (10, "{x}"), (20, "{y}"), (30, 0.0)]),
+    "SEQEND": _dxf_template([(0, "SEQEND"), (8, "{layer}")])
+}
+
+def _dxf_entity_text(entity: Dict[str, Any], layer: str = "0") -> str:
+    """Render a LINE, ARC or POLYLINE entity from its DXF template"""
+    layer = entity.get("layer", layer)
+    if entity["type"] == "LINE":
+        (x1, y1), (x2, y2) = entity["start"], entity["end"]
+        return DXF_TEMPLATES["LINE"].format(layer=layer, x1=float(x1), y1=float(y1), x2=float(x2), y2=float(y2))
+    if entity["type"] == "ARC":
+        cx, cy = entity["center"]
+        return DXF_TEMPLATES["ARC"].format(
+            layer=layer, cx=float(cx), cy=float(cy), radius=float(entity["radius"]),
+            start_angle=float(entity["start_angle"]), end_angle=float(entity["end_angle"])
+        )
+    
+    vertex = DXF_TEMPLATES["VERTEX"]
+    return "".join((
+        DXF_TEMPLATES["POLYLINE"].format(layer=layer),
+        "".join(vertex.format(layer=layer, x=float(x), y=float(y)) for x, y in entity["points"]),
+        DXF_TEMPLATES["SEQEND"].format(layer=layer)
+    ))
+
+@dataclass(slots=True)
+class EntityBatch:
+    """Column view of drawing entities; entity i owns points[offsets[i]:offsets[i + 1]]"""
+    types: np.ndarray    # DWG_ENTITY_TYPES codes
+    layers: np.ndarray   # indexes into DWG_LAYERS
+    offsets: np.ndarray
+    points: np.ndarray   # (M, 2) float64
+    
+    @classmethod
+    def from_shapes(cls, entity_type: str, layer: str, shapes: np.ndarray) -> "EntityBatch":
+        """Batch of same-type entities from an (N, points per entity, 2) array"""
+        count, size = shapes.shape[:2]
+        return cls(
+            np.full(count, DWG_ENTITY_TYPES[entity_type], dtype=np.uint8),
+            np.full(count, DWG_LAYER_INDEX[layer], dtype=np.uint8),
+            np.arange(0, count * size + 1, size, dtype=np.int64),
+            shapes.reshape(-1, 2)
+        )
+    
+    @classmethod
+    def concat(cls, batches: List["EntityBatch"]) -> "EntityBatch":
+        """Join batches in order, rebasing each batch's point offsets"""
+        starts = np.cumsum([0] + [len(batch.points) for batch in batches])
+        return cls(
+            np.concatenate([batch.types for batch in batches] or [np.empty(0, np.uint8)]),
+            np.concatenate([batch.layers for batch in batches] or [np.empty(0, np.uint8)]),
+            np.concatenate([[0]] + [batch.offsets[1:] + start for batch, start in zip(batches, starts)]).astype(np.int64),
+            np.concatenate([batch.points for batch in batches] or [np.empty((0, 2))]).astype(np.float64, copy=False)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.types)
+
+def _dxf_batch_text(batch: EntityBatch) -> str:
+    """Render an entity batch with the DXF templates, walking its columns"""
+    line, polyline, vertex, seqend = (DXF_TEMPLATES[name] for name in ("LINE", "POLYLINE", "VERTEX", "SEQEND"))
+    points = batch.points.tolist()
+    offsets = batch.offsets.tolist()
+    
+    parts = []
+    for entity_type, layer, start, stop in zip(batch.types.tolist(), batch.layers.tolist(), offsets, offsets[1:]):
+        layer = DWG_LAYERS[layer]["name"]
+        if entity_type == DWG_ENTITY_TYPES["LINE"]:
+            (x1, y1), (x2, y2) = points[start:stop]
+            parts.append(line.format(layer=layer, x1=x1, y1=y1, x2=x2, y2=y2))
+        else:
+            parts.append(polyline.format(layer=layer))
+            parts += [vertex.format(layer=layer, x=x, y=y) for x, y in points[start:stop]]
+            parts.append(seqend.format(layer=layer))
+    return "".join(parts)
 
 class ExportFormats:
     def __init__(self):
@@ -14,6 +302,9 @@ class ExportFormats:
         self.dxf_entities = self._load_dxf_entities()
         self.rvt_families = self._load_rvt_families()
         self.skp_components = self._load_skp_components()
+        self._raster_pixels: Optional[np.ndarray] = None
+        self._export_cache = LRUCache(maxsize=EXPORT_CACHE_SIZE)
+        self._entity_cache = LRUCache(maxsize=EXPORT_CACHE_SIZE)
         
     def _load_dwg_headers(self) -> Dict[str, Any]:
         """Load DWG file headers"""
@@ -50,66 +341,70 @@ class ExportFormats:
             "furniture": ["Chair", "Table", "Bed", "Sofa"]
         }
     
+    @_cached_export("dwg")
     async def generate_dwg_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate DWG file content"""
         
         # Create DWG file structure
         dwg_content = {
             "header": self.dwg_headers,
-            "entities": await self._generate_dwg_entities(design_data),
-            "layers": await self._generate_dwg_layers(design_data),
-            "blocks": await self._generate_dwg_blocks(design_data),
-            "dimensions": await self._generate_dwg_dimensions(design_data)
+            "entities": self._generate_dwg_entities(design_data),
+            "layers": self._generate_dwg_layers(design_data),
+            "blocks": self._generate_dwg_blocks(design_data),
+            "dimensions": self._generate_dwg_dimensions(design_data)
         }
         
         # Convert to DWG binary format
-        return await self._convert_to_dwg_binary(dwg_content)
+        return self._convert_to_dwg_binary(dwg_content)
     
+    @_cached_export("dxf")
     async def generate_dxf_content(self, design_data: Dict[str, Any]) -> str:
         """Generate DXF file content"""
         
         # Create DXF file structure
         dxf_content = {
             "header": self._generate_dxf_header(),
-            "tables": await self._generate_dxf_tables(design_data),
-            "blocks": await self._generate_dxf_blocks(design_data),
-            "entities": await self._generate_dxf_entities(design_data),
-            "objects": await self._generate_dxf_objects(design_data)
+            "tables": self._generate_dxf_tables(design_data),
+            "blocks": self._generate_dxf_blocks(design_data),
+            "entities": self._generate_dxf_entities(design_data)
         }
         
         # Convert to DXF text format
-        return await self._convert_to_dxf_text(dxf_content)
+        return self._convert_to_dxf_text(dxf_content)
     
+    @_cached_export("rvt")
     async def generate_rvt_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate RVT file content"""
         
         # Create RVT file structure
         rvt_content = {
             "header": self._generate_rvt_header(),
-            "families": await self._generate_rvt_families(design_data),
-            "levels": await self._generate_rvt_levels(design_data),
-            "views": await self._generate_rvt_views(design_data),
-            "schedules": await self._generate_rvt_schedules(design_data)
+            "families": self._generate_rvt_families(design_data),
+            "levels": self._generate_rvt_levels(design_data),
+            "views": self._generate_rvt_views(design_data),
+            "schedules": self._generate_rvt_schedules(design_data)
         }
         
         # Convert to RVT binary format
-        return await self._convert_to_rvt_binary(rvt_content)
+        return self._convert_to_rvt_binary(rvt_content)
     
+    @_cached_export("skp")
     async def generate_skp_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate SKP file content"""
         
         # Create SKP file structure
         skp_content = {
             "header": self._generate_skp_header(),
-            "components": await self._generate_skp_components(design_data),
-            "materials": await self._generate_skp_materials(design_data),
-            "layers": await self._generate_skp_layers(design_data),
-            "scenes": await self._generate_skp_scenes(design_data)
+            "components": self._generate_skp_components(design_data),
+            "materials": self._generate_skp_materials(design_data),
+            "layers": self._generate_skp_layers(design_data),
+            "scenes": self._generate_skp_scenes(design_data)
         }
         
         # Convert to SKP binary format
-        return await self._convert_to_skp_binary(skp_content)
+        return self._convert_to_skp_binary(skp_content)
     
+    @_cached_export("pdf")
     async def generate_pdf_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate PDF file content"""
         
@@ -117,106 +412,90 @@ class ExportFormats:
         pdf_content = {
             "title": "Architectural Design",
             "author": "ArchiAI Solution",
-            "pages": await self._generate_pdf_pages(design_data)
+            "pages": self._generate_pdf_pages(design_data)
         }
         
         # Convert to PDF binary format
-        return await self._convert_to_pdf_binary(pdf_content)
+        return self._convert_to_pdf_binary(pdf_content)
     
+    @_cached_export("png")
     async def generate_png_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate PNG file content"""
         
         # Create PNG content
         png_content = {
-            "width": 1920,
-            "height": 1080,
-            "pixels": await self._generate_png_pixels(design_data)
+            "width": IMAGE_WIDTH,
+            "height": IMAGE_HEIGHT,
+            "pixels": self._generate_png_pixels(design_data)
         }
         
         # Convert to PNG binary format
-        return await self._convert_to_png_binary(png_content)
+        return self._convert_to_png_binary(png_content)
     
+    @_cached_export("jpg")
     async def generate_jpg_content(self, design_data: Dict[str, Any]) -> bytes:
         """Generate JPG file content"""
         
         # Create JPG content
         jpg_content = {
-            "width": 1920,
-            "height": 1080,
-            "quality": 90,
-            "pixels": await self._generate_jpg_pixels(design_data)
+            "width": IMAGE_WIDTH,
+            "height": IMAGE_HEIGHT,
+            "quality": JPEG_QUALITY,
+            "pixels": self._generate_jpg_pixels(design_data)
         }
         
         # Convert to JPG binary format
-        return await self._convert_to_jpg_binary(jpg_content)
+        return self._convert_to_jpg_binary(jpg_content)
+    
+    def _generate_dwg_entities(self, design_data: Dict[str, Any]) -> EntityBatch:
+        """Generate DWG entities from design data, shared with the DXF export"""
+        floor_plan = design_data.get("2d_design", {}).get("floor_plan", {})
+        
+        # Entities depend only on the floor plan, so DWG and DXF exports of the
+        # same plan reuse one build
+        key = _export_key("entities", floor_plan)
+        batch = self._entity_cache.get(key)
+        if batch is None:
+            batch = self._build_entities(floor_plan)
+            self._entity_cache[key] = batch
+        return batch
     
-    async def _generate_dwg_entities(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate DWG entities from design data"""
-        entities = []
+    def _build_entities(self, floor_plan: Dict[str, Any]) -> EntityBatch:
+        """Build wall, door and window entities for a floor plan"""
+        batches = []
         
         # Generate walls
-        if "2d_design" in design_data and "floor_plan" in design_data["2d_design"]:
-            floor_plan = design_data["2d_design"]["floor_plan"]
-            if "rooms" in floor_plan:
-                for room in floor_plan["rooms"]:
-                    entities.append({
-                        "type": "POLYLINE",
-                        "layer": "WALLS",
-                        "points": self._generate_room_walls(room)
-                    })
+        if floor_plan.get("rooms"):
+            rings = self._generate_room_walls(floor_plan["rooms"])
+            batches.append(EntityBatch.from_shapes("POLYLINE", "WALLS", rings))
         
-        # Generate doors
-        if "openings" in floor_plan and "doors" in floor_plan["openings"]:
-            for door in floor_plan["openings"]["doors"]:
-                entities.append({
-                    "type": "LINE",
-                    "layer": "DOORS",
-                    "start": door["position"],
-                    "end": [door["position"][0] + door["size"][0], door["position"][1]]
-                })
-        
-        # Generate windows
-        if "openings" in floor_plan and "windows" in floor_plan["openings"]:
-            for window in floor_plan["openings"]["windows"]:
-                entities.append({
-                    "type": "LINE",
-                    "layer": "WINDOWS",
-                    "start": window["position"],
-                    "end": [window["position"][0] + window["size"][0], window["position"][1]]
-                })
-        
-        return entities
-    
-    async def _generate_dwg_layers(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate DWG layers"""
-        return [
-            {"name": "WALLS", "color": 7, "linetype": "CONTINUOUS"},
-            {"name": "DOORS", "color": 1, "linetype": "CONTINUOUS"},
-            {"name": "WINDOWS", "color": 2, "linetype": "CONTINUOUS"},
-            {"name": "DIMENSIONS", "color": 3, "linetype": "CONTINUOUS"},
-            {"name": "TEXT", "color": 4, "linetype": "CONTINUOUS"}
-        ]
+        # Generate doors and windows
+        openings = floor_plan.get("openings", {})
+        for name, layer in (("doors", "DOORS"), ("windows", "WINDOWS")):
+            if openings.get(name):
+                batches.append(EntityBatch.from_shapes("LINE", layer, self._generate_opening_lines(openings[name])))
+        
+        return EntityBatch.concat(batches)
     
-    async def _generate_dwg_blocks(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate DWG blocks"""
-        return [
-            {
-                "name": "DOOR_SYMBOL",
-                "entities": [
-                    {"type": "LINE", "start": [0, 0], "end": [0, 2]},
-                    {"type": "ARC", "center": [0, 0], "radius": 2, "start_angle": 0, "end_angle": 90}
-                ]
-            },
-            {
-                "name": "WINDOW_SYMBOL",
-                "entities": [
-                    {"type": "LINE", "start": [0, 0], "end": [2, 0]},
-                    {"type": "LINE", "start": [0, 0.5], "end": [2, 0.5]}
-                ]
-            }
-        ]
+    def _generate_opening_lines(self, openings: List[Dict[str, Any]]) -> np.ndarray:
+        """Generate an (N, 2, 2) array of lines across the width of each door or window"""
+        lines = np.empty((len(openings), 2, 2), dtype=np.float64)
+        lines[:, 0] = [opening["position"] for opening in openings]
+        lines[:, 1] = lines[:, 0]
+        
+        # Offset all end points along x in one pass instead of per opening
+        lines[:, 1, 0] += [opening["size"][0] for opening in openings]
+        return lines
     
-    async def _generate_dwg_dimensions(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_dwg_layers(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
+        """Generate DWG layers"""
+        return DWG_LAYERS
+
+    def _generate_dwg_blocks(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
+        """Generate DWG blocks"""
+        return DWG_BLOCKS
+
+    def _generate_dwg_dimensions(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate DWG dimensions"""
         dimensions = []
         
@@ -233,314 +512,262 @@ class ExportFormats:
         
         return dimensions
     
-    def _generate_room_walls(self, room: Dict[str, Any]) -> List[List[float]]:
-        """Generate wall points for a room"""
-        x, y = room["position"]
-        width, height = room["dimensions"]
-        
-        return [
-            [x, y],
-            [x + width, y],
-            [x + width, y + height],
-            [x, y + height],
-            [x, y]  # Close the polygon
-        ]
+    def _generate_room_walls(self, rooms: List[Dict[str, Any]]) -> np.ndarray:
+        """Generate closed wall rings for all rooms as an (N, 5, 2) array"""
+        position = np.array([room["position"] for room in rooms], dtype=np.float64)
+        dimensions = np.array([room["dimensions"] for room in rooms], dtype=np.float64)
+        
+        rings = np.empty((len(rooms), 5, 2), dtype=np.float64)
+        rings[:, 0] = position
+        rings[:, 1, 0] = position[:, 0] + dimensions[:, 0]
+        rings[:, 1, 1] = position[:, 1]
+        rings[:, 2] = position + dimensions
+        rings[:, 3, 0] = position[:, 0]
+        rings[:, 3, 1] = position[:, 1] + dimensions[:, 1]
+        rings[:, 4] = position  # Close the polygon
+        return rings
     
     def _generate_dxf_header(self) -> Dict[str, Any]:
         """Generate DXF header"""
-        return {
-            "version": "AC1027",
-            "creator": "ArchiAI Solution",
-            "created": "2024-01-01T00:00:00Z",
-            "units": "METERS",
-            "precision": 6
-        }
-    
-    async def _generate_dxf_tables(self, design_data: Dict[str, Any]) -> Dict[str, Any]:
+        return DXF_HEADER
+
+    def _generate_dxf_tables(self, design_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate DXF tables"""
-        return {
-            "layers": await self._generate_dwg_layers(design_data),
-            "linetypes": [
-                {"name": "CONTINUOUS", "description": "Solid line"},
-                {"name": "DASHED", "description": "Dashed line"},
-                {"name": "DOTTED", "description": "Dotted line"}
-            ],
-            "text_styles": [
-                {"name": "STANDARD", "font": "Arial", "height": 2.5}
-            ]
-        }
-    
-    async def _generate_dxf_blocks(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return DXF_TABLES
+
+    def _generate_dxf_blocks(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate DXF blocks"""
-        return await self._generate_dwg_blocks(design_data)
+        return self._generate_dwg_blocks(design_data)
     
-    async def _generate_dxf_entities(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_dxf_entities(self, design_data: Dict[str, Any]) -> EntityBatch:
         """Generate DXF entities"""
-        return await self._generate_dwg_entities(design_data)
-    
-    async def _generate_dxf_objects(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate DXF objects"""
-        return [
-            {"type": "DICTIONARY", "name": "ACAD_GROUP"},
-            {"type": "DICTIONARY", "name": "ACAD_MLINESTYLE"}
-        ]
+        return self._generate_dwg_entities(design_data)
     
     def _generate_rvt_header(self) -> Dict[str, Any]:
         """Generate Revit header"""
-        return {
-            "version": "2024",
-            "creator": "ArchiAI Solution",
-            "created": "2024-01-01T00:00:00Z",
-            "units": "METERS",
-            "precision": 6
-        }
-    
-    async def _generate_rvt_families(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return RVT_HEADER
+
+    def _generate_rvt_families(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate Revit families"""
-        families = []
-        
-        # Wall families
-        families.append({
-            "name": "Basic Wall",
-            "type": "WALL",
-            "parameters": {
-                "thickness": 0.2,
-                "height": 3.5,
-                "material": "Brick"
-            }
-        })
-        
-        # Door families
-        families.append({
-            "name": "Single Door",
-            "type": "DOOR",
-            "parameters": {
-                "width": 0.9,
-                "height": 2.1,
-                "material": "Wood"
-            }
-        })
-        
-        # Window families
-        families.append({
-            "name": "Single Window",
-            "type": "WINDOW",
-            "parameters": {
-                "width": 1.5,
-                "height": 1.2,
-                "material": "Glass"
-            }
-        })
-        
-        return families
-    
-    async def _generate_rvt_levels(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return RVT_FAMILIES
+
+    def _generate_rvt_levels(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate Revit levels"""
-        return [
-            {
-                "name": "Level 1",
-                "elevation": 0.0,
-                "type": "FLOOR"
-            },
-            {
-                "name": "Level 2",
-                "elevation": 3.5,
-                "type": "FLOOR"
-            }
-        ]
-    
-    async def _generate_rvt_views(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return RVT_LEVELS
+
+    def _generate_rvt_views(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate Revit views"""
-        return [
-            {
-                "name": "Floor Plan",
-                "type": "FLOOR_PLAN",
-                "level": "Level 1",
-                "scale": "1:100"
-            },
-            {
-                "name": "3D View",
-                "type": "3D_VIEW",
-                "camera": {"position": [10, 10, 10], "target": [5, 5, 0]}
-            }
-        ]
-    
-    async def _generate_rvt_schedules(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return RVT_VIEWS
+
+    def _generate_rvt_schedules(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate Revit schedules"""
-        return [
-            {
-                "name": "Door Schedule",
-                "type": "DOOR_SCHEDULE",
-                "fields": ["Type", "Width", "Height", "Material"]
-            },
-            {
-                "name": "Window Schedule",
-                "type": "WINDOW_SCHEDULE",
-                "fields": ["Type", "Width", "Height", "Material"]
-            }
-        ]
-    
+        return RVT_SCHEDULES
+
     def _generate_skp_header(self) -> Dict[str, Any]:
         """Generate SketchUp header"""
-        return {
-            "version": "2024",
-            "creator": "ArchiAI Solution",
-            "created": "2024-01-01T00:00:00Z",
-            "units": "METERS",
-            "precision": 6
-        }
-    
-    async def _generate_skp_components(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return SKP_HEADER
+
+    def _generate_skp_components(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate SketchUp components"""
-        components = []
-        
-        # Wall components
-        components.append({
-            "name": "Basic Wall",
-            "type": "WALL",
-            "geometry": {
-                "vertices": [[0, 0, 0], [5, 0, 0], [5, 0, 3.5], [0, 0, 3.5]],
-                "faces": [[0, 1, 2, 3]]
-            }
-        })
-        
-        # Door components
-        components.append({
-            "name": "Single Door",
-            "type": "DOOR",
-            "geometry": {
-                "vertices": [[0, 0, 0], [0.9, 0, 0], [0.9, 0, 2.1], [0, 0, 2.1]],
-                "faces": [[0, 1, 2, 3]]
-            }
-        })
-        
-        return components
-    
-    async def _generate_skp_materials(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return SKP_COMPONENTS
+
+    def _generate_skp_materials(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate SketchUp materials"""
-        return [
-            {
-                "name": "Brick",
-                "color": [0.7, 0.4, 0.3],
-                "texture": "brick_texture.jpg"
-            },
-            {
-                "name": "Glass",
-                "color": [0.9, 0.9, 1.0],
-                "texture": "glass_texture.jpg"
-            },
-            {
-                "name": "Wood",
-                "color": [0.6, 0.4, 0.2],
-                "texture": "wood_texture.jpg"
-            }
-        ]
-    
-    async def _generate_skp_layers(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return SKP_MATERIALS
+
+    def _generate_skp_layers(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate SketchUp layers"""
-        return [
-            {"name": "Walls", "visible": True},
-            {"name": "Doors", "visible": True},
-            {"name": "Windows", "visible": True},
-            {"name": "Furniture", "visible": False}
-        ]
-    
-    async def _generate_skp_scenes(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return SKP_LAYERS
+
+    def _generate_skp_scenes(self, design_data: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
         """Generate SketchUp scenes"""
-        return [
-            {
-                "name": "Floor Plan",
-                "camera": {"position": [0, 0, 10], "target": [5, 5, 0]},
-                "style": "Wireframe"
-            },
-            {
-                "name": "3D View",
-                "camera": {"position": [10, 10, 10], "target": [5, 5, 0]},
-                "style": "Shaded"
-            }
-        ]
-    
-    async def _generate_pdf_pages(self, design_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate PDF pages"""
-        pages = []
-        
+        return SKP_SCENES
+
+    def _generate_pdf_pages(self, design_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Generate PDF pages one at a time, so only the page being drawn is held"""
         # Floor plan page
-        pages.append({
+        yield {
             "title": "Floor Plan",
             "content": {
                 "type": "floor_plan",
                 "data": design_data.get("2d_design", {}).get("floor_plan", {})
             }
-        })
+        }
         
         # Elevations page
-        pages.append({
+        yield {
             "title": "Elevations",
             "content": {
                 "type": "elevations",
                 "data": design_data.get("2d_design", {}).get("elevations", {})
             }
-        })
-        
-        return pages
+        }
     
-    async def _generate_png_pixels(self, design_data: Dict[str, Any]) -> List[List[int]]:
+    def _generate_png_pixels(self, design_data: Dict[str, Any]) -> np.ndarray:
         """Generate PNG pixels"""
         # This would typically generate actual pixel data
-        # For now, we'll return a simple pattern
-        pixels = []
-        for y in range(1080):
-            row = []
-            for x in range(1920):
-                # Simple gradient pattern
-                color = (x + y) % 256
-                row.append([color, color, color, 255])  # RGBA
-            pixels.append(row)
-        return pixels
-    
-    async def _generate_jpg_pixels(self, design_data: Dict[str, Any]) -> List[List[int]]:
+        # For now, we'll return a simple gradient pattern as an RGBA array,
+        # built once and shared read-only with the JPG export
+        if self._raster_pixels is None:
+            pixels = _gradient_pixels(IMAGE_WIDTH, IMAGE_HEIGHT)
+            pixels.flags.writeable = False
+            self._raster_pixels = pixels
+        return self._raster_pixels
+    
+    def _generate_jpg_pixels(self, design_data: Dict[str, Any]) -> np.ndarray:
         """Generate JPG pixels"""
-        # Similar to PNG but with JPEG compression
-        return await self._generate_png_pixels(design_data)
+        # JPEG has no alpha channel, so take an RGB view of the PNG pixels
+        pixels = self._generate_png_pixels(design_data)
+        return pixels[..., :3]
     
-    async def _convert_to_dwg_binary(self, dwg_content: Dict[str, Any]) -> bytes:
+    def _convert_to_dwg_binary(self, dwg_content: Dict[str, Any]) -> bytes:
         """Convert DWG content to binary format"""
         # This would typically use a DWG library
-        # For now, we'll return a simple binary representation
-        return json.dumps(dwg_content).encode('utf-8')
-    
-    async def _convert_to_dxf_text(self, dxf_content: Dict[str, Any]) -> str:
+        # For now, the small tables go through MessagePack and the entity
+        # geometry is packed straight into one preallocated buffer
+        metadata = msgpack.packb(
+            {name: value for name, value in dwg_content.items() if name != "entities"}, use_bin_type=True
+        )
+        batch = dwg_content["entities"]
+        counts = np.diff(batch.offsets)
+        
+        body_offset = DWG_PREAMBLE.size + len(metadata) + 4
+        buffer = bytearray(body_offset + DWG_ENTITY.itemsize * len(batch) + DWG_POINT.itemsize * len(batch.points))
+        
+        DWG_PREAMBLE.pack_into(buffer, 0, DWG_MAGIC, DWG_FORMAT_VERSION, len(metadata))
+        buffer[DWG_PREAMBLE.size:DWG_PREAMBLE.size + len(metadata)] = metadata
+        struct.pack_into("<I", buffer, body_offset - 4, len(batch))
+        
+        # Every entity record is its header followed by its points: scatter the
+        # header column and the point column into place with one assignment each
+        headers = np.empty(len(batch), dtype=DWG_ENTITY)
+        headers["type"] = batch.types
+        headers["layer"] = batch.layers
+        headers["count"] = counts
+        header_starts = DWG_ENTITY.itemsize * np.arange(len(batch)) + DWG_POINT.itemsize * batch.offsets[:-1]
+        
+        owners = np.repeat(np.arange(len(batch)), counts)
+        point_starts = DWG_ENTITY.itemsize * (owners + 1) + DWG_POINT.itemsize * np.arange(len(batch.points))
+        points = np.empty(len(batch.points), dtype=DWG_POINT)
+        points["x"], points["y"] = batch.points[:, 0], batch.points[:, 1]
+        
+        body = np.frombuffer(buffer, dtype=np.uint8, offset=body_offset)
+        body[header_starts[:, None] + np.arange(DWG_ENTITY.itemsize)] = headers.view(np.uint8).reshape(-1, DWG_ENTITY.itemsize)
+        body[point_starts[:, None] + np.arange(DWG_POINT.itemsize)] = points.view(np.uint8).reshape(-1, DWG_POINT.itemsize)
+        
+        return bytes(buffer)
+    
+    def _convert_to_dxf_text(self, dxf_content: Dict[str, Any]) -> str:
         """Convert DXF content to text format"""
-        # This would typically generate proper DXF format
-        # For now, we'll return a simple text representation
-        return json.dumps(dxf_content, indent=2)
-    
-    async def _convert_to_rvt_binary(self, rvt_content: Dict[str, Any]) -> bytes:
+        header = dxf_content["header"]
+        tables = dxf_content["tables"]
+        
+        tags = [(0, "SECTION"), (2, "HEADER"),
+                (9, "$ACADVER"), (1, header["version"]),
+                (9, "$INSUNITS"), (70, DXF_UNITS.get(header["units"], 0)),
+                (0, "ENDSEC")]
+        
+        tags += [(0, "SECTION"), (2, "TABLES")]
+        tags += [(0, "TABLE"), (2, "LTYPE"), (70, len(tables["linetypes"]))]
+        for linetype in tables["linetypes"]:
+            tags += [(0, "LTYPE"), (2, linetype["name"]), (70, 0), (3, linetype["description"]),
+                     (72, 65), (73, 0), (40, 0.0)]
+        tags += [(0, "ENDTAB"), (0, "TABLE"), (2, "LAYER"), (70, len(tables["layers"]))]
+        for layer in tables["layers"]:
+            tags += [(0, "LAYER"), (2, layer["name"]), (70, 0), (62, layer["color"]), (6, layer["linetype"])]
+        tags += [(0, "ENDTAB"), (0, "TABLE"), (2, "STYLE"), (70, len(tables["text_styles"]))]
+        for style in tables["text_styles"]:
+            tags += [(0, "STYLE"), (2, style["name"]), (70, 0), (40, style["height"]), (41, 1.0),
+                     (50, 0.0), (71, 0), (42, style["height"]), (3, style["font"]), (4, "")]
+        tags += [(0, "ENDTAB"), (0, "ENDSEC"), (0, "SECTION"), (2, "BLOCKS")]
+        parts = [_dxf_text(tags)]
+        
+        for block in dxf_content["blocks"]:
+            parts.append(_dxf_text([(0, "BLOCK"), (8, "0"), (2, block["name"]), (70, 0),
+                                    (10, 0.0), (20, 0.0), (30, 0.0), (3, block["name"])]))
+            parts += [_dxf_entity_text(entity) for entity in block["entities"]]
+            parts.append(_dxf_text([(0, "ENDBLK"), (8, "0")]))
+        
+        parts.append(_dxf_text([(0, "ENDSEC"), (0, "SECTION"), (2, "ENTITIES")]))
+        parts.append(_dxf_batch_text(dxf_content["entities"]))
+        parts.append(_dxf_text([(0, "ENDSEC"), (0, "EOF")]))
+        
+        return "".join(parts)
+    
+    def _convert_to_rvt_binary(self, rvt_content: Dict[str, Any]) -> bytes:
         """Convert RVT content to binary format"""
         # This would typically use a Revit library
-        # For now, we'll return a simple binary representation
-        return json.dumps(rvt_content).encode('utf-8')
+        # For now, we'll return a compact MessagePack representation
+        return msgpack.packb(rvt_content, use_bin_type=True)
     
-    async def _convert_to_skp_binary(self, skp_content: Dict[str, Any]) -> bytes:
+    def _convert_to_skp_binary(self, skp_content: Dict[str, Any]) -> bytes:
         """Convert SKP content to binary format"""
         # This would typically use a SketchUp library
-        # For now, we'll return a simple binary representation
-        return json.dumps(skp_content).encode('utf-8')
+        # For now, we'll return a compact MessagePack representation
+        return msgpack.packb(skp_content, use_bin_type=True)
     
-    async def _convert_to_pdf_binary(self, pdf_content: Dict[str, Any]) -> bytes:
+    def _convert_to_pdf_binary(self, pdf_content: Dict[str, Any]) -> bytes:
         """Convert PDF content to binary format"""
-        # This would typically use a PDF library
-        # For now, we'll return a simple binary representation
-        return json.dumps(pdf_content).encode('utf-8')
-    
-    async def _convert_to_png_binary(self, png_content: Dict[str, Any]) -> bytes:
+        output = io.BytesIO()
+        canvas = Canvas(output, pagesize=PDF_PAGE_SIZE)
+        canvas.setTitle(pdf_content["title"])
+        canvas.setAuthor(pdf_content["author"])
+        
+        for page in pdf_content["pages"]:
+            self._draw_pdf_page(canvas, page)
+            canvas.showPage()
+        
+        canvas.save()
+        return output.getvalue()
+    
+    def _draw_pdf_page(self, canvas: Canvas, page: Dict[str, Any]):
+        """Draw a single PDF page: the title plus the floor plan or elevation list"""
+        width, height = PDF_PAGE_SIZE
+        canvas.setFont("Helvetica-Bold", 18)
+        canvas.drawString(PDF_MARGIN, height - PDF_MARGIN, page["title"])
+        
+        content = page["content"]
+        if content["type"] == "floor_plan" and content["data"].get("rooms"):
+            rooms = content["data"]["rooms"]
+            corners = np.array([[r["position"], np.add(r["position"], r["dimensions"])] for r in rooms], dtype=np.float64)
+            origin = corners[:, 0].min(axis=0)
+            extent = np.maximum(corners[:, 1].max(axis=0) - origin, 1e-9)
+            
+            # Fit the plan inside the margins below the title, y axis pointing up
+            scale = min((width - 2 * PDF_MARGIN) / extent[0], (height - 3 * PDF_MARGIN) / extent[1])
+            canvas.setFont("Helvetica", 9)
+            for room, (low, high) in zip(rooms, (corners - origin) * scale + PDF_MARGIN):
+                canvas.rect(low[0], low[1], high[0] - low[0], high[1] - low[1])
+                canvas.drawString(low[0] + 4, high[1] - 12, room.get("name", ""))
+        elif content["type"] == "elevations":
+            canvas.setFont("Helvetica", 11)
+            y = height - 2 * PDF_MARGIN
+            for name, elevation in content["data"].items():
+                if isinstance(elevation, dict):
+                    elevation = ", ".join(f"{key}: {value}" for key, value in elevation.items())
+                canvas.drawString(PDF_MARGIN, y, f"{name.title()} - {elevation}")
+                y -= 16
+    
+    def _convert_to_png_binary(self, png_content: Dict[str, Any]) -> bytes:
         """Convert PNG content to binary format"""
-        # This would typically use a PNG library
-        # For now, we'll return a simple binary representation
-        return json.dumps(png_content).encode('utf-8')
-    
-    async def _convert_to_jpg_binary(self, jpg_content: Dict[str, Any]) -> bytes:
+        pixels = png_content["pixels"]
+        height, width = pixels.shape[:2]
+        
+        # Each RGBA scanline is prefixed with filter type 0 (None)
+        scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+        scanlines[:, 1:] = pixels.reshape(height, -1)
+        
+        header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)  # 8-bit RGBA
+        return b"".join((
+            PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), PNG_COMPRESSION_LEVEL)),
+            _png_chunk(b"IEND", b"")
+        ))
+    
+    def _convert_to_jpg_binary(self, jpg_content: Dict[str, Any]) -> bytes:
         """Convert JPG content to binary format"""
-        # This would typically use a JPEG library
-        # For now, we'll return a simple binary representation
-        return json.dumps(jpg_content).encode('utf-8')
+        image = Image.fromarray(np.ascontiguousarray(jpg_content["pixels"]))
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=jpg_content["quality"], optimize=True)
+        return output.getvalue()
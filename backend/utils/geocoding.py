@@ -2,37 +2,166 @@
 Geocoding utilities for address to coordinates conversion
 """
 
-import requests
+import httpx
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 import asyncio
+from contextlib import closing
 from typing import Tuple, Optional, Dict, Any
+import hashlib
+import logging
 import os
+import sqlite3
+import tempfile
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Resolved addresses stay in memory for a day and on disk for a month
+GEOCODE_CACHE_SIZE = 10000
+GEOCODE_CACHE_TTL = 86400
+GEOCODE_DISK_TTL = 30 * 86400
+GEOCODE_CACHE_PATH = os.getenv(
+    "GEOCODE_CACHE_PATH", os.path.join(tempfile.gettempdir(), "archiai_geocode.sqlite3")
+)
+
+# Nominatim's usage policy allows at most one request per second
+NOMINATIM_MAX_QPS = 1
+
+# Head start given to Google before Nominatim is raced against it
+GEOCODE_HEDGE_DELAY = float(os.getenv("GEOCODE_HEDGE_DELAY", "0.15"))
+
 class GeocodingService:
     def __init__(self):
         self.google_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
         self.nominatim_base_url = "https://nominatim.openstreetmap.org"
+        self._http: Optional[httpx.AsyncClient] = None
+        self._cache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+        self._nominatim_limiter = AsyncLimiter(NOMINATIM_MAX_QPS, time_period=1.0)
+        self._disk_ready = False
+    
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use so it binds to the running loop"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                timeout=10.0
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Release the shared HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     async def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
+        """Get coordinates from address, checking the memory and disk caches first"""
+        coords = await self.cached_coordinates(address)
+        if coords is None:
+            coords = await self._lookup_coordinates(address)
+            if coords:
+                await self.remember_coordinates(address, coords)
+        return coords
+    
+    async def cached_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
+        """Coordinates from the memory or disk cache, without calling any provider"""
+        key = self._address_key(address)
+        if key in self._cache:
+            return self._cache[key]
+        
+        coords = await asyncio.to_thread(self._read_disk_cache, key)
+        if coords:
+            self._cache[key] = coords
+        return coords
+    
+    async def remember_coordinates(self, address: str, coords: Tuple[float, float]) -> None:
+        """Store coordinates resolved elsewhere (e.g. a batch provider) in both caches"""
+        key = self._address_key(address)
+        self._cache[key] = coords
+        await asyncio.to_thread(self._write_disk_cache, key, coords)
+    
+    async def _lookup_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
         """Get coordinates from address using multiple geocoding services"""
+        tasks = []
         try:
-            # Try Google Maps first
+            # Google is preferred when it answers within the head start
             if self.google_api_key:
-                coords = await self._get_google_coordinates(address)
-                if coords:
-                    return coords
-            
-            # Fallback to OpenStreetMap Nominatim
-            coords = await self._get_nominatim_coordinates(address)
-            return coords
+                tasks.append(asyncio.create_task(self._get_google_coordinates(address)))
+                done, _ = await asyncio.wait(tasks, timeout=GEOCODE_HEDGE_DELAY)
+                if done:
+                    coords = self._task_coordinates(tasks[0])
+                    if coords:
+                        return coords
             
+            # Otherwise race OpenStreetMap Nominatim against it and take the first hit
+            tasks.append(asyncio.create_task(self._get_nominatim_coordinates(address)))
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    coords = self._task_coordinates(task)
+                    if coords:
+                        return coords
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _task_coordinates(task: asyncio.Task) -> Optional[Tuple[float, float]]:
+        """Coordinates from a finished provider task, or None if it failed"""
+        try:
+            return task.result()
         except Exception as e:
             print(f"Geocoding error: {str(e)}")
             return None
     
+    @staticmethod
+    def _address_key(address: str) -> str:
+        """Cache key for an address, ignoring case and repeated whitespace"""
+        normalized = " ".join(address.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    
+    def _connect_disk_cache(self) -> sqlite3.Connection:
+        """Open the persistent geocode cache, creating its table on first use"""
+        conn = sqlite3.connect(GEOCODE_CACHE_PATH, timeout=5.0)
+        if not self._disk_ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode "
+                "(key TEXT PRIMARY KEY, lat REAL NOT NULL, lon REAL NOT NULL, created REAL NOT NULL)"
+            )
+            self._disk_ready = True
+        return conn
+    
+    def _read_disk_cache(self, key: str) -> Optional[Tuple[float, float]]:
+        """Look up unexpired coordinates in the persistent cache"""
+        try:
+            with closing(self._connect_disk_cache()) as conn:
+                row = conn.execute(
+                    "SELECT lat, lon FROM geocode WHERE key = ? AND created > ?",
+                    (key, time.time() - GEOCODE_DISK_TTL)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Geocode cache read error: %s", e)
+            return None
+        return (row[0], row[1]) if row else None
+    
+    def _write_disk_cache(self, key: str, coords: Tuple[float, float]) -> None:
+        """Store coordinates in the persistent cache"""
+        try:
+            with closing(self._connect_disk_cache()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO geocode (key, lat, lon, created) VALUES (?, ?, ?, ?)",
+                    (key, coords[0], coords[1], time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning("Geocode cache write error: %s", e)
+    
     async def _get_google_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
         """Get coordinates using Google Maps API"""
         url = "https://maps.googleapis.com/maps/api/geocode/json"
@@ -41,7 +170,7 @@ class GeocodingService:
             "key": self.google_api_key
         }
         
-        response = requests.get(url, params=params)
+        response = await self._client().get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -65,7 +194,8 @@ class GeocodingService:
             "User-Agent": "ArchiAI-Solution/1.0"
         }
         
-        response = requests.get(url, params=params, headers=headers)
+        async with self._nominatim_limiter:
+            response = await self._client().get(url, params=params, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -0,0 +1,25 @@
+"""
+Logging setup - routes log records through a background queue listener
+"""
+
+import logging
+import logging.handlers
+import queue
+
+
+def configure_queue_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Send root log records through a queue so request handlers never block on stdout"""
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
@@ -0,0 +1,26 @@
+"""
+Occupancy detection - classifies a 2D design into a building-code occupancy type
+"""
+
+from typing import Any, Dict
+
+# Non-residential occupancies, in detection priority order
+OCCUPANCIES = ("office", "retail", "hospital", "school")
+
+
+def detect_occupancy(design_2d: Dict[str, Any]) -> str:
+    """Detect the occupancy type from the design's explicit fields and room names"""
+    occupancy = design_2d.get("occupancy")
+    if occupancy in OCCUPANCIES or occupancy == "residential":
+        return occupancy
+    
+    candidates = [
+        design_2d.get("type"),
+        design_2d.get("design_parameters", {}).get("project_type"),
+        *design_2d.get("rooms", {}).keys()
+    ]
+    text = " ".join(str(candidate).lower() for candidate in candidates if candidate)
+    for occupancy in OCCUPANCIES:
+        if occupancy in text:
+            return occupancy
+    return "residential"
@@ -2,149 +2,435 @@
 3D Surroundings Generator - Creates 3D visualization of surrounding area
 """
 
-import json
+import asyncio
 import math
-from typing import Dict, Any, List, Tuple
+import os
+import random
+from concurrent.futures import Executor
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
+import msgpack
 import numpy as np
+import orjson
+
+# Terrain is a square grid of vertices centred on the site
+TERRAIN_GRID_SIZE = 20
+TERRAIN_SPACING = 0.0001
+
+# Building dimensions are rounded to 10 cm so repeated shapes share cached geometry
+DIMENSION_DECIMALS = 1
+
+# Building vertices are served as JSON, where float32 prints the 0.1 m dimensions exactly;
+# float16 would print longer, rounded literals (37.9 -> 37.90625)
+GEOMETRY_DTYPE = np.float32
+# msgpack ships raw buffers, so building geometry is narrowed to half precision there
+# (within 2 cm for buildings up to 64 m); terrain keeps GEOMETRY_DTYPE for its wider extent
+MSGPACK_GEOMETRY_DTYPE = np.float16
+GEOMETRY_CACHE_SIZE = 1024
+
+# Scenes with at least this many buildings split them evenly across the geometry pool's workers
+GEOMETRY_POOL_WORKERS = int(os.getenv("GEOMETRY_POOL_WORKERS", "2"))
+BUILDING_POOL_THRESHOLD = int(os.getenv("BUILDING_POOL_THRESHOLD", "8"))
+
+# Shared PCG64 generator for all procedural variation
+rng = np.random.default_rng()
+
+# Scene layout as (lat, lon) offsets from the site; each call only translates them
+MAIN_STREET_OFFSETS = np.array([
+    [[-0.001, -0.001], [0.001, 0.001]],
+    [[-0.001, 0.001], [0.001, -0.001]]
+])
+SIDE_STREET_LONS = np.linspace(-0.001, 0.0005, 4)
+SIDE_STREET_OFFSETS = np.stack([
+    np.stack([np.full(4, -0.0005), SIDE_STREET_LONS], axis=-1),
+    np.stack([np.full(4, 0.0005), SIDE_STREET_LONS], axis=-1)
+], axis=1)
+TREE_SPECIES = ["oak", "maple", "pine", "birch"]
+# Trees and street lights run diagonally through the site at even spacing
+TREE_OFFSETS = np.repeat(np.linspace(-0.001, 0.0009, 20)[:, None], 2, axis=1)
+STREET_LIGHT_OFFSETS = np.repeat(np.linspace(-0.001, 0.0008, 10)[:, None], 2, axis=1)
+PARK_OFFSET = np.array([0.0005, 0.0005])
+
+# (name, position offset, target offset, fov); z is absolute height in metres
+CAMERA_VIEWS = [
+    ("Street View", np.array([0, 0, 1.8]), np.array([0.0001, 0.0001, 1.8]), 75),
+    ("Aerial View", np.array([0, 0, 100]), np.array([0, 0, 0]), 60),
+    ("Corner View", np.array([0.0005, 0.0005, 10]), np.array([0, 0, 0]), 70)
+]
+
+# Walls of a unit box, scaled by (width, depth, height); axis 0 follows WALL_FACES
+WALL_FACES = ("front", "back", "left", "right")
+UNIT_WALLS = np.array([
+    [[0, 0, 0], [1, 0, 0], [1, 0, 1], [0, 0, 1]],
+    [[0, 1, 0], [1, 1, 0], [1, 1, 1], [0, 1, 1]],
+    [[0, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1]],
+    [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1]]
+], dtype=GEOMETRY_DTYPE)
+
+# Window layouts as fractions of the facade: (x, z, width, height, spacing, repeat along
+# the facade); patterns without an entry have no modelled windows
+WINDOW_LAYOUTS = {
+    "traditional": (0.0, 0.3, 0.15, 0.3, 0.1, True),
+    "modern": (0.3, 0.2, 0.4, 0.6, 0.0, False),
+    "large": (0.1, 0.1, 0.8, 0.8, 0.0, False)
+}
+
+# Surface properties per material; unknown materials fall back to concrete
+TEXTURE_MAP = {
+    "brick": {"roughness": 0.8, "reflectivity": 0.1, "color": [0.7, 0.4, 0.3]},
+    "concrete": {"roughness": 0.6, "reflectivity": 0.2, "color": [0.8, 0.8, 0.8]},
+    "glass": {"roughness": 0.1, "reflectivity": 0.9, "color": [0.9, 0.9, 1.0]},
+    "steel": {"roughness": 0.3, "reflectivity": 0.7, "color": [0.6, 0.6, 0.6]},
+    "wood": {"roughness": 0.7, "reflectivity": 0.1, "color": [0.6, 0.4, 0.2]},
+    "stucco": {"roughness": 0.5, "reflectivity": 0.3, "color": [0.9, 0.9, 0.8]}
+}
+
+# Intersections do not depend on the site; shared by every scene, treat as read-only
+INTERSECTIONS = [
+    {"type": "main", "position": [0, 0], "size": 20, "traffic_light": True},
+    {"type": "side", "position": [0, 0], "size": 15, "traffic_light": False},
+    {"type": "side", "position": [0, 0], "size": 15, "traffic_light": False}
+]
+
+# Scene sections in response order
+SCENE_SECTIONS = (
+    "terrain", "buildings", "streets", "vegetation", "lighting", "camera_positions", "bounding_box"
+)
+
+# Wire encodings for a finished scene; orjson writes NumPy arrays natively
+SCENE_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _pack_array(array: np.ndarray) -> Dict[str, Any]:
+    """Raw buffer of an array with its dtype and shape"""
+    return {"dtype": array.dtype.str, "shape": list(array.shape), "data": np.ascontiguousarray(array).tobytes()}
+
+def _msgpack_default(obj: Any) -> Any:
+    """Pack arrays as raw buffers with dtype and shape, and dataclasses as maps"""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == GEOMETRY_DTYPE:
+            obj = obj.astype(MSGPACK_GEOMETRY_DTYPE)
+        return _pack_array(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, TerrainMesh):
+        return {"vertices": _pack_array(obj.vertices), "faces": obj.faces, "materials": obj.materials}
+    if is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+def encode_scene(scene: Dict[str, Any], encoding: str = "json") -> bytes:
+    """Serialize a surroundings scene as JSON or msgpack bytes"""
+    if encoding == "msgpack":
+        return msgpack.packb(scene, default=_msgpack_default, use_bin_type=True)
+    return orjson.dumps(scene, option=SCENE_JSON_OPTIONS)
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only so callers cannot mutate the shared copy"""
+    array.flags.writeable = False
+    return array
+
+@lru_cache(maxsize=8)
+def _terrain_faces(n: int) -> np.ndarray:
+    """Triangle indices for an n x n vertex grid, two per cell; shared per resolution, read-only"""
+    v1 = np.arange(n - 1, dtype=np.int32)[:, None] * n + np.arange(n - 1, dtype=np.int32)
+    faces = np.empty((n - 1, n - 1, 6), dtype=np.int32)
+    faces[..., 0] = v1
+    faces[..., 1] = v1 + 1
+    faces[..., 2] = v1 + n
+    faces[..., 3] = v1 + 1
+    faces[..., 4] = v1 + n + 1
+    faces[..., 5] = v1 + n
+    return _frozen(faces.reshape(-1, 3))
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _flat_roof(width: float, depth: float, height: float) -> Dict[str, Any]:
+    """Flat roof at wall height; cached, so the result is shared and read-only"""
+    return {
+        "type": "flat",
+        "vertices": _frozen(np.array([
+            [0, 0, height],
+            [width, 0, height],
+            [width, depth, height],
+            [0, depth, height]
+        ], dtype=GEOMETRY_DTYPE))
+    }
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _pitched_roof(width: float, depth: float, height: float) -> Dict[str, Any]:
+    """Gabled roof rising to a central ridge; cached, so the result is shared and read-only"""
+    ridge_height = height + depth * 0.3
+    return {
+        "type": "pitched",
+        "vertices": _frozen(np.array([
+            [0, 0, height],
+            [width, 0, height],
+            [width/2, depth/2, ridge_height],
+            [0, depth, height]
+        ], dtype=GEOMETRY_DTYPE))
+    }
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _gabled_roof(width: float, depth: float, height: float) -> Dict[str, Any]:
+    """Cross-gabled roof; cached, so the result is shared and read-only"""
+    return {
+        "type": "gabled",
+        "vertices": _frozen(np.array([
+            [0, 0, height],
+            [width, 0, height],
+            [width, depth, height],
+            [0, depth, height],
+            [width/2, depth/2, height + depth * 0.2]
+        ], dtype=GEOMETRY_DTYPE))
+    }
+
+ROOF_BUILDERS = {
+    "flat": _flat_roof,
+    "pitched": _pitched_roof,
+    "gabled": _gabled_roof
+}
+
+@dataclass(slots=True)
+class TerrainMesh:
+    """Terrain as contiguous arrays: (N, 3) float32 vertices and (M, 3) int32 triangles"""
+    vertices: np.ndarray
+    faces: np.ndarray
+    materials: Dict[str, Any]
+
+@dataclass(frozen=True, slots=True)
+class BuildingTemplate:
+    """Size ranges and style options for one building type"""
+    height_range: Tuple[float, float]
+    width_range: Tuple[float, float]
+    depth_range: Tuple[float, float]
+    roof_types: Tuple[str, ...]
+    window_patterns: Tuple[str, ...]
+    materials: Tuple[str, ...]
+
+# Unknown building types use the residential template
+BUILDING_TEMPLATES = {
+    "residential": BuildingTemplate(
+        height_range=(3, 15),
+        width_range=(8, 20),
+        depth_range=(8, 20),
+        roof_types=("pitched", "flat", "gabled"),
+        window_patterns=("traditional", "modern", "large"),
+        materials=("brick", "wood", "stucco", "concrete")
+    ),
+    "commercial": BuildingTemplate(
+        height_range=(10, 50),
+        width_range=(15, 40),
+        depth_range=(15, 40),
+        roof_types=("flat", "modern"),
+        window_patterns=("large", "curtain_wall", "strip"),
+        materials=("glass", "steel", "concrete", "aluminum")
+    ),
+    "industrial": BuildingTemplate(
+        height_range=(8, 25),
+        width_range=(20, 60),
+        depth_range=(20, 60),
+        roof_types=("flat", "sawtooth"),
+        window_patterns=("minimal", "strip"),
+        materials=("steel", "concrete", "metal")
+    ),
+    "institutional": BuildingTemplate(
+        height_range=(5, 30),
+        width_range=(20, 50),
+        depth_range=(20, 50),
+        roof_types=("flat", "pitched", "domed"),
+        window_patterns=("traditional", "large", "strip"),
+        materials=("concrete", "brick", "stone", "glass")
+    )
+}
+
+@dataclass(slots=True)
+class BuildingTable:
+    """Surrounding buildings as columns; row i of every field describes building i"""
+    ids: List[str]
+    types: List[str]
+    styles: List[str]
+    coordinates: List[Dict[str, float]]
+    dimensions: np.ndarray  # (N, 3) float32 width, depth, height
+    roof_types: List[str]
+    window_patterns: List[str]
+    primary_materials: List[str]
+    secondary_materials: List[str]
+    accent_materials: List[str]
+    textures: Dict[str, Any]  # keyed by material name
+    geometry: List[Dict[str, Any]]
+    openings: List[Dict[str, Any]]
+    
+    @classmethod
+    def concat(cls, tables: List["BuildingTable"]) -> "BuildingTable":
+        """Join tables in row order, merging their texture maps"""
+        columns = {}
+        for field in fields(cls):
+            parts = [getattr(table, field.name) for table in tables]
+            if field.name == "dimensions":
+                columns[field.name] = np.concatenate(parts)
+            elif field.name == "textures":
+                columns[field.name] = {name: texture for part in parts for name, texture in part.items()}
+            else:
+                columns[field.name] = [row for part in parts for row in part]
+        return cls(**columns)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+
+def generate_building_models_in_worker(
+    building_data: List[Dict[str, Any]], seed: np.random.SeedSequence
+) -> BuildingTable:
+    """Build one chunk of buildings in a worker process, with its own random stream"""
+    # Pool workers are reused across chunks and requests; seed both generators from this
+    # chunk's sequence so each chunk gets an independent stream
+    global rng
+    rng = np.random.default_rng(seed)
+    random.seed(int(seed.generate_state(1)[0]))
+    return Surroundings3DGenerator()._generate_building_models(building_data)
 
 class Surroundings3DGenerator:
     def __init__(self):
-        self.building_templates = self._load_building_templates()
+        self.building_templates = BUILDING_TEMPLATES
         self.terrain_generator = TerrainGenerator()
         
-    def _load_building_templates(self) -> Dict[str, Any]:
-        """Load 3D building templates for different building types"""
-        return {
-            "residential": {
-                "height_range": (3, 15),
-                "width_range": (8, 20),
-                "depth_range": (8, 20),
-                "roof_types": ["pitched", "flat", "gabled"],
-                "window_patterns": ["traditional", "modern", "large"],
-                "materials": ["brick", "wood", "stucco", "concrete"]
-            },
-            "commercial": {
-                "height_range": (10, 50),
-                "width_range": (15, 40),
-                "depth_range": (15, 40),
-                "roof_types": ["flat", "modern"],
-                "window_patterns": ["large", "curtain_wall", "strip"],
-                "materials": ["glass", "steel", "concrete", "aluminum"]
-            },
-            "industrial": {
-                "height_range": (8, 25),
-                "width_range": (20, 60),
-                "depth_range": (20, 60),
-                "roof_types": ["flat", "sawtooth"],
-                "window_patterns": ["minimal", "strip"],
-                "materials": ["steel", "concrete", "metal"]
-            },
-            "institutional": {
-                "height_range": (5, 30),
-                "width_range": (20, 50),
-                "depth_range": (20, 50),
-                "roof_types": ["flat", "pitched", "domed"],
-                "window_patterns": ["traditional", "large", "strip"],
-                "materials": ["concrete", "brick", "stone", "glass"]
-            }
-        }
-    
     async def generate_3d_surroundings(
         self, 
         coordinates: Tuple[float, float], 
         building_data: List[Dict[str, Any]], 
-        terrain_data: Dict[str, Any]
+        terrain_data: Dict[str, Any],
+        pool: Optional[Executor] = None,
+        include: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
-        """Generate 3D model of surrounding area"""
+        """Generate 3D model of surrounding area, or only the sections named in include"""
+        scene = await self._prepare_scene(coordinates, building_data, terrain_data, pool, include)
         
-        # Generate terrain mesh
-        terrain_mesh = await self.terrain_generator.generate_terrain_mesh(
-            coordinates, terrain_data
-        )
-        
-        # Generate building models
-        building_models = await self._generate_building_models(building_data)
-        
-        # Generate street network
-        street_network = await self._generate_street_network(coordinates, building_data)
-        
-        # Generate vegetation
-        vegetation = await self._generate_vegetation(coordinates, building_data)
-        
-        # Combine all elements
-        surroundings_3d = {
-            "terrain": terrain_mesh,
-            "buildings": building_models,
-            "streets": street_network,
-            "vegetation": vegetation,
-            "lighting": await self._generate_lighting_setup(coordinates),
-            "camera_positions": await self._calculate_camera_positions(coordinates),
-            "bounding_box": await self._calculate_bounding_box(coordinates, building_data)
-        }
-        
-        return surroundings_3d
+        # Pure CPU work; run it off the event loop
+        return await asyncio.to_thread(scene.to_dict, include)
     
-    async def _generate_building_models(self, building_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate 3D models for buildings"""
-        building_models = []
-        
-        for building in building_data:
-            model = await self._create_building_model(building)
-            building_models.append(model)
-        
-        return building_models
+    async def generate_3d_surroundings_bytes(
+        self, 
+        coordinates: Tuple[float, float], 
+        building_data: List[Dict[str, Any]], 
+        terrain_data: Dict[str, Any],
+        encoding: str = "json",
+        pool: Optional[Executor] = None,
+        include: Optional[Set[str]] = None
+    ) -> bytes:
+        """Generate the 3D model already encoded as JSON or msgpack, without list conversion"""
+        scene = await self._prepare_scene(coordinates, building_data, terrain_data, pool, include)
+        return await asyncio.to_thread(lambda: encode_scene(scene.to_dict(include), encoding))
     
-    async def _create_building_model(self, building: Dict[str, Any]) -> Dict[str, Any]:
-        """Create 3D model for a single building"""
-        building_type = building.get("type", "residential")
-        template = self.building_templates.get(building_type, self.building_templates["residential"])
-        
-        # Generate building dimensions
-        height = np.random.uniform(*template["height_range"])
-        width = np.random.uniform(*template["width_range"])
-        depth = np.random.uniform(*template["depth_range"])
-        
-        # Generate building geometry
-        geometry = await self._generate_building_geometry(
-            width, depth, height, template
+    def build_scene(
+        self, 
+        coordinates: Tuple[float, float], 
+        building_data: List[Dict[str, Any]], 
+        terrain_data: Dict[str, Any]
+    ) -> "SurroundingsScene":
+        """Lazy surroundings model; each section is generated on first access"""
+        return SurroundingsScene(self, coordinates, building_data, terrain_data)
+    
+    async def _prepare_scene(
+        self, 
+        coordinates: Tuple[float, float], 
+        building_data: List[Dict[str, Any]], 
+        terrain_data: Dict[str, Any],
+        pool: Optional[Executor],
+        include: Optional[Set[str]]
+    ) -> "SurroundingsScene":
+        """Lazy scene, with its buildings pre-built on the process pool for large requested sets"""
+        scene = self.build_scene(coordinates, building_data, terrain_data)
+        wants_buildings = include is None or "buildings" in include
+        if pool is not None and wants_buildings and len(building_data) >= BUILDING_POOL_THRESHOLD:
+            scene.buildings = await self._generate_building_models_in_pool(building_data, pool)
+        return scene
+    
+    async def _generate_building_models_in_pool(
+        self, building_data: List[Dict[str, Any]], pool: Executor
+    ) -> BuildingTable:
+        """Generate building models in parallel chunks on a process pool"""
+        loop = asyncio.get_running_loop()
+        bounds = np.linspace(0, len(building_data), GEOMETRY_POOL_WORKERS + 1).astype(np.int64).tolist()
+        chunks = [building_data[start:stop] for start, stop in zip(bounds, bounds[1:]) if stop > start]
+        seeds = np.random.SeedSequence(int(rng.integers(2**63))).spawn(len(chunks))
+        tables = await asyncio.gather(*[
+            loop.run_in_executor(pool, generate_building_models_in_worker, chunk, seed)
+            for chunk, seed in zip(chunks, seeds)
+        ])
+        return BuildingTable.concat(tables)
+    
+    def _generate_building_models(self, building_data: List[Dict[str, Any]]) -> BuildingTable:
+        """Generate 3D models for buildings as one column table"""
+        count = len(building_data)
+        table = BuildingTable(
+            ids=[building.get("id", "unknown") for building in building_data],
+            types=[building.get("type", "residential") for building in building_data],
+            styles=[building.get("style", "modern") for building in building_data],
+            coordinates=[building.get("coordinates", {}) for building in building_data],
+            dimensions=np.empty((count, 3), dtype=np.float32),
+            roof_types=[None] * count,
+            window_patterns=[None] * count,
+            primary_materials=[None] * count,
+            secondary_materials=[None] * count,
+            accent_materials=[None] * count,
+            textures={},
+            geometry=[None] * count,
+            openings=[None] * count
         )
         
-        # Generate materials and textures
-        materials = await self._generate_building_materials(template)
+        # Group buildings by type so each template's random draws happen in one batch
+        buckets: Dict[str, List[int]] = {}
+        for index, building_type in enumerate(table.types):
+            buckets.setdefault(building_type, []).append(index)
         
-        # Generate windows and doors
-        openings = await self._generate_building_openings(width, depth, height, template)
-        
-        return {
-            "id": building.get("id", "unknown"),
-            "type": building_type,
-            "coordinates": building.get("coordinates", {}),
-            "dimensions": {"width": width, "depth": depth, "height": height},
-            "geometry": geometry,
-            "materials": materials,
-            "openings": openings,
-            "style": building.get("style", "modern")
-        }
+        for building_type, indices in buckets.items():
+            template = self.building_templates.get(building_type, self.building_templates["residential"])
+            size = len(indices)
+            
+            # Height, width and depth for the whole bucket as one (size, 3) draw
+            ranges = np.array([template.height_range, template.width_range, template.depth_range])
+            dimensions = np.round(
+                rng.uniform(ranges[:, 0], ranges[:, 1], size=(size, 3)), DIMENSION_DECIMALS
+            ).tolist()
+            roof_types = rng.choice(template.roof_types, size=size).tolist()
+            window_patterns = rng.choice(template.window_patterns, size=size).tolist()
+            
+            for k, index in enumerate(indices):
+                height, width, depth = dimensions[k]
+                table.dimensions[index] = (width, depth, height)
+                table.roof_types[index] = roof_types[k]
+                table.window_patterns[index] = window_patterns[k]
+                (
+                    table.primary_materials[index],
+                    table.secondary_materials[index],
+                    table.accent_materials[index]
+                ) = self._generate_building_materials(template)
+                table.geometry[index] = self._generate_building_geometry(width, depth, height, roof_types[k])
+                table.openings[index] = self._generate_building_openings(width, depth, height, window_patterns[k])
+        
+        # One texture entry per material in use, shared by every building
+        table.textures = self._generate_material_textures(
+            tuple(sorted({*table.primary_materials, *table.secondary_materials, *table.accent_materials}))
+        )
+        return table
     
-    async def _generate_building_geometry(
-        self, width: float, depth: float, height: float, template: Dict[str, Any]
+    def _generate_building_geometry(
+        self, width: float, depth: float, height: float, roof_type: str
     ) -> Dict[str, Any]:
         """Generate 3D geometry for building"""
         
         # Generate base shape
-        base_vertices = [
+        base_vertices = np.array([
             [0, 0, 0],
             [width, 0, 0],
             [width, depth, 0],
             [0, depth, 0]
-        ]
+        ], dtype=GEOMETRY_DTYPE)
         
         # Generate roof
-        roof_type = np.random.choice(template["roof_types"])
-        roof_geometry = await self._generate_roof_geometry(width, depth, height, roof_type)
+        roof_geometry = self._generate_roof_geometry(width, depth, height, roof_type)
         
         # Generate walls
-        wall_geometry = await self._generate_wall_geometry(width, depth, height)
+        wall_geometry = self._generate_wall_geometry(width, depth, height)
         
         return {
             "base": base_vertices,
@@ -153,124 +439,46 @@ class Surroundings3DGenerator:
             "roof_type": roof_type
         }
     
-    async def _generate_roof_geometry(
-        self, width: float, depth: float, height: float, roof_type: str
-    ) -> Dict[str, Any]:
-        """Generate roof geometry based on type"""
-        
-        if roof_type == "flat":
-            return {
-                "type": "flat",
-                "vertices": [
-                    [0, 0, height],
-                    [width, 0, height],
-                    [width, depth, height],
-                    [0, depth, height]
-                ]
-            }
-        elif roof_type == "pitched":
-            # Gabled roof
-            ridge_height = height + depth * 0.3
-            return {
-                "type": "pitched",
-                "vertices": [
-                    [0, 0, height],
-                    [width, 0, height],
-                    [width/2, depth/2, ridge_height],
-                    [0, depth, height]
-                ]
-            }
-        elif roof_type == "gabled":
-            # Cross-gabled roof
-            return {
-                "type": "gabled",
-                "vertices": [
-                    [0, 0, height],
-                    [width, 0, height],
-                    [width, depth, height],
-                    [0, depth, height],
-                    [width/2, depth/2, height + depth * 0.2]
-                ]
-            }
-        else:
-            return await self._generate_roof_geometry(width, depth, height, "flat")
+    @staticmethod
+    def _generate_roof_geometry(width: float, depth: float, height: float, roof_type: str) -> Dict[str, Any]:
+        """Generate roof geometry based on type; unknown types get a flat roof"""
+        return ROOF_BUILDERS.get(roof_type, _flat_roof)(width, depth, height)
     
-    async def _generate_wall_geometry(
-        self, width: float, depth: float, height: float
-    ) -> List[Dict[str, Any]]:
-        """Generate wall geometry"""
-        walls = []
-        
-        # Front wall
-        walls.append({
-            "face": "front",
-            "vertices": [
-                [0, 0, 0], [width, 0, 0], [width, 0, height], [0, 0, height]
-            ]
-        })
-        
-        # Back wall
-        walls.append({
-            "face": "back",
-            "vertices": [
-                [0, depth, 0], [width, depth, 0], [width, depth, height], [0, depth, height]
-            ]
-        })
-        
-        # Left wall
-        walls.append({
-            "face": "left",
-            "vertices": [
-                [0, 0, 0], [0, depth, 0], [0, depth, height], [0, 0, height]
-            ]
-        })
-        
-        # Right wall
-        walls.append({
-            "face": "right",
-            "vertices": [
-                [width, 0, 0], [width, depth, 0], [width, depth, height], [width, 0, height]
-            ]
-        })
-        
-        return walls
-    
-    async def _generate_building_materials(self, template: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate materials for building"""
-        materials = template.get("materials", ["concrete"])
-        selected_materials = np.random.choice(materials, size=min(3, len(materials)), replace=False)
-        
+    @staticmethod
+    @lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+    def _generate_wall_geometry(width: float, depth: float, height: float) -> Dict[str, Any]:
+        """Generate wall geometry as one (4, 4, 3) array; cached, so the result is shared and read-only"""
         return {
-            "primary": selected_materials[0],
-            "secondary": selected_materials[1] if len(selected_materials) > 1 else selected_materials[0],
-            "accent": selected_materials[2] if len(selected_materials) > 2 else selected_materials[0],
-            "textures": await self._generate_material_textures(selected_materials)
+            "faces": WALL_FACES,
+            "vertices": _frozen((UNIT_WALLS * np.array([width, depth, height])).astype(GEOMETRY_DTYPE))
         }
     
-    async def _generate_material_textures(self, materials: List[str]) -> Dict[str, Any]:
-        """Generate texture information for materials"""
-        texture_map = {
-            "brick": {"roughness": 0.8, "reflectivity": 0.1, "color": [0.7, 0.4, 0.3]},
-            "concrete": {"roughness": 0.6, "reflectivity": 0.2, "color": [0.8, 0.8, 0.8]},
-            "glass": {"roughness": 0.1, "reflectivity": 0.9, "color": [0.9, 0.9, 1.0]},
-            "steel": {"roughness": 0.3, "reflectivity": 0.7, "color": [0.6, 0.6, 0.6]},
-            "wood": {"roughness": 0.7, "reflectivity": 0.1, "color": [0.6, 0.4, 0.2]},
-            "stucco": {"roughness": 0.5, "reflectivity": 0.3, "color": [0.9, 0.9, 0.8]}
-        }
-        
-        return {material: texture_map.get(material, texture_map["concrete"]) for material in materials}
+    def _generate_building_materials(self, template: BuildingTemplate) -> Tuple[str, str, str]:
+        """Pick primary, secondary and accent materials for a building"""
+        materials = template.materials
+        selected_materials = random.sample(materials, k=min(3, len(materials)))
+        
+        return (
+            selected_materials[0],
+            selected_materials[1] if len(selected_materials) > 1 else selected_materials[0],
+            selected_materials[2] if len(selected_materials) > 2 else selected_materials[0]
+        )
     
-    async def _generate_building_openings(
-        self, width: float, depth: float, height: float, template: Dict[str, Any]
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _generate_material_textures(materials: Tuple[str, ...]) -> Dict[str, Any]:
+        """Generate texture information for materials; cached, so the result is shared and read-only"""
+        return {material: TEXTURE_MAP.get(material, TEXTURE_MAP["concrete"]) for material in materials}
+    
+    def _generate_building_openings(
+        self, width: float, depth: float, height: float, window_pattern: str
     ) -> Dict[str, Any]:
         """Generate windows and doors for building"""
-        window_pattern = np.random.choice(template["window_patterns"])
-        
         # Generate windows
-        windows = await self._generate_windows(width, depth, height, window_pattern)
+        windows = self._generate_windows(width, depth, height, window_pattern)
         
         # Generate doors
-        doors = await self._generate_doors(width, depth, height)
+        doors = self._generate_doors(width, depth, height)
         
         return {
             "windows": windows,
@@ -278,53 +486,32 @@ class Surroundings3DGenerator:
             "pattern": window_pattern
         }
     
-    async def _generate_windows(
+    def _generate_windows(
         self, width: float, depth: float, height: float, pattern: str
     ) -> List[Dict[str, Any]]:
         """Generate window openings"""
-        windows = []
+        layout = WINDOW_LAYOUTS.get(pattern)
+        if layout is None:
+            return []
         
-        if pattern == "traditional":
-            # Traditional windows
-            window_width = width * 0.15
-            window_height = height * 0.3
-            spacing = width * 0.1
-            
-            for i in range(int(width / (window_width + spacing))):
-                windows.append({
-                    "type": "window",
-                    "position": [i * (window_width + spacing), 0, height * 0.3],
-                    "size": [window_width, window_height],
-                    "style": "traditional"
-                })
-        
-        elif pattern == "modern":
-            # Modern large windows
-            window_width = width * 0.4
-            window_height = height * 0.6
-            
-            windows.append({
-                "type": "window",
-                "position": [width * 0.3, 0, height * 0.2],
-                "size": [window_width, window_height],
-                "style": "modern"
-            })
+        x_frac, z_frac, width_frac, height_frac, spacing_frac, repeat = layout
+        window_width = width * width_frac
+        window_height = height * height_frac
+        step = window_width + width * spacing_frac
+        count = int(width / step) if repeat else 1
         
-        elif pattern == "large":
-            # Large windows
-            window_width = width * 0.8
-            window_height = height * 0.8
-            
-            windows.append({
+        xs = (width * x_frac + np.arange(count) * step).tolist()
+        return [
+            {
                 "type": "window",
-                "position": [width * 0.1, 0, height * 0.1],
+                "position": [x, 0, height * z_frac],
                 "size": [window_width, window_height],
-                "style": "large"
-            })
-        
-        return windows
+                "style": pattern
+            }
+            for x in xs
+        ]
     
-    async def _generate_doors(self, width: float, depth: float, height: float) -> List[Dict[str, Any]]:
+    def _generate_doors(self, width: float, depth: float, height: float) -> List[Dict[str, Any]]:
         """Generate door openings"""
         door_width = width * 0.2
         door_height = height * 0.8
@@ -336,87 +523,52 @@ class Surroundings3DGenerator:
             "style": "standard"
         }]
     
-    async def _generate_street_network(
+    def _generate_street_network(
         self, coordinates: Tuple[float, float], building_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate street network"""
-        lat, lon = coordinates
+        site = np.array(coordinates)
         
         # Generate main streets
         main_streets = [
-            {
-                "type": "main",
-                "start": [lat - 0.001, lon - 0.001],
-                "end": [lat + 0.001, lon + 0.001],
-                "width": 12
-            },
-            {
-                "type": "main",
-                "start": [lat - 0.001, lon + 0.001],
-                "end": [lat + 0.001, lon - 0.001],
-                "width": 12
-            }
+            {"type": "main", "start": start, "end": end, "width": 12}
+            for start, end in (MAIN_STREET_OFFSETS + site).tolist()
         ]
         
         # Generate side streets
-        side_streets = []
-        for i in range(4):
-            side_streets.append({
-                "type": "side",
-                "start": [lat - 0.0005, lon - 0.001 + i * 0.0005],
-                "end": [lat + 0.0005, lon - 0.001 + i * 0.0005],
-                "width": 8
-            })
+        side_streets = [
+            {"type": "side", "start": start, "end": end, "width": 8}
+            for start, end in (SIDE_STREET_OFFSETS + site).tolist()
+        ]
         
         return {
             "main_streets": main_streets,
             "side_streets": side_streets,
-            "intersections": await self._generate_intersections(main_streets, side_streets)
+            "intersections": self._generate_intersections(main_streets, side_streets)
         }
     
-    async def _generate_intersections(
+    def _generate_intersections(
         self, main_streets: List[Dict[str, Any]], side_streets: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Generate street intersections"""
-        intersections = []
-        
-        # Main intersection
-        intersections.append({
-            "type": "main",
-            "position": [0, 0],
-            "size": 20,
-            "traffic_light": True
-        })
-        
-        # Side intersections
-        for i in range(2):
-            intersections.append({
-                "type": "side",
-                "position": [0, 0],
-                "size": 15,
-                "traffic_light": False
-            })
-        
-        return intersections
+        """Generate street intersections (the shared INTERSECTIONS list, not a copy)"""
+        return INTERSECTIONS
     
-    async def _generate_vegetation(
+    def _generate_vegetation(
         self, coordinates: Tuple[float, float], building_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate vegetation elements"""
         lat, lon = coordinates
         
-        # Generate trees
-        trees = []
-        for i in range(20):
-            trees.append({
-                "type": "tree",
-                "position": [
-                    lat + (i - 10) * 0.0001,
-                    lon + (i - 10) * 0.0001
-                ],
-                "size": np.random.uniform(2, 8),
-                "species": np.random.choice(["oak", "maple", "pine", "birch"])
-            })
+        # Generate trees, drawing every size and species in one call each
+        count = len(TREE_OFFSETS)
+        trees = [
+            {"type": "tree", "position": position, "size": size, "species": species}
+            for position, size, species in zip(
+                (TREE_OFFSETS + np.array(coordinates)).tolist(),
+                rng.uniform(2, 8, size=count).tolist(),
+                rng.choice(TREE_SPECIES, size=count).tolist()
+            )
+        ]
         
         # Generate grass areas
         grass_areas = [
@@ -431,82 +583,70 @@ class Surroundings3DGenerator:
         return {
             "trees": trees,
             "grass_areas": grass_areas,
-            "parks": await self._generate_parks(coordinates)
+            "parks": self._generate_parks(coordinates)
         }
     
-    async def _generate_parks(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
+    def _generate_parks(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
         """Generate park areas"""
-        lat, lon = coordinates
-        
         return [
             {
                 "type": "park",
-                "position": [lat + 0.0005, lon + 0.0005],
+                "position": (PARK_OFFSET + np.array(coordinates)).tolist(),
                 "size": [50, 50],
                 "features": ["playground", "benches", "trees"]
             }
         ]
     
-    async def _generate_lighting_setup(self, coordinates: Tuple[float, float]) -> Dict[str, Any]:
+    def _generate_lighting_setup(self, coordinates: Tuple[float, float]) -> Dict[str, Any]:
         """Generate lighting setup for 3D scene"""
         return {
             "sun_position": [45, 30],  # Azimuth, elevation
             "ambient_light": 0.3,
             "directional_light": 0.7,
-            "street_lights": await self._generate_street_lights(coordinates)
+            "street_lights": self._generate_street_lights(coordinates)
         }
     
-    async def _generate_street_lights(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
+    def _generate_street_lights(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
         """Generate street lighting"""
-        lat, lon = coordinates
-        lights = []
-        
-        for i in range(10):
-            lights.append({
-                "position": [lat + (i - 5) * 0.0002, lon + (i - 5) * 0.0002],
+        return [
+            {
+                "position": position,
                 "height": 6,
                 "intensity": 1000,
                 "color": [1.0, 0.9, 0.8]
-            })
-        
-        return lights
+            }
+            for position in (STREET_LIGHT_OFFSETS + np.array(coordinates)).tolist()
+        ]
     
-    async def _calculate_camera_positions(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
+    def _calculate_camera_positions(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
         """Calculate optimal camera positions for 3D viewing"""
-        lat, lon = coordinates
+        site = np.array([*coordinates, 0])
         
         return [
             {
-                "name": "Street View",
-                "position": [lat, lon, 1.8],
-                "target": [lat + 0.0001, lon + 0.0001, 1.8],
-                "fov": 75
-            },
-            {
-                "name": "Aerial View",
-                "position": [lat, lon, 100],
-                "target": [lat, lon, 0],
-                "fov": 60
-            },
-            {
-                "name": "Corner View",
-                "position": [lat + 0.0005, lon + 0.0005, 10],
-                "target": [lat, lon, 0],
-                "fov": 70
+                "name": name,
+                "position": (position + site).tolist(),
+                "target": (target + site).tolist(),
+                "fov": fov
             }
+            for name, position, target, fov in CAMERA_VIEWS
         ]
     
-    async def _calculate_bounding_box(
+    def _calculate_bounding_box(
         self, coordinates: Tuple[float, float], building_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Calculate bounding box for 3D scene"""
         lat, lon = coordinates
         
-        # Calculate bounds based on buildings
-        min_lat = min([b.get("coordinates", {}).get("lat", lat) for b in building_data] + [lat])
-        max_lat = max([b.get("coordinates", {}).get("lat", lat) for b in building_data] + [lat])
-        min_lon = min([b.get("coordinates", {}).get("lon", lon) for b in building_data] + [lon])
-        max_lon = max([b.get("coordinates", {}).get("lon", lon) for b in building_data] + [lon])
+        # Calculate bounds based on buildings, with the site itself as the first row
+        points = np.array(
+            [(lat, lon)] + [
+                (b.get("coordinates", {}).get("lat", lat), b.get("coordinates", {}).get("lon", lon))
+                for b in building_data
+            ],
+            dtype=np.float64
+        )
+        (min_lat, min_lon), (max_lat, max_lon) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
         
         return {
             "min": [min_lat, min_lon, 0],
@@ -515,45 +655,89 @@ class Surroundings3DGenerator:
             "size": [max_lat - min_lat, max_lon - min_lon, 100]
         }
 
+class SurroundingsScene:
+    """Surroundings model whose sections are generated on first access and then kept"""
+    
+    def __init__(
+        self,
+        generator: Surroundings3DGenerator,
+        coordinates: Tuple[float, float],
+        building_data: List[Dict[str, Any]],
+        terrain_data: Dict[str, Any]
+    ):
+        self._generator = generator
+        self._coordinates = coordinates
+        self._building_data = building_data
+        self._terrain_data = terrain_data
+    
+    @cached_property
+    def terrain(self) -> TerrainMesh:
+        """Terrain mesh"""
+        return self._generator.terrain_generator.generate_terrain_mesh(self._coordinates, self._terrain_data)
+    
+    @cached_property
+    def buildings(self) -> BuildingTable:
+        """Building models as a column table"""
+        return self._generator._generate_building_models(self._building_data)
+    
+    @cached_property
+    def streets(self) -> Dict[str, Any]:
+        """Street network"""
+        return self._generator._generate_street_network(self._coordinates, self._building_data)
+    
+    @cached_property
+    def vegetation(self) -> Dict[str, Any]:
+        """Trees, grass and parks"""
+        return self._generator._generate_vegetation(self._coordinates, self._building_data)
+    
+    @cached_property
+    def lighting(self) -> Dict[str, Any]:
+        """Sun, ambient and street lighting"""
+        return self._generator._generate_lighting_setup(self._coordinates)
+    
+    @cached_property
+    def camera_positions(self) -> List[Dict[str, Any]]:
+        """Preset camera views"""
+        return self._generator._calculate_camera_positions(self._coordinates)
+    
+    @cached_property
+    def bounding_box(self) -> Dict[str, Any]:
+        """Scene bounds"""
+        return self._generator._calculate_bounding_box(self._coordinates, self._building_data)
+    
+    def to_dict(self, include: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Materialize the requested sections (all by default) as a plain dict"""
+        return {name: getattr(self, name) for name in SCENE_SECTIONS if include is None or name in include}
+
 class TerrainGenerator:
     def __init__(self):
         pass
     
-    async def generate_terrain_mesh(
+    def generate_terrain_mesh(
         self, coordinates: Tuple[float, float], terrain_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> TerrainMesh:
         """Generate terrain mesh"""
         lat, lon = coordinates
         elevation = terrain_data.get("elevation", 100)
         slope = terrain_data.get("slope", 0.05)
         
-        # Generate terrain vertices
-        vertices = []
-        for i in range(20):
-            for j in range(20):
-                x = (i - 10) * 0.0001
-                z = (j - 10) * 0.0001
-                y = elevation + x * slope * 1000 + z * slope * 1000
-                vertices.append([x, y, z])
-        
-        # Generate faces
-        faces = []
-        for i in range(19):
-            for j in range(19):
-                v1 = i * 20 + j
-                v2 = v1 + 1
-                v3 = v1 + 20
-                v4 = v3 + 1
-                
-                faces.append([v1, v2, v3])
-                faces.append([v2, v4, v3])
-        
-        return {
-            "vertices": vertices,
-            "faces": faces,
-            "materials": {
+        n = TERRAIN_GRID_SIZE
+        
+        # Generate terrain vertices, row-major over the (i, j) grid, straight into
+        # a preallocated float32 buffer; x varies along rows, z along columns
+        offsets = (np.arange(n) - n // 2) * TERRAIN_SPACING
+        vertices = np.empty((n, n, 3), dtype=np.float32)
+        vertices[..., 0] = offsets[:, None]
+        vertices[..., 1] = elevation + offsets[:, None] * slope * 1000 + offsets[None, :] * slope * 1000
+        vertices[..., 2] = offsets[None, :]
+        vertices = vertices.reshape(-1, 3)
+        
+        return TerrainMesh(
+            vertices=vertices,
+            faces=_terrain_faces(n),
+            materials={
                 "type": "terrain",
                 "texture": "grass",
                 "color": [0.3, 0.6, 0.3]
             }
-        }
+        )
@@ -5,6 +5,7 @@ AI-powered architectural design system
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
@@ -25,6 +26,7 @@ try:
     from backend.services.cost_service import CostService
     from backend.models.database import init_db
     from backend.models.schemas import *
+    from backend.utils.logging_setup import configure_queue_logging
 except ImportError:
     # Fallback for Vercel deployment
     from services.climate_service import ClimateService
@@ -34,6 +36,11 @@ except ImportError:
     from services.cost_service import CostService
     from models.database import init_db
     from models.schemas import *
+    from utils.logging_setup import configure_queue_logging
+
+# The services resolve geocoding as the top-level utils package in both layouts,
+# so import the same module to get their shared client
+from utils.geocoding import geocoding_service
 
 app = FastAPI(
     title="ArchiAI Solution",
@@ -57,6 +64,9 @@ design_service = DesignService()
 export_service = ExportService()
 cost_service = CostService()
 
+# Logging goes through a background queue listener
+log_listener = configure_queue_logging()
+
 # Initialize database
 @app.on_event("startup")
 async def startup_event():
@@ -65,6 +75,12 @@ async def startup_event():
     except Exception as e:
         print(f"Database initialization failed: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await location_service.aclose()
+    await geocoding_service.aclose()
+    log_listener.stop()
+
 # Mount static files
 try:
     app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -84,17 +100,22 @@ async def analyze_location(location: LocationRequest):
         # Get climate data
         climate_data = await climate_service.get_climate_data(location.address)
         
+        # Reuse the climate lookup's coordinates instead of geocoding again
+        coords = climate_data.get("coordinates")
+        coordinates = (coords["lat"], coords["lon"]) if coords else None
+        
         # Get architectural style
         architectural_style = await location_service.detect_architectural_style(
-            location.address, location.postal_code
+            location.address, location.postal_code, coordinates
         )
         
         # Get 3D surroundings
         surroundings_3d = await location_service.get_3d_surroundings(
-            location.address, location.postal_code
+            location.address, location.postal_code, coordinates
         )
         
-        return {
+        # Serialize directly with orjson; the 3D model carries NumPy geometry arrays
+        return ORJSONResponse({
             "climate": climate_data,
             "architectural_style": architectural_style,
             "surroundings_3d": surroundings_3d,
@@ -103,7 +124,7 @@ async def analyze_location(location: LocationRequest):
                 "postal_code": location.postal_code,
                 "coordinates": climate_data.get("coordinates")
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -146,13 +167,14 @@ async def generate_design(design_request: DesignRequest):
         # Generate MEP design
         mep_design = await design_service.generate_mep_design(design_request)
         
-        return {
+        # Serialize directly with orjson; MEP records are dataclasses and may carry NumPy values
+        return ORJSONResponse({
             "design_2d": design_2d,
             "design_3d": design_3d,
             "structural": structural_design,
             "mep": mep_design,
             "project_id": design_request.project_id
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 